@@ -0,0 +1,82 @@
+"""data - Datasets for use in benchmarks."""
+# Copyright © 2026-2026  James Rowe <jnrowe@gmail.com>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# This file is part of pyisbn.
+#
+# pyisbn is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# pyisbn is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# pyisbn.  If not, see <http://www.gnu.org/licenses/>.
+
+import random
+from functools import cache
+from itertools import islice
+from typing import Literal
+
+from pyisbn import generate
+from tests.data import TEST_BOOKS
+
+#: Hyphenated ISBNs, as they appear in the sample book data
+BOOKS = list(TEST_BOOKS.values())
+#: Number of rows in synthetic corpora
+CORPUS_SIZE = 1_000_000
+
+
+def _noisy(size: int) -> list[str]:
+    """Generate ISBNs as they arrive in a data feed.
+
+    Args:
+        size: Number of ISBNs to generate
+
+    Returns:
+        Sample book ISBNs, of which a tenth have their hyphens removed and a
+        tenth have a mistyped digit
+
+    """
+    # Seeded, so every run benchmarks the same data
+    rng = random.Random(size)  # NoQA: S311
+    result = []
+    for isbn in rng.choices(BOOKS, k=size):
+        match rng.randrange(10):
+            case 0:
+                result.append(isbn.replace("-", ""))
+            case 1:
+                digit = str((int(isbn[0]) + 1) % 10)
+                result.append(digit + isbn[1:])
+            case _:
+                result.append(isbn)
+    return result
+
+
+@cache
+def corpus(
+    kind: Literal["isbn10", "isbn13", "noisy"], size: int = CORPUS_SIZE
+) -> list[str]:
+    """Generate a synthetic corpus.
+
+    Corpora are cached, as generating a million rows takes around a second.
+
+    Args:
+        kind: Valid ISBN-10s, valid ISBN-13s, or noisy hyphenated ISBNs
+        size: Number of ISBNs to generate
+
+    Returns:
+        ISBNs
+
+    """
+    match kind:
+        case "isbn10":
+            return list(islice(generate.range("0"), size))
+        case "isbn13":
+            return list(islice(generate.range("978-1"), size))
+        case "noisy":
+            return _noisy(size)
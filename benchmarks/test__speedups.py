@@ -0,0 +1,88 @@
+"""test__speedups - Benchmark compiled accelerator."""
+# Copyright © 2026-2026  James Rowe <jnrowe@gmail.com>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# This file is part of pyisbn.
+#
+# pyisbn is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# pyisbn is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# pyisbn.  If not, see <http://www.gnu.org/licenses/>.
+
+import importlib.util
+import sys
+from types import ModuleType
+from unittest import mock
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from benchmarks.data import BOOKS, corpus
+
+speedups = pytest.importorskip("pyisbn._speedups")
+
+
+def _pure(name: str) -> ModuleType:
+    """Load a separate copy of a module without the accelerator.
+
+    Args:
+        name: Module to load
+
+    Returns:
+        Module using pure-Python implementations
+
+    Raises:
+        ModuleNotFoundError: ``name`` can't be found
+
+    """
+    spec = importlib.util.find_spec(name)
+    if not (spec and spec.loader):
+        raise ModuleNotFoundError(name)
+    module = importlib.util.module_from_spec(spec)
+    with mock.patch.dict(sys.modules, {"pyisbn._speedups": None}):
+        spec.loader.exec_module(module)
+    return module
+
+
+func = _pure("pyisbn.func")
+batch = _pure("pyisbn.batch")
+
+
+@pytest.mark.benchmark(group="speedups-validate")
+@pytest.mark.parametrize("implementation", ["pure", "compiled"])
+def test_validate(benchmark: BenchmarkFixture, implementation: str):
+    """Benchmark validating hyphenated ISBNs one at a time."""
+    validate = func.validate if implementation == "pure" else speedups.validate
+    benchmark(lambda: [validate(s) for s in BOOKS])
+
+
+@pytest.mark.benchmark(group="speedups-validate_many")
+@pytest.mark.parametrize("implementation", ["pure", "compiled"])
+def test_validate_many(benchmark: BenchmarkFixture, implementation: str):
+    """Benchmark validating a noisy corpus in bulk."""
+    validate_many = (
+        batch.validate_many
+        if implementation == "pure"
+        else speedups.validate_many
+    )
+    benchmark(validate_many, corpus("noisy"))
+
+
+@pytest.mark.benchmark(group="speedups-convert_many")
+@pytest.mark.parametrize("implementation", ["pure", "compiled"])
+def test_convert_many(benchmark: BenchmarkFixture, implementation: str):
+    """Benchmark converting a corpus in bulk."""
+    convert_many = (
+        batch.convert_many
+        if implementation == "pure"
+        else speedups.convert_many
+    )
+    benchmark(convert_many, corpus("isbn13"))
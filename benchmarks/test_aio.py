@@ -0,0 +1,60 @@
+"""test_aio - Benchmark asyncio interface."""
+# Copyright © 2026-2026  James Rowe <jnrowe@gmail.com>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# This file is part of pyisbn.
+#
+# pyisbn is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# pyisbn is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# pyisbn.  If not, see <http://www.gnu.org/licenses/>.
+
+import asyncio
+from collections.abc import AsyncIterator
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from pyisbn.aio import validate_stream
+from pyisbn.batch import iter_validate
+from tests.data import TEST_BOOKS
+
+ISBNS = list(TEST_BOOKS.values()) * 100
+
+
+async def _aiter() -> AsyncIterator[str]:  # NoQA: RUF029
+    for isbn in ISBNS:
+        yield isbn
+
+
+async def _per_item() -> list[bool]:
+    results = []
+    async for isbn in _aiter():
+        results.extend(iter_validate([isbn.strip()]))
+        await asyncio.sleep(0)
+    return results
+
+
+async def _chunked(chunk_size: int) -> list[bool]:
+    return [r async for r in validate_stream(_aiter(), chunk_size=chunk_size)]
+
+
+@pytest.mark.benchmark(group="aio-validate")
+def test_per_item(benchmark: BenchmarkFixture):
+    """Benchmark validating ISBNs, yielding to the loop after each."""
+    benchmark(lambda: asyncio.run(_per_item()))
+
+
+@pytest.mark.benchmark(group="aio-validate")
+@pytest.mark.parametrize("chunk_size", [16, 256, 4096])
+def test_validate_stream(benchmark: BenchmarkFixture, chunk_size: int):
+    """Benchmark validating ISBNs in chunks."""
+    benchmark(lambda: asyncio.run(_chunked(chunk_size)))
@@ -0,0 +1,40 @@
+"""test_batch - Benchmark batch interface."""
+# Copyright © 2026-2026  James Rowe <jnrowe@gmail.com>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# This file is part of pyisbn.
+#
+# pyisbn is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# pyisbn is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# pyisbn.  If not, see <http://www.gnu.org/licenses/>.
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from pyisbn import validate
+from pyisbn.batch import validate_many
+from tests.data import TEST_BOOKS
+
+#: Hyphenated ISBNs, as they appear in the sample book data
+ISBNS = list(TEST_BOOKS.values()) * 100
+
+
+@pytest.mark.benchmark(group="validate-books")
+def test_validate(benchmark: BenchmarkFixture):
+    """Benchmark validating ISBNs one at a time."""
+    benchmark(lambda: [validate(s) for s in ISBNS])
+
+
+@pytest.mark.benchmark(group="validate-books")
+def test_validate_many(benchmark: BenchmarkFixture):
+    """Benchmark validating ISBNs in bulk."""
+    benchmark(validate_many, ISBNS)
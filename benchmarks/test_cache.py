@@ -0,0 +1,41 @@
+"""test_cache - Benchmark interning cache."""
+# Copyright © 2026-2026  James Rowe <jnrowe@gmail.com>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# This file is part of pyisbn.
+#
+# pyisbn is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# pyisbn is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# pyisbn.  If not, see <http://www.gnu.org/licenses/>.
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from pyisbn import Isbn
+from pyisbn.cache import IsbnCache
+from tests.data import TEST_BOOKS
+
+#: Stream of repeated ISBNs, as seen in order feeds
+ISBNS = list(TEST_BOOKS.values()) * 100
+
+
+@pytest.mark.benchmark(group="cache-stream")
+def test_construct(benchmark: BenchmarkFixture):
+    """Benchmark creating and validating objects for every ISBN."""
+    benchmark(lambda: [Isbn(s).validate() for s in ISBNS])
+
+
+@pytest.mark.benchmark(group="cache-stream")
+def test_cached(benchmark: BenchmarkFixture):
+    """Benchmark fetching validated objects from a cache."""
+    cache = IsbnCache()
+    benchmark(lambda: [cache.get(s).validate() for s in ISBNS])
@@ -0,0 +1,67 @@
+"""test_cached - Benchmark memoised function interface."""
+# Copyright © 2026-2026  James Rowe <jnrowe@gmail.com>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# This file is part of pyisbn.
+#
+# pyisbn is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# pyisbn is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# pyisbn.  If not, see <http://www.gnu.org/licenses/>.
+
+from collections.abc import Callable
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from pyisbn import cached, func
+from tests.data import TEST_BOOKS
+
+UNIQUE = list(TEST_BOOKS.values())
+
+
+def _stream(repetitions: int) -> list[str]:
+    """Build a stream of ISBNs with a given repetition rate.
+
+    Args:
+        repetitions: Number of times each ISBN appears
+
+    Returns:
+        ISBNs, with each repeated ``repetitions`` times
+
+    """
+    # Unique suffixes force misses, without changing the work per ISBN
+    count = len(UNIQUE) * 100 // repetitions
+    return [
+        f"{UNIQUE[i % len(UNIQUE)]}-{'-' * (i // len(UNIQUE))}"
+        for i in range(count)
+    ] * repetitions
+
+
+@pytest.mark.parametrize("repetitions", [1, 10, 100])
+@pytest.mark.parametrize(
+    "validate", [func.validate, cached.validate], ids=["func", "cached"]
+)
+def test_validate(
+    benchmark: BenchmarkFixture,
+    repetitions: int,
+    validate: Callable[[str], bool],
+):
+    """Benchmark validating ISBNs with differing repetition rates."""
+    benchmark.group = f"cached-validate-{repetitions}"
+    isbns = _stream(repetitions)
+    cached.configure(None)
+    # Every round starts with an empty cache, so the hit rate is fixed
+    benchmark.pedantic(
+        lambda: [validate(s) for s in isbns],
+        setup=cached.validate.cache_clear,
+        rounds=10,
+    )
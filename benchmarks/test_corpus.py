@@ -0,0 +1,99 @@
+"""test_corpus - Benchmark bulk interfaces with million row corpora."""
+# Copyright © 2026-2026  James Rowe <jnrowe@gmail.com>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# This file is part of pyisbn.
+#
+# pyisbn is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# pyisbn is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# pyisbn.  If not, see <http://www.gnu.org/licenses/>.
+
+import pathlib
+from collections import deque
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from benchmarks.data import corpus
+from pyisbn.batch import convert_many, validate_many
+from pyisbn.extract import find_isbns
+from pyisbn.packed import IsbnArray
+from pyisbn.ranges import hyphenate_many
+from pyisbn.scan import scan_file
+
+
+@pytest.fixture(scope="module")
+def corpus_file(tmp_path_factory: pytest.TempPathFactory) -> pathlib.Path:
+    """Noisy corpus written to a file.
+
+    Returns:
+        Path to file
+
+    """
+    path = tmp_path_factory.mktemp("corpus") / "isbns.txt"
+    path.write_text("\n".join(corpus("noisy")) + "\n", encoding="utf-8")
+    return path
+
+
+@pytest.mark.benchmark(group="corpus-validate")
+@pytest.mark.parametrize("kind", ["isbn10", "isbn13", "noisy"])
+def test_validate_many(benchmark: BenchmarkFixture, kind: str):
+    """Benchmark validating a corpus in bulk."""
+    isbns = corpus(kind)
+    benchmark.pedantic(validate_many, (isbns,), rounds=3)
+
+
+@pytest.mark.benchmark(group="corpus-validate")
+@pytest.mark.parametrize("kind", ["isbn10", "isbn13", "noisy"])
+def test_validate_column(benchmark: BenchmarkFixture, kind: str):
+    """Benchmark validating a corpus as a NumPy column."""
+    np = pytest.importorskip("numpy")
+    vector = pytest.importorskip("pyisbn.vector")
+    isbns = np.array(corpus(kind), dtype="S")
+    benchmark.pedantic(vector.validate, (isbns,), rounds=3)
+
+
+@pytest.mark.benchmark(group="corpus-validate")
+def test_scan_file(benchmark: BenchmarkFixture, corpus_file: pathlib.Path):
+    """Benchmark validating a corpus file."""
+    benchmark.pedantic(
+        lambda: deque(scan_file(corpus_file), maxlen=0), rounds=3
+    )
+
+
+@pytest.mark.benchmark(group="corpus-convert")
+@pytest.mark.parametrize("kind", ["isbn10", "isbn13"])
+def test_convert_many(benchmark: BenchmarkFixture, kind: str):
+    """Benchmark converting a corpus in bulk."""
+    isbns = corpus(kind)
+    benchmark.pedantic(convert_many, (isbns,), rounds=3)
+
+
+@pytest.mark.benchmark(group="corpus-hyphenate")
+def test_hyphenate_many(benchmark: BenchmarkFixture):
+    """Benchmark hyphenating a corpus in bulk."""
+    isbns = corpus("isbn13")
+    benchmark.pedantic(hyphenate_many, (isbns,), rounds=3)
+
+
+@pytest.mark.benchmark(group="corpus-pack")
+def test_pack(benchmark: BenchmarkFixture):
+    """Benchmark packing a corpus."""
+    isbns = corpus("isbn13")
+    benchmark.pedantic(IsbnArray, (isbns,), rounds=3)
+
+
+@pytest.mark.benchmark(group="corpus-extract")
+def test_find_isbns(benchmark: BenchmarkFixture, corpus_file: pathlib.Path):
+    """Benchmark extracting ISBNs from a corpus as text."""
+    text = corpus_file.read_text(encoding="utf-8")
+    benchmark.pedantic(lambda: deque(find_isbns(text), maxlen=0), rounds=3)
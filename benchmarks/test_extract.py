@@ -0,0 +1,74 @@
+"""test_extract - Benchmark ISBN extraction."""
+# Copyright © 2026-2026  James Rowe <jnrowe@gmail.com>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# This file is part of pyisbn.
+#
+# pyisbn is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# pyisbn is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# pyisbn.  If not, see <http://www.gnu.org/licenses/>.
+
+import re
+from collections import deque
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from pyisbn import IsbnError, validate
+from pyisbn.extract import find_isbns, find_isbns_stream
+from tests.data import TEST_BOOKS
+
+PARAGRAPH = (
+    "Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod "
+    "tempor incididunt ut labore et dolore magna aliqua.  Printed 1984, "
+    "pp. 123-456, call number 025.3 and phone 555-0123.\n"
+)
+#: Roughly 4MiB of text, with one ISBN per paragraph
+CORPUS = "".join(
+    f"{PARAGRAPH}ISBN {isbn}\n" for isbn in TEST_BOOKS.values()
+) * ((4 << 20) // (len(PARAGRAPH) + 20) // len(TEST_BOOKS) + 1)
+CHUNK_SIZE = 1 << 16
+_NAIVE = re.compile(r"[0-9][0-9Xx-]{7,15}[0-9Xx]")
+
+
+def _naive(text: str) -> list[str]:
+    found = []
+    for candidate in _NAIVE.findall(text):
+        try:
+            if validate(candidate):
+                found.append(candidate)
+        except IsbnError:
+            pass
+    return found
+
+
+@pytest.mark.benchmark(group="extract")
+def test_naive(benchmark: BenchmarkFixture):
+    """Benchmark a simple regex, validating each candidate."""
+    benchmark.pedantic(_naive, (CORPUS,), rounds=3)
+
+
+@pytest.mark.benchmark(group="extract")
+def test_find_isbns(benchmark: BenchmarkFixture):
+    """Benchmark finding ISBNs in a large string."""
+    benchmark.pedantic(lambda: deque(find_isbns(CORPUS), maxlen=0), rounds=3)
+
+
+@pytest.mark.benchmark(group="extract")
+def test_find_isbns_stream(benchmark: BenchmarkFixture):
+    """Benchmark finding ISBNs in chunks of a large string."""
+    chunks = [
+        CORPUS[i : i + CHUNK_SIZE] for i in range(0, len(CORPUS), CHUNK_SIZE)
+    ]
+    benchmark.pedantic(
+        lambda: deque(find_isbns_stream(chunks), maxlen=0), rounds=3
+    )
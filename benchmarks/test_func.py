@@ -0,0 +1,86 @@
+"""test_func - Benchmark function interface."""
+# Copyright © 2026-2026  James Rowe <jnrowe@gmail.com>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# This file is part of pyisbn.
+#
+# pyisbn is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# pyisbn is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# pyisbn.  If not, see <http://www.gnu.org/licenses/>.
+
+import contextlib
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from pyisbn import IsbnError, calculate_checksum, convert, validate
+from pyisbn._utils import isbn_cleanse  # NoQA: PLC2701
+
+
+@pytest.mark.benchmark(group="calculate_checksum")
+@pytest.mark.parametrize("isbn", ["354000978", "978354000978"])
+def test_calculate_checksum(benchmark: BenchmarkFixture, isbn: str):
+    """Benchmark calculating checksums for 9 and 12 digit input."""
+    benchmark(calculate_checksum, isbn)
+
+
+@pytest.mark.benchmark(group="validate")
+@pytest.mark.parametrize("isbn", ["3540009787", "9783540009788"])
+def test_validate(benchmark: BenchmarkFixture, isbn: str):
+    """Benchmark validating 10 and 13 digit input."""
+    benchmark(validate, isbn)
+
+
+@pytest.mark.benchmark(group="convert")
+@pytest.mark.parametrize("isbn", ["3540009787", "9783540009788"])
+def test_convert(benchmark: BenchmarkFixture, isbn: str):
+    """Benchmark converting 10 and 13 digit input."""
+    benchmark(convert, isbn)
+
+
+@pytest.mark.benchmark(group="isbn_cleanse")
+@pytest.mark.parametrize(
+    "isbn",
+    ["3540009787", "978-3-540-00978-8", b"9783540009788"],
+    ids=["clean", "hyphenated", "bytes"],
+)
+def test_isbn_cleanse(benchmark: BenchmarkFixture, isbn: str | bytes):
+    """Benchmark cleansing clean, hyphenated and bytes input."""
+    benchmark(isbn_cleanse, isbn)
+
+
+@pytest.mark.benchmark(group="isbn_cleanse")
+def test_isbn_cleanse_lenient(benchmark: BenchmarkFixture):
+    """Benchmark cleansing labelled input."""
+    benchmark(isbn_cleanse, "ISBN-13: 978 3 540 00978 8", lenient=True)
+
+
+def _cleanse(isbn: str) -> None:
+    """Cleanse ISBN, ignoring errors.
+
+    Args:
+        isbn: SBN, ISBN-10 or ISBN-13
+
+    """
+    with contextlib.suppress(IsbnError):
+        isbn_cleanse(isbn)
+
+
+@pytest.mark.benchmark(group="isbn_cleanse")
+@pytest.mark.parametrize(
+    "isbn",
+    ["3540-x9787", "35400", "9773540009788"],
+    ids=["non-digit", "length", "bookland"],
+)
+def test_isbn_cleanse_malformed(benchmark: BenchmarkFixture, isbn: str):
+    """Benchmark cleansing malformed input."""
+    benchmark(_cleanse, isbn)
@@ -0,0 +1,49 @@
+"""test_generate - Benchmark ISBN sequence generation."""
+# Copyright © 2026-2026  James Rowe <jnrowe@gmail.com>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# This file is part of pyisbn.
+#
+# pyisbn is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# pyisbn is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# pyisbn.  If not, see <http://www.gnu.org/licenses/>.
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from pyisbn import calculate_checksum, generate
+
+#: Items generated from a registrant's block
+COUNT = 100_000
+
+
+@pytest.mark.benchmark(group="generate")
+def test_calculate_checksum(benchmark: BenchmarkFixture):
+    """Benchmark calculating each checksum from scratch."""
+    benchmark(
+        lambda: [
+            s + calculate_checksum(s)
+            for s in (f"97801{n:07d}" for n in range(COUNT))
+        ]
+    )
+
+
+@pytest.mark.benchmark(group="generate")
+def test_range(benchmark: BenchmarkFixture):
+    """Benchmark generating strings with incremental checksums."""
+    benchmark(lambda: list(generate.range("978-0-1", 0, COUNT)))
+
+
+@pytest.mark.benchmark(group="generate")
+def test_range_packed(benchmark: BenchmarkFixture):
+    """Benchmark generating packed ISBNs with incremental checksums."""
+    benchmark(lambda: list(generate.range("978-0-1", 0, COUNT, packed=True)))
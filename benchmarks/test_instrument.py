@@ -0,0 +1,61 @@
+"""test_instrument - Benchmark instrumentation overhead."""
+# Copyright © 2026-2026  James Rowe <jnrowe@gmail.com>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# This file is part of pyisbn.
+#
+# pyisbn is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# pyisbn is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# pyisbn.  If not, see <http://www.gnu.org/licenses/>.
+
+from collections.abc import Iterator
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+import pyisbn
+from pyisbn import Isbn, instrument
+from tests.data import TEST_BOOKS
+
+#: Hyphenated ISBNs, as they appear in the sample book data
+ISBNS = list(TEST_BOOKS.values()) * 10
+
+
+def _workload() -> None:
+    """Validate and format ISBNs, through both interfaces."""
+    for isbn in ISBNS:
+        pyisbn.validate(isbn)
+        format(Isbn(isbn), "urn")
+
+
+@pytest.fixture(params=["never", "disabled", "enabled"])
+def state(request: pytest.FixtureRequest) -> Iterator[None]:
+    """Set instrumentation state.
+
+    Yields:
+        Nothing, instrumentation is disabled on exit
+
+    """
+    if request.param != "never":
+        instrument.enable()
+    if request.param == "disabled":
+        instrument.disable()
+    yield
+    instrument.disable()
+    instrument.reset()
+
+
+@pytest.mark.benchmark(group="instrument")
+@pytest.mark.usefixtures("state")
+def test_workload(benchmark: BenchmarkFixture):
+    """Benchmark workload in each instrumentation state."""
+    benchmark(_workload)
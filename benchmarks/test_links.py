@@ -0,0 +1,52 @@
+"""test_links - Benchmark bulk link generation."""
+# Copyright © 2026-2026  James Rowe <jnrowe@gmail.com>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# This file is part of pyisbn.
+#
+# pyisbn is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# pyisbn is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# pyisbn.  If not, see <http://www.gnu.org/licenses/>.
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from benchmarks.data import BOOKS
+from pyisbn import Isbn
+from pyisbn.links import to_urls, to_urns
+
+#: Hyphenated ISBNs, as they appear in the sample book data
+ISBNS = BOOKS * 100
+
+
+@pytest.mark.benchmark(group="to_url")
+def test_to_url(benchmark: BenchmarkFixture):
+    """Benchmark generating links one at a time."""
+    benchmark(lambda: [Isbn(s).to_url("amazon", "uk") for s in ISBNS])
+
+
+@pytest.mark.benchmark(group="to_url")
+def test_to_urls(benchmark: BenchmarkFixture):
+    """Benchmark generating links in bulk."""
+    benchmark(lambda: list(to_urls(ISBNS, "amazon", "uk")))
+
+
+@pytest.mark.benchmark(group="to_urn")
+def test_to_urn(benchmark: BenchmarkFixture):
+    """Benchmark generating URNs one at a time."""
+    benchmark(lambda: [Isbn(s).to_urn() for s in ISBNS])
+
+
+@pytest.mark.benchmark(group="to_urn")
+def test_to_urns(benchmark: BenchmarkFixture):
+    """Benchmark generating URNs in bulk."""
+    benchmark(lambda: list(to_urns(ISBNS)))
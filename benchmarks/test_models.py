@@ -0,0 +1,68 @@
+"""test_models - Benchmark class based interface."""
+# Copyright © 2026-2026  James Rowe <jnrowe@gmail.com>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# This file is part of pyisbn.
+#
+# pyisbn is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# pyisbn is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# pyisbn.  If not, see <http://www.gnu.org/licenses/>.
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from benchmarks.data import BOOKS
+from pyisbn import Isbn, Isbn10, Isbn13, Sbn
+
+ISBN = Isbn("978-3-540-00978-8")
+
+
+@pytest.mark.benchmark(group="models-construct")
+@pytest.mark.parametrize(
+    ("cls", "isbn"),
+    [
+        (Isbn, "3540009787"),
+        (Isbn, "978-3-540-00978-8"),
+        (Isbn10, "3540009787"),
+        (Isbn13, "9783540009788"),
+        (Sbn, "140621180"),
+    ],
+    ids=["isbn", "isbn-hyphenated", "isbn10", "isbn13", "sbn"],
+)
+def test_construct(benchmark: BenchmarkFixture, cls: type[Isbn], isbn: str):
+    """Benchmark constructing ISBN objects."""
+    benchmark(cls, isbn)
+
+
+@pytest.mark.benchmark(group="models-construct-books")
+def test_construct_books(benchmark: BenchmarkFixture):
+    """Benchmark constructing and validating objects for the sample books."""
+    benchmark(lambda: [Isbn(s).validate() for s in BOOKS])
+
+
+@pytest.mark.benchmark(group="models-format")
+@pytest.mark.parametrize(
+    "format_spec", ["", "urn", "url", "url:google", "url:amazon:uk"]
+)
+def test_format(benchmark: BenchmarkFixture, format_spec: str):
+    """Benchmark formatting ISBN objects."""
+    benchmark(format, ISBN, format_spec)
+
+
+@pytest.mark.benchmark(group="models-url")
+@pytest.mark.parametrize(
+    ("site", "country"),
+    [("amazon", "us"), ("amazon", "de"), ("google", None)],
+)
+def test_to_url(benchmark: BenchmarkFixture, site: str, country: str | None):
+    """Benchmark generating URLs."""
+    benchmark(ISBN.to_url, site, country)
@@ -0,0 +1,72 @@
+"""test_packed - Benchmark packed storage interface."""
+# Copyright © 2026-2026  James Rowe <jnrowe@gmail.com>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# This file is part of pyisbn.
+#
+# pyisbn is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# pyisbn is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# pyisbn.  If not, see <http://www.gnu.org/licenses/>.
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from pyisbn.batch import validate_many
+from pyisbn.packed import IsbnArray, unpack
+from tests.data import TEST_ISBN13S
+
+ISBNS = TEST_ISBN13S * 1_000
+#: Packed ISBNs to search for, half of which are missing
+QUERIES = [int(s) + offset for s in TEST_ISBN13S for offset in (0, 1)]
+
+
+@pytest.fixture(scope="module")
+def packed() -> IsbnArray:
+    """Array of packed ISBNs.
+
+    Returns:
+        Packed ISBNs
+
+    """
+    return IsbnArray(ISBNS)
+
+
+@pytest.mark.benchmark(group="packed-validate")
+def test_validate_strings(benchmark: BenchmarkFixture):
+    """Benchmark validating a list of ISBN strings."""
+    benchmark(validate_many, ISBNS)
+
+
+@pytest.mark.benchmark(group="packed-validate")
+def test_validate_packed(benchmark: BenchmarkFixture, packed: IsbnArray):
+    """Benchmark validating packed ISBNs."""
+    benchmark(packed.validate)
+
+
+@pytest.mark.benchmark(group="packed-contains")
+def test_contains_list(benchmark: BenchmarkFixture):
+    """Benchmark membership tests on a list of ISBN strings."""
+    benchmark(lambda: [unpack(s) in ISBNS for s in QUERIES])
+
+
+@pytest.mark.benchmark(group="packed-contains")
+def test_contains_unsorted(benchmark: BenchmarkFixture, packed: IsbnArray):
+    """Benchmark membership tests on an unsorted array."""
+    benchmark(lambda: [s in packed for s in QUERIES])
+
+
+@pytest.mark.benchmark(group="packed-contains")
+def test_contains_sorted(benchmark: BenchmarkFixture, packed: IsbnArray):
+    """Benchmark membership tests on a sorted array."""
+    arr = packed[:]
+    arr.sort()
+    benchmark(lambda: [s in arr for s in QUERIES])
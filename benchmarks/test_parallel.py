@@ -0,0 +1,55 @@
+"""test_parallel - Benchmark parallel interface."""
+# Copyright © 2026-2026  James Rowe <jnrowe@gmail.com>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# This file is part of pyisbn.
+#
+# pyisbn is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# pyisbn is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# pyisbn.  If not, see <http://www.gnu.org/licenses/>.
+
+import pathlib
+from collections import deque
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from pyisbn.parallel import validate_file
+from tests.data import TEST_BOOKS
+
+
+@pytest.fixture(scope="module")
+def isbn_file(tmp_path_factory: pytest.TempPathFactory) -> pathlib.Path:
+    """Large file of hyphenated ISBNs.
+
+    Returns:
+        Path to file
+
+    """
+    path = tmp_path_factory.mktemp("parallel") / "isbns.txt"
+    lines = "\n".join(TEST_BOOKS.values()) + "\n"
+    with path.open("w", encoding="utf-8") as f:
+        for _ in range(5_000):
+            f.write(lines)
+    return path
+
+
+@pytest.mark.benchmark(group="validate-file")
+@pytest.mark.parametrize("jobs", [1, 2, 4, 8])
+def test_validate_file(
+    benchmark: BenchmarkFixture, isbn_file: pathlib.Path, jobs: int
+):
+    """Benchmark validating a file with differing numbers of workers."""
+    benchmark.pedantic(
+        lambda: deque(validate_file(isbn_file, jobs=jobs), maxlen=0),
+        rounds=3,
+    )
@@ -0,0 +1,91 @@
+"""test_ranges - Benchmark registration range interface."""
+# Copyright © 2026-2026  James Rowe <jnrowe@gmail.com>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# This file is part of pyisbn.
+#
+# pyisbn is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# pyisbn is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# pyisbn.  If not, see <http://www.gnu.org/licenses/>.
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from pyisbn.ranges import (
+    DATABASE_FILE,
+    RANGES_FILE,
+    RangeIndex,
+    default_index,
+    group,
+    group_counts,
+    hyphenate,
+    hyphenate_many,
+    load,
+    read,
+    split,
+)
+from tests.data import TEST_ISBNS
+
+ISBNS = TEST_ISBNS * 100
+
+
+@pytest.mark.benchmark(group="ranges-load")
+def test_load(benchmark: BenchmarkFixture):
+    """Benchmark loading the bundled range data."""
+
+    def load() -> None:
+        default_index.cache_clear()
+        default_index()
+
+    benchmark(load)
+
+
+@pytest.mark.benchmark(group="ranges-load")
+def test_load_compiled(benchmark: BenchmarkFixture):
+    """Benchmark mapping the compiled range database."""
+    benchmark(load, DATABASE_FILE)
+
+
+@pytest.mark.benchmark(group="ranges-load")
+def test_load_text(benchmark: BenchmarkFixture):
+    """Benchmark parsing and compiling the range data file."""
+    benchmark(lambda: RangeIndex.from_groups(read(RANGES_FILE)))
+
+
+@pytest.mark.benchmark(group="ranges-hyphenate")
+def test_hyphenate(benchmark: BenchmarkFixture):
+    """Benchmark hyphenating ISBNs one at a time."""
+    benchmark(lambda: [hyphenate(s) for s in ISBNS])
+
+
+@pytest.mark.benchmark(group="ranges-hyphenate")
+def test_hyphenate_many(benchmark: BenchmarkFixture):
+    """Benchmark hyphenating ISBNs in bulk."""
+    benchmark(hyphenate_many, ISBNS)
+
+
+@pytest.mark.benchmark(group="ranges-group")
+def test_group(benchmark: BenchmarkFixture):
+    """Benchmark finding registration groups one at a time."""
+    benchmark(lambda: [group(s) for s in ISBNS])
+
+
+@pytest.mark.benchmark(group="ranges-group")
+def test_group_split(benchmark: BenchmarkFixture):
+    """Benchmark finding registration groups by splitting ISBNs."""
+    benchmark(lambda: [split(s).group for s in ISBNS])
+
+
+@pytest.mark.benchmark(group="ranges-group")
+def test_group_counts(benchmark: BenchmarkFixture):
+    """Benchmark counting registration groups in bulk."""
+    benchmark(lambda: group_counts(iter(ISBNS)))
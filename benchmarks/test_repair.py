@@ -0,0 +1,65 @@
+"""test_repair - Benchmark error correcting suggestions."""
+# Copyright © 2026-2026  James Rowe <jnrowe@gmail.com>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# This file is part of pyisbn.
+#
+# pyisbn is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# pyisbn is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# pyisbn.  If not, see <http://www.gnu.org/licenses/>.
+
+from string import digits
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from pyisbn.batch import validate_many
+from pyisbn.repair import suggest_many
+from tests.data import TEST_ISBNS
+
+#: ISBNs with their last digit replaced, as a stand-in for rejected input
+REJECTS = [
+    s[:-1] + str((int(s[-1]) + 1) % 10) for s in TEST_ISBNS if s[-1] in digits
+] * 10
+
+
+def _brute_force(isbn: str) -> list[str]:
+    """Validate every single edit of an ISBN.
+
+    Args:
+        isbn: Invalid ISBN
+
+    Returns:
+        Valid ISBNs one edit from ``isbn``
+
+    """
+    candidates = [
+        isbn[:i] + isbn[i + 1] + isbn[i] + isbn[i + 2 :]
+        for i in range(len(isbn) - 1)
+    ] + [isbn[:i] + c + isbn[i + 1 :] for i in range(len(isbn)) for c in digits]
+    return [
+        s
+        for s, v in zip(candidates, validate_many(candidates), strict=True)
+        if v
+    ]
+
+
+@pytest.mark.benchmark(group="repair")
+def test_brute_force(benchmark: BenchmarkFixture):
+    """Benchmark validating every candidate correction."""
+    benchmark(lambda: [_brute_force(s) for s in REJECTS])
+
+
+@pytest.mark.benchmark(group="repair")
+def test_suggest_many(benchmark: BenchmarkFixture):
+    """Benchmark calculating candidate corrections."""
+    benchmark(suggest_many, REJECTS)
@@ -0,0 +1,84 @@
+"""test_results - Benchmark structured validation results."""
+# Copyright © 2026-2026  James Rowe <jnrowe@gmail.com>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# This file is part of pyisbn.
+#
+# pyisbn is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# pyisbn is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# pyisbn.  If not, see <http://www.gnu.org/licenses/>.
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from benchmarks.data import BOOKS
+from pyisbn import IsbnError, validate
+from pyisbn.results import check_many
+
+#: Malformed ISBNs, covering each failure reason
+FAILURES = [
+    "0-14-062118-1",
+    "977-0-14-062118-1",
+    "0-14-062118",
+    "0-14-O62118-0",
+]
+#: Number of ISBNs in each sample
+SIZE = 10_000
+
+
+def _sample(rate: int) -> list[str]:
+    """Generate ISBNs with a given failure rate.
+
+    Args:
+        rate: Percentage of ISBNs that fail validation
+
+    Returns:
+        ISBNs
+
+    """
+    return [
+        FAILURES[i % len(FAILURES)] if i % 100 < rate else BOOKS[i % len(BOOKS)]
+        for i in range(SIZE)
+    ]
+
+
+def _validate_many(isbns: list[str]) -> list[bool]:
+    """Validate ISBNs with the exception raising interface.
+
+    Args:
+        isbns: ISBNs to validate
+
+    Returns:
+        ``True`` for each valid ISBN
+
+    """
+    result = []
+    for isbn in isbns:
+        try:
+            result.append(validate(isbn))
+        except IsbnError:
+            result.append(False)
+    return result
+
+
+@pytest.mark.parametrize("rate", [0, 10, 50, 100])
+@pytest.mark.benchmark(group="check")
+def test_validate(benchmark: BenchmarkFixture, rate: int):
+    """Benchmark validating ISBNs with exceptions."""
+    benchmark(_validate_many, _sample(rate))
+
+
+@pytest.mark.parametrize("rate", [0, 10, 50, 100])
+@pytest.mark.benchmark(group="check")
+def test_check_many(benchmark: BenchmarkFixture, rate: int):
+    """Benchmark checking ISBNs with structured results."""
+    benchmark(check_many, _sample(rate))
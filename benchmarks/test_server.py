@@ -0,0 +1,82 @@
+"""test_server - Benchmark line protocol server."""
+# Copyright © 2026-2026  James Rowe <jnrowe@gmail.com>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# This file is part of pyisbn.
+#
+# pyisbn is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# pyisbn is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# pyisbn.  If not, see <http://www.gnu.org/licenses/>.
+
+import pathlib
+import subprocess  # NoQA: S404
+import sys
+import threading
+from collections import deque
+from collections.abc import Iterator
+from itertools import starmap
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from pyisbn.server import Client, Server
+from tests.data import TEST_ISBNS
+
+TOOL = pathlib.Path(__file__).parent.parent / "extra" / "tool.py"
+REQUESTS = [("convert", s) for s in TEST_ISBNS]
+
+
+@pytest.fixture(scope="module")
+def client(tmp_path_factory: pytest.TempPathFactory) -> Iterator[Client]:
+    """Connection to a running server.
+
+    Yields:
+        Server connection
+
+    """
+    path = tmp_path_factory.mktemp("server") / "pyisbn.sock"
+    with Server(path) as srv:
+        thread = threading.Thread(target=srv.serve_forever, args=(0.01,))
+        thread.start()
+        with Client(path) as conn:
+            yield conn
+        srv.shutdown()
+        thread.join()
+
+
+@pytest.mark.benchmark(group="server-call")
+def test_tool(benchmark: BenchmarkFixture):
+    """Benchmark a tool run for a single ISBN."""
+    benchmark.pedantic(
+        subprocess.run,
+        ([sys.executable, TOOL, "-x", TEST_ISBNS[0]],),
+        {"check": True, "stdout": subprocess.DEVNULL},
+        rounds=10,
+    )
+
+
+@pytest.mark.benchmark(group="server-call")
+def test_request(benchmark: BenchmarkFixture, client: Client):
+    """Benchmark a server round trip for a single ISBN."""
+    benchmark(client.request, *REQUESTS[0])
+
+
+@pytest.mark.benchmark(group="server-bulk")
+def test_requests(benchmark: BenchmarkFixture, client: Client):
+    """Benchmark server round trips one ISBN at a time."""
+    benchmark(lambda: list(starmap(client.request, REQUESTS)))
+
+
+@pytest.mark.benchmark(group="server-bulk")
+def test_pipeline(benchmark: BenchmarkFixture, client: Client):
+    """Benchmark pipelined server requests."""
+    benchmark(lambda: deque(client.pipeline(REQUESTS), maxlen=0))
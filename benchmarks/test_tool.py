@@ -0,0 +1,56 @@
+"""test_tool - Benchmark command line tool."""
+# Copyright © 2026-2026  James Rowe <jnrowe@gmail.com>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# This file is part of pyisbn.
+#
+# pyisbn is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# pyisbn is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# pyisbn.  If not, see <http://www.gnu.org/licenses/>.
+
+import pathlib
+import subprocess  # NoQA: S404
+import sys
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from tests.data import TEST_ISBNS
+
+TOOL = pathlib.Path(__file__).parent.parent / "extra" / "tool.py"
+
+
+@pytest.mark.benchmark(group="tool-startup")
+@pytest.mark.parametrize(
+    "args",
+    [["--version"], ["-x", TEST_ISBNS[0]], ["-y", TEST_ISBNS[0]]],
+    ids=["version", "convert", "hyphenate"],
+)
+def test_startup(benchmark: BenchmarkFixture, args: list[str]):
+    """Benchmark running the tool for a single ISBN."""
+    benchmark.pedantic(
+        subprocess.run,
+        ([sys.executable, TOOL, *args],),
+        {"check": True, "stdout": subprocess.DEVNULL},
+        rounds=10,
+    )
+
+
+@pytest.mark.benchmark(group="tool-startup")
+def test_python(benchmark: BenchmarkFixture):
+    """Benchmark bare interpreter start up, for comparison."""
+    benchmark.pedantic(
+        subprocess.run,
+        ([sys.executable, "-c", "pass"],),
+        {"check": True},
+        rounds=10,
+    )
@@ -0,0 +1,55 @@
+"""test_vector - Benchmark vectorised interface."""
+# Copyright © 2026-2026  James Rowe <jnrowe@gmail.com>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# This file is part of pyisbn.
+#
+# pyisbn is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# pyisbn is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# pyisbn.  If not, see <http://www.gnu.org/licenses/>.
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from pyisbn.batch import validate_many
+from tests.data import TEST_ISBNS
+
+np = pytest.importorskip("numpy")
+vector = pytest.importorskip("pyisbn.vector")
+
+#: Cleansed ISBNs, as a fixed-width byte column
+ISBNS = np.array(TEST_ISBNS * 1_000, dtype="S13")
+
+
+@pytest.mark.benchmark(group="validate-column")
+def test_validate_many(benchmark: BenchmarkFixture):
+    """Benchmark validating a column with the batch interface."""
+    isbns = [s.decode() for s in ISBNS]
+    benchmark(validate_many, isbns)
+
+
+@pytest.mark.benchmark(group="validate-column")
+def test_validate(benchmark: BenchmarkFixture):
+    """Benchmark validating a column."""
+    benchmark(vector.validate, ISBNS)
+
+
+@pytest.mark.benchmark(group="convert-column")
+def test_convert(benchmark: BenchmarkFixture):
+    """Benchmark converting a column."""
+    benchmark(vector.convert, ISBNS)
+
+
+@pytest.mark.benchmark(group="checksum-column")
+def test_calculate_checksum(benchmark: BenchmarkFixture):
+    """Benchmark calculating checksums for a column."""
+    benchmark(vector.calculate_checksum, ISBNS.astype("S12"))
@@ -0,0 +1,94 @@
+#! /usr/bin/env python3
+"""build_ranges - Convert and compile RangeMessage data for pyisbn."""
+# Copyright © 2026-2026  James Rowe <jnrowe@gmail.com>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# This file is part of pyisbn.
+#
+# pyisbn is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# pyisbn is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# pyisbn.  If not, see <http://www.gnu.org/licenses/>.
+
+import argparse
+import pathlib
+from typing import cast
+from xml.etree import ElementTree  # NoQA: S405
+
+from pyisbn.ranges import (
+    DATABASE_FILE,
+    RANGES_FILE,
+    dump,
+    dump_compiled,
+    parse_range_message,
+    read,
+)
+
+
+def convert(source: pathlib.Path, output: pathlib.Path) -> None:
+    """Convert RangeMessage data to a range data file.
+
+    Args:
+        source: RangeMessage.xml file to read
+        output: Range data file to write
+
+    """
+    data = source.read_bytes()
+    root = ElementTree.fromstring(data)  # NoQA: S314
+    header = "\n".join([
+        "Registration group ranges for pyisbn, generated by "
+        "extra/build_ranges.py",
+        "from RangeMessage.xml, serial "
+        f"{root.findtext('MessageSerialNumber', 'unknown')}",
+        f"dated {root.findtext('MessageDate', 'unknown')}",
+    ])
+    dump(parse_range_message(data), output, header)
+
+
+def main() -> None:
+    """Parse arguments and convert the data."""
+    parser = argparse.ArgumentParser(
+        description=cast(str, __doc__).splitlines()[0].split(" - ", 1)[1],
+        epilog="RangeMessage.xml is available from "
+        "https://www.isbn-international.org/range_file_generation",
+    )
+    parser.add_argument(
+        "-r",
+        "--ranges",
+        type=pathlib.Path,
+        default=RANGES_FILE,
+        metavar="FILE",
+        help="range data file, defaulting to the bundled data",
+    )
+    parser.add_argument(
+        "-d",
+        "--database",
+        type=pathlib.Path,
+        default=DATABASE_FILE,
+        metavar="FILE",
+        help="compiled database to write, defaulting to the bundled database",
+    )
+    parser.add_argument(
+        "input",
+        type=pathlib.Path,
+        nargs="?",
+        help="RangeMessage.xml file to convert, if not given the existing "
+        "range data file is only recompiled",
+    )
+    args = parser.parse_args()
+
+    if args.input:
+        convert(args.input, args.ranges)
+    dump_compiled(read(args.ranges), args.database)
+
+
+if __name__ == "__main__":
+    main()
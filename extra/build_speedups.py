@@ -0,0 +1,76 @@
+#! /usr/bin/env python3
+"""build_speedups - Compile the optional accelerator module for pyisbn."""
+# Copyright © 2026-2026  James Rowe <jnrowe@gmail.com>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# This file is part of pyisbn.
+#
+# pyisbn is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# pyisbn is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# pyisbn.  If not, see <http://www.gnu.org/licenses/>.
+
+import argparse
+import pathlib
+import shlex
+import subprocess  # NoQA: S404
+import sysconfig
+from typing import cast
+
+#: Accelerator source, alongside the pure-Python package
+SOURCE = pathlib.Path(__file__).parent.parent / "src/pyisbn/_speedups.c"
+
+
+def build(source: pathlib.Path, output: pathlib.Path) -> None:
+    """Compile accelerator module with the interpreter's own toolchain.
+
+    Args:
+        source: C source file to compile
+        output: Extension module to write
+
+    """
+    config = sysconfig.get_config_vars()
+    command = [
+        *shlex.split(config["LDSHARED"]),
+        *shlex.split(config["CCSHARED"]),
+        *shlex.split(config["CFLAGS"]),
+        f"-I{sysconfig.get_path('include')}",
+        str(source),
+        "-o",
+        str(output),
+    ]
+    subprocess.run(command, check=True)  # NoQA: S603
+
+
+def main() -> None:
+    """Parse arguments and build the module."""
+    parser = argparse.ArgumentParser(
+        description=cast(str, __doc__).splitlines()[0].split(" - ", 1)[1],
+        epilog="The module is optional, pyisbn falls back to pure Python "
+        "when it isn't available",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=pathlib.Path,
+        default=SOURCE.with_name(
+            f"_speedups{sysconfig.get_config_var('EXT_SUFFIX')}"
+        ),
+        metavar="FILE",
+        help="extension module to write, defaulting to the in-tree package",
+    )
+    args = parser.parse_args()
+
+    build(SOURCE, args.output)
+
+
+if __name__ == "__main__":
+    main()
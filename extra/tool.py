@@ -19,16 +19,71 @@
 # pyisbn.  If not, see <http://www.gnu.org/licenses/>.
 
 import argparse
-from collections.abc import Callable
-from importlib.metadata import metadata
-from typing import cast
+import pathlib
+import signal
+import sys
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import nullcontext, suppress
+from functools import cache, partial
+from io import TextIOWrapper
+from itertools import tee
+from typing import TYPE_CHECKING, TextIO, cast
 
-from pyisbn import Isbn
+from pyisbn import Isbn, IsbnError
 from pyisbn._constants import URL_MAP  # NoQA: PLC2701
-from pyisbn._types import TIsbn
+from pyisbn._types import TIsbn  # NoQA: PLC2701
 
-DISTRIBUTION = metadata("pyisbn")
-PROJECT_URLS = dict(s.split(", ") for s in DISTRIBUTION.get_all("Project-URL"))
+if TYPE_CHECKING:
+    from importlib.metadata import PackageMetadata
+
+    from pyisbn.server import Client
+
+#: Output buffer size, large enough to make write calls rare
+BUFFER_SIZE = 1 << 16
+
+#: Server commands for each tool command
+REMOTE_COMMANDS = {
+    "calculate_checksum": "checksum",
+    "convert": "convert",
+    "hyphenate": "hyphenate",
+    "to_urn": "urn",
+}
+
+
+@cache
+def distribution() -> "PackageMetadata":
+    """Read package metadata.
+
+    Reading metadata is slow compared to the tool's usual work, so it is only
+    performed when ``--help`` or ``--version`` output is requested.
+
+    Returns:
+        Package metadata
+    """
+    from importlib.metadata import metadata  # NoQA: PLC0415
+
+    return metadata("pyisbn")
+
+
+class ArgumentParser(argparse.ArgumentParser):
+    """Argument parser that fills in metadata on demand."""
+
+    @property
+    def version(self) -> str:
+        """Version string for ``--version`` output."""
+        return f"pyisbn {distribution()['Version']}"
+
+    def format_help(self) -> str:
+        """Format help output, with the bug reporting address.
+
+        Returns:
+            Help text
+        """
+        urls = dict(
+            s.split(", ") for s in distribution().get_all("Project-URL")
+        )
+        self.epilog = f"Please report bugs at {urls['Issue tracker']}"
+        return super().format_help()
 
 
 def isbn_typecheck(string: TIsbn) -> Isbn:
@@ -52,6 +107,29 @@ def isbn_typecheck(string: TIsbn) -> Isbn:
     return isbn
 
 
+def jobs_typecheck(string: str) -> int:
+    """Check if string is a valid number of jobs.
+
+    Args:
+        string: The string to check.
+
+    Returns:
+        The number of jobs.
+
+    Raises:
+        argparse.ArgumentTypeError: Invalid number of jobs
+    """
+    try:
+        jobs = int(string)
+    except ValueError:
+        jobs = -1
+    if jobs < 0:
+        raise argparse.ArgumentTypeError(
+            f"must be a non-negative integer, not {string!r}"
+        )
+    return jobs
+
+
 def build_command_argument(
     add_argument_func: Callable[..., argparse.Action],
 ) -> Callable[..., argparse.Action]:
@@ -84,17 +162,191 @@ def build_command_argument(
     return wrapper
 
 
+def process(isbn: Isbn, args: argparse.Namespace) -> str:
+    """Apply the selected command to an ISBN.
+
+    Args:
+        isbn: ISBN to operate on
+        args: Parsed command line arguments
+
+    Returns:
+        Result of the command
+    """
+    if args.command:
+        return getattr(isbn, args.command)()
+    if args.to_url:
+        return isbn.to_url(args.to_url)
+    return str(isbn)
+
+
+def process_line(
+    args: argparse.Namespace, line: str
+) -> tuple[bool, str] | None:
+    """Apply the selected command to an ISBN read from a file.
+
+    Args:
+        args: Parsed command line arguments
+        line: Line containing an ISBN
+
+    Returns:
+        Success flag and result or error message, or ``None`` for blank lines
+    """
+    if not (string := line.strip()):
+        return None
+    try:
+        return True, process(isbn_typecheck(TIsbn(string)), args)
+    except (argparse.ArgumentTypeError, IsbnError) as e:
+        return False, str(e)
+
+
+def read_lines(name: str) -> Iterator[str]:
+    """Read lines from a file lazily.
+
+    Args:
+        name: File to read, with ``-`` for stdin
+
+    Yields:
+        Each line from the file
+    """
+    if name == "-":
+        cast(TextIOWrapper, sys.stdin).reconfigure(errors="replace")
+        lines = nullcontext(sys.stdin)
+    else:
+        lines = pathlib.Path(name).open(  # NoQA: SIM115
+            encoding="utf-8", errors="replace"
+        )
+    with lines as f:
+        yield from f
+
+
+def remote_request(args: argparse.Namespace, isbn: str) -> tuple[str, ...]:
+    """Build server request for the selected command.
+
+    Args:
+        args: Parsed command line arguments
+        isbn: ISBN to operate on
+
+    Returns:
+        Command, ISBN and command arguments
+    """
+    if args.command:
+        return REMOTE_COMMANDS[args.command], isbn
+    if args.to_url:
+        return "url", isbn, args.to_url
+    return "check", isbn
+
+
+def remote_results(
+    client: "Client", args: argparse.Namespace, lines: Iterable[str]
+) -> Iterator[tuple[bool, str] | None]:
+    """Apply the selected command to ISBNs using a server.
+
+    Requests are pipelined, so only a single round trip is needed for each
+    batch of lines.
+
+    Args:
+        client: Server connection
+        args: Parsed command line arguments
+        lines: Lines containing an ISBN
+
+    Yields:
+        Success flag and result or error message, or ``None`` for blank lines
+    """
+    requests, strings = tee(line.strip() for line in lines)
+    results = client.pipeline(remote_request(args, s) for s in requests if s)
+    for string in strings:
+        yield next(results) if string else None
+
+
+def report(
+    name: str, results: Iterable[tuple[bool, str] | None], output: TextIO
+) -> int:
+    """Write results, reporting errors on stderr with their location.
+
+    Args:
+        name: Source of results
+        results: Success flag and result or error message for each line
+        output: Stream to write results to
+
+    Returns:
+        Number of errors
+    """
+    errors = 0
+    for lineno, result in enumerate(results, 1):
+        match result:
+            case (True, res):
+                output.write(res + "\n")
+            case (False, message):
+                print(f"{name}:{lineno}: {message}", file=sys.stderr)
+                errors += 1
+    return errors
+
+
+def stream(
+    names: Iterable[str],
+    args: argparse.Namespace,
+    output: TextIO,
+    client: "Client | None" = None,
+) -> int:
+    """Process ISBNs from files, one per line.
+
+    Files are read lazily, so memory use is constant regardless of input size.
+    With multiple jobs files are processed in parallel, but stdin is always
+    processed serially.  Invalid lines and unreadable files are reported on
+    stderr with their location, and processing continues.
+
+    Args:
+        names: Files to read, with ``-`` for stdin
+        args: Parsed command line arguments
+        output: Stream to write results to
+        client: Server connection to process ISBNs with
+
+    Returns:
+        Number of invalid lines and unreadable files
+    """
+    errors = 0
+    handler = partial(process_line, args)
+    for name in names:
+        if client:
+            results = remote_results(client, args, read_lines(name))
+        elif name == "-" or args.jobs == 1:
+            results = map(handler, read_lines(name))
+        else:
+            # Deferred, as process pools are costly to import
+            from pyisbn.parallel import map_lines  # NoQA: PLC0415
+
+            results = map_lines(handler, pathlib.Path(name), jobs=args.jobs)
+        try:
+            errors += report(name, results, output)
+        except OSError as e:
+            print(f"{name}: {e.strerror or e}", file=sys.stderr)
+            errors += 1
+    return errors
+
+
+def serve(name: str) -> None:
+    """Answer requests until interrupted.
+
+    Args:
+        name: Socket to listen on, with ``-`` for stdin and stdout
+    """
+    from pyisbn import server  # NoQA: PLC0415
+
+    # Treat termination like an interrupt, so the socket is cleaned up
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    if name == "-":
+        server.serve_stream(sys.stdin, sys.stdout)
+    else:
+        with suppress(KeyboardInterrupt):
+            server.serve(pathlib.Path(name))
+
+
 def main() -> None:
     """Parse arguments and run the tool."""
-    parser = argparse.ArgumentParser(
+    parser = ArgumentParser(
         description=cast(str, __doc__).splitlines()[0].split(" - ", 1)[1],
-        epilog=f"Please report bugs at {PROJECT_URLS['Issue tracker']}",
-    )
-    parser.add_argument(
-        "--version",
-        action="version",
-        version=f"pyisbn {DISTRIBUTION['Version']}",
     )
+    parser.add_argument("--version", action="version")
     commands = parser.add_mutually_exclusive_group()
     add_command = build_command_argument(commands.add_argument)
     add_command(
@@ -110,20 +362,74 @@ def main() -> None:
         "-u", "--to-url", choices=sorted(URL_MAP.keys()), help="generate URL"
     )
     add_command("-n", "--to-urn", help="generate RFC 3187 URN")
+    add_command("-y", "--hyphenate", help="hyphenate ISBN")
+    parser.add_argument(
+        "-i",
+        "--input",
+        action="append",
+        default=[],
+        metavar="FILE",
+        help="read ISBNs from FILE, one per line, with - for stdin",
+    )
+    parser.add_argument(
+        "-s",
+        "--stream",
+        action="append_const",
+        const="-",
+        dest="input",
+        help="read ISBNs from stdin, one per line",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=jobs_typecheck,
+        default=1,
+        metavar="N",
+        help="process input files with N processes, 0 for one per CPU",
+    )
     parser.add_argument(
-        "isbn", type=isbn_typecheck, nargs="+", help="ISBNs to operate on"
+        "--serve",
+        metavar="SOCKET",
+        help="answer requests on SOCKET, with - for stdin and stdout",
     )
+    parser.add_argument(
+        "--connect",
+        metavar="SOCKET",
+        help="process ISBNs with the server listening on SOCKET",
+    )
+    parser.add_argument("isbn", nargs="*", help="ISBNs to operate on")
 
     args = parser.parse_args()
+    if args.serve:
+        serve(args.serve)
+        return
+    if not args.isbn and not args.input:
+        parser.error("ISBNs or an input file are required")
+
+    if args.connect:
+        from pyisbn.server import Client  # NoQA: PLC0415
 
-    for isbn in args.isbn:
-        if args.command:
-            res = getattr(isbn, args.command)()
-        elif args.to_url:
-            res = isbn.to_url(args.to_url)
+        connection = Client(pathlib.Path(args.connect))
+    else:
+        connection = nullcontext()
+    with (
+        connection as client,
+        open(
+            sys.stdout.fileno(),
+            "w",
+            encoding="utf-8",
+            buffering=BUFFER_SIZE,
+            closefd=False,
+        ) as output,
+    ):
+        if client:
+            results = remote_results(client, args, args.isbn)
         else:
-            res = str(isbn)
-        print(res)
+            results = map(partial(process_line, args), args.isbn)
+        errors = report("argument", results, output)
+        errors += stream(args.input, args, output, client)
+    if errors:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
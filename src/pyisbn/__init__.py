@@ -22,10 +22,12 @@ This module supports the calculation and validation of ISBN checksums.
 
 __author__ = "James Rowe <jnrowe@gmail.com>"
 
+import os
 
 from ._exceptions import CountryError, IsbnError, SiteError
-from .func import calculate_checksum, convert, validate
+from .func import calculate_checksum, convert, group_counts, validate
 from .models import Isbn, Isbn10, Isbn13, Sbn
+from .results import Reason, Result, check
 
 __all__ = [
     "CountryError",
@@ -33,9 +35,19 @@ __all__ = [
     "Isbn10",
     "Isbn13",
     "IsbnError",
+    "Reason",
+    "Result",
     "Sbn",
     "SiteError",
     "calculate_checksum",
+    "check",
     "convert",
+    "group_counts",
     "validate",
 ]
+
+if os.environ.get("PYISBN_INSTRUMENT"):  # NoQA: RUF067
+    # Deferred, as instrumentation is rarely wanted
+    from . import instrument
+
+    instrument.enable()
@@ -21,8 +21,6 @@
 # You should have received a copy of the GNU General Public License along with
 # pyisbn.  If not, see <http://www.gnu.org/licenses/>.
 
-import unicodedata
-
 from ._types import _UrlMapValue
 
 #: SBN length.
@@ -39,10 +37,14 @@ ISBN10_LENGTH_NO_CHECKSUM = 9
 ISBN13_LENGTH = 13
 #: ISBN-13 length without checksum.
 ISBN13_LENGTH_NO_CHECKSUM = 12
+#: Upper bound of ISBNs packed as integers.
+PACKED_LIMIT = 10**ISBN13_LENGTH
 
 
 #: ISBN-13 'Bookland' prefixes.
 BOOKLAND_PREFIXES = ("978", "979")
+#: ISBN-13 'Bookland' prefixes, for ``bytes`` ISBN inputs.
+BOOKLAND_PREFIXES_BYTES = tuple(s.encode() for s in BOOKLAND_PREFIXES)
 #: ISBN-13 'Bookland' prefix length.
 BOOKLAND_PREFIX_LENGTH = 3
 
@@ -61,12 +63,32 @@ ISBN13_CHECKSUM_SUBTRACT = 10
 #: ISBN-13 checksum replacement for a value of ten.
 ISBN13_CHECKSUM_TEN_REPLACEMENT = 0
 
+#: ISBN-10 checksum weights, for digits without checksum.
+ISBN10_WEIGHTS = tuple(range(1, ISBN10_LENGTH_NO_CHECKSUM + 1))
+#: ISBN-10 checksum correction for weighted sums of digit ordinals.
+ISBN10_ORDINAL_OFFSET = ord("0") * sum(ISBN10_WEIGHTS)
+#: ISBN-10 checksum characters, indexed by checksum value.
+ISBN10_CHECKSUMS = "0123456789X"
+
+#: ISBN-13 checksum weights, for digits without checksum.
+ISBN13_WEIGHTS = (1, ISBN13_ODD_MULTIPLIER) * (ISBN13_LENGTH_NO_CHECKSUM // 2)
+#: ISBN-13 checksum correction for weighted sums of digit ordinals.
+ISBN13_ORDINAL_OFFSET = ord("0") * sum(ISBN13_WEIGHTS)
+#: ISBN-13 checksum characters, indexed by checksum value.
+ISBN13_CHECKSUMS = "0123456789"  # NoQA: FURB156
+
 
 #: Dash types to accept, and scrub, in ISBN inputs
 DASHES: list[str] = [
-    unicodedata.lookup(s)
-    for s in ("HYPHEN-MINUS", "EN DASH", "EM DASH", "HORIZONTAL BAR")
+    "-",  # HYPHEN-MINUS
+    "\u2013",  # EN DASH
+    "\u2014",  # EM DASH
+    "\u2015",  # HORIZONTAL BAR
 ]
+#: UTF-8 encoded :data:`DASHES`, for ``bytes`` ISBN inputs
+DASHES_BYTES: list[bytes] = [s.encode() for s in DASHES]
+#: Translation table to scrub :data:`DASHES` in a single pass
+DASHES_TABLE = str.maketrans("", "", "".join(DASHES))
 
 #: Site to URL mappings, broken out for easier extending at runtime
 URL_MAP: dict[str, _UrlMapValue] = {
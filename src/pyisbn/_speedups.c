@@ -0,0 +1,429 @@
+/* _speedups - Optional compiled accelerator for pyisbn.
+ *
+ * Copyright © 2026-2026  James Rowe <jnrowe@gmail.com>
+ *
+ * SPDX-License-Identifier: GPL-3.0-or-later
+ *
+ * This file is part of pyisbn.
+ *
+ * pyisbn is free software: you can redistribute it and/or modify it under the
+ * terms of the GNU General Public License as published by the Free Software
+ * Foundation, either version 3 of the License, or (at your option) any later
+ * version.
+ *
+ * pyisbn is distributed in the hope that it will be useful, but WITHOUT ANY
+ * WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+ * A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License along with
+ * pyisbn.  If not, see <http://www.gnu.org/licenses/>.
+ *
+ * Only well-formed ASCII input is handled here.  Everything else, including
+ * every input that raises an error, is passed to the pure-Python functions so
+ * that results and error messages can't drift apart.  Build with
+ * extra/build_speedups.py.
+ */
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+#define SBN_LENGTH 9
+#define ISBN10_LENGTH 10
+#define ISBN13_LENGTH 13
+
+static const char ISBN10_CHECKSUMS[] = "0123456789X";
+static const char ISBN13_CHECKSUMS[] = "0123456789";
+
+/* Pure-Python fallbacks, captured at import time */
+static PyObject *isbn_error;
+static PyObject *py_checksum;
+static PyObject *py_convert;
+static PyObject *py_validate;
+static PyObject *default_code;
+
+/* Copy ASCII input to buf without HYPHEN-MINUS characters.
+ *
+ * Returns the number of characters copied, or -1 if the input needs the slow
+ * path.
+ */
+static Py_ssize_t
+scrub(PyObject *isbn, char *buf)
+{
+    const unsigned char *data;
+    Py_ssize_t size, length = 0;
+
+    if (PyUnicode_Check(isbn)) {
+        if (!PyUnicode_IS_ASCII(isbn)) {
+            return -1;
+        }
+        data = PyUnicode_1BYTE_DATA(isbn);
+        size = PyUnicode_GET_LENGTH(isbn);
+    } else if (PyBytes_Check(isbn)) {
+        data = (const unsigned char *)PyBytes_AS_STRING(isbn);
+        size = PyBytes_GET_SIZE(isbn);
+    } else {
+        return -1;
+    }
+    for (Py_ssize_t i = 0; i < size; i++) {
+        if (data[i] == '-') {
+            continue;
+        }
+        if (data[i] > 127 || length == ISBN13_LENGTH) {
+            return -1;
+        }
+        buf[length++] = (char)data[i];
+    }
+    return length;
+}
+
+static int
+digits(const char *buf, Py_ssize_t length)
+{
+    for (Py_ssize_t i = 0; i < length; i++) {
+        if (buf[i] < '0' || buf[i] > '9') {
+            return 0;
+        }
+    }
+    return 1;
+}
+
+static int
+bookland(const char *buf)
+{
+    return buf[0] == '9' && buf[1] == '7' && (buf[2] == '8' || buf[2] == '9');
+}
+
+static char
+isbn10_checksum(const char *buf)
+{
+    int total = 0;
+
+    for (int i = 0; i < ISBN10_LENGTH - 1; i++) {
+        total += (i + 1) * (buf[i] - '0');
+    }
+    return ISBN10_CHECKSUMS[total % 11];
+}
+
+static char
+isbn13_checksum(const char *buf)
+{
+    int total = 0;
+
+    for (int i = 0; i < ISBN13_LENGTH - 1; i++) {
+        total += (i % 2 ? 3 : 1) * (buf[i] - '0');
+    }
+    return ISBN13_CHECKSUMS[(10 - total % 10) % 10];
+}
+
+/* Cleanse ISBN with checksum in to buf, padding SBNs.
+ *
+ * Returns the cleansed length, or -1 if the input needs the slow path.
+ */
+static Py_ssize_t
+cleanse_isbn(PyObject *isbn, char *buf)
+{
+    Py_ssize_t length = scrub(isbn, buf + 1);
+
+    if (length == SBN_LENGTH || length == ISBN10_LENGTH) {
+        char check = buf[length];
+
+        if (!digits(buf + 1, length - 1)
+            || !((check >= '0' && check <= '9') || check == 'X'
+                 || check == 'x')) {
+            return -1;
+        }
+        if (length == SBN_LENGTH) {
+            buf[0] = '0';
+            return ISBN10_LENGTH;
+        }
+    } else if (length != ISBN13_LENGTH || !digits(buf + 1, length)
+               || !bookland(buf + 1)) {
+        return -1;
+    }
+    memmove(buf, buf + 1, length);
+    return length;
+}
+
+/* Cleanse ISBN without checksum in to buf, padding SBNs.
+ *
+ * Returns the cleansed length, or -1 if the input needs the slow path.
+ */
+static Py_ssize_t
+cleanse_body(PyObject *isbn, char *buf)
+{
+    Py_ssize_t length = scrub(isbn, buf + 1);
+
+    if (length < 0 || !digits(buf + 1, length)) {
+        return -1;
+    }
+    switch (length) {
+    case SBN_LENGTH - 1:
+        buf[0] = '0';
+        return SBN_LENGTH;
+    case ISBN10_LENGTH - 1:
+        break;
+    case ISBN13_LENGTH - 1:
+        if (!bookland(buf + 1)) {
+            return -1;
+        }
+        break;
+    default:
+        return -1;
+    }
+    memmove(buf, buf + 1, length);
+    return length;
+}
+
+/* Returns 1 for a valid ISBN, 0 for invalid, or -1 for the slow path */
+static int
+fast_validate(PyObject *isbn)
+{
+    char buf[ISBN13_LENGTH + 1];
+    Py_ssize_t length = cleanse_isbn(isbn, buf);
+
+    if (length == ISBN10_LENGTH) {
+        char check = buf[ISBN10_LENGTH - 1];
+
+        return (check == 'x' ? 'X' : check) == isbn10_checksum(buf);
+    }
+    if (length == ISBN13_LENGTH) {
+        return buf[ISBN13_LENGTH - 1] == isbn13_checksum(buf);
+    }
+    return -1;
+}
+
+/* Fill out with converted ISBN, returning 1, or 0 for the slow path */
+static int
+fast_convert(PyObject *isbn, PyObject *code, char *out)
+{
+    char buf[ISBN13_LENGTH + 1];
+    Py_ssize_t length = cleanse_isbn(isbn, buf);
+
+    if (length == ISBN10_LENGTH) {
+        if (!PyUnicode_Check(code) || !PyUnicode_IS_ASCII(code)
+            || PyUnicode_GET_LENGTH(code) != 3
+            || !bookland((const char *)PyUnicode_1BYTE_DATA(code))) {
+            return 0;
+        }
+        memcpy(out, PyUnicode_1BYTE_DATA(code), 3);
+        memcpy(out + 3, buf, ISBN10_LENGTH - 1);
+        out[ISBN13_LENGTH - 1] = isbn13_checksum(out);
+        return 1;
+    }
+    if (length == ISBN13_LENGTH && buf[2] == '8') {
+        memcpy(out, buf + 3, ISBN10_LENGTH - 1);
+        out[ISBN10_LENGTH - 1] = isbn10_checksum(out);
+        return 1;
+    }
+    return 0;
+}
+
+static PyObject *
+convert_result(const char *out)
+{
+    return PyUnicode_FromStringAndSize(
+        out, out[ISBN10_LENGTH] ? ISBN13_LENGTH : ISBN10_LENGTH);
+}
+
+/* Call a pure-Python fallback, mapping IsbnError to a default result */
+static PyObject *
+call_quietly(PyObject *func, PyObject *isbn, PyObject *code, PyObject *failure)
+{
+    PyObject *result = code ? PyObject_CallFunctionObjArgs(func, isbn, code, NULL)
+                            : PyObject_CallOneArg(func, isbn);
+
+    if (result == NULL && PyErr_ExceptionMatches(isbn_error)) {
+        PyErr_Clear();
+        return Py_NewRef(failure);
+    }
+    return result;
+}
+
+PyDoc_STRVAR(checksum_doc,
+"checksum($module, isbn, /)\n--\n\n"
+"Calculate ISBN checksum.");
+
+static PyObject *
+checksum(PyObject *module, PyObject *isbn)
+{
+    char buf[ISBN13_LENGTH + 1];
+    char check;
+
+    switch (cleanse_body(isbn, buf)) {
+    case SBN_LENGTH:
+        check = isbn10_checksum(buf);
+        break;
+    case ISBN13_LENGTH - 1:
+        check = isbn13_checksum(buf);
+        break;
+    default:
+        return PyObject_CallOneArg(py_checksum, isbn);
+    }
+    return PyUnicode_FromStringAndSize(&check, 1);
+}
+
+PyDoc_STRVAR(validate_doc,
+"validate($module, isbn, /)\n--\n\n"
+"Validate ISBNs.");
+
+static PyObject *
+validate(PyObject *module, PyObject *isbn)
+{
+    int valid = fast_validate(isbn);
+
+    if (valid < 0) {
+        return PyObject_CallOneArg(py_validate, isbn);
+    }
+    return PyBool_FromLong(valid);
+}
+
+PyDoc_STRVAR(convert_doc,
+"convert($module, /, isbn, code='978')\n--\n\n"
+"Convert ISBNs between ISBN-10 and ISBN-13.");
+
+static PyObject *
+convert(PyObject *module, PyObject *args, PyObject *kwargs)
+{
+    static char *keywords[] = {"isbn", "code", NULL};
+    PyObject *isbn, *code = default_code;
+    char out[ISBN13_LENGTH + 1] = {0};
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O|O:convert", keywords,
+                                     &isbn, &code)) {
+        return NULL;
+    }
+    if (!fast_convert(isbn, code, out)) {
+        return PyObject_CallFunctionObjArgs(py_convert, isbn, code, NULL);
+    }
+    return convert_result(out);
+}
+
+PyDoc_STRVAR(validate_many_doc,
+"validate_many($module, isbns, /)\n--\n\n"
+"Validate ISBNs, without raising errors for malformed input.");
+
+static PyObject *
+validate_many(PyObject *module, PyObject *isbns)
+{
+    PyObject *seq = PySequence_Fast(isbns, "ISBNs must be iterable");
+    PyObject *result;
+    Py_ssize_t size;
+
+    if (seq == NULL) {
+        return NULL;
+    }
+    size = PySequence_Fast_GET_SIZE(seq);
+    result = PyList_New(size);
+    for (Py_ssize_t i = 0; result && i < size; i++) {
+        PyObject *isbn = PySequence_Fast_GET_ITEM(seq, i);
+        PyObject *item;
+        int valid = fast_validate(isbn);
+
+        if (valid < 0) {
+            item = call_quietly(py_validate, isbn, NULL, Py_False);
+        } else {
+            item = PyBool_FromLong(valid);
+        }
+        if (item == NULL) {
+            Py_CLEAR(result);
+            break;
+        }
+        PyList_SET_ITEM(result, i, item);
+    }
+    Py_DECREF(seq);
+    return result;
+}
+
+PyDoc_STRVAR(convert_many_doc,
+"convert_many($module, /, isbns, code='978')\n--\n\n"
+"Convert ISBNs, without raising errors for malformed input.");
+
+static PyObject *
+convert_many(PyObject *module, PyObject *args, PyObject *kwargs)
+{
+    static char *keywords[] = {"isbns", "code", NULL};
+    PyObject *isbns, *code = default_code, *seq, *result, *empty;
+    Py_ssize_t size;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O|O:convert_many",
+                                     keywords, &isbns, &code)) {
+        return NULL;
+    }
+    seq = PySequence_Fast(isbns, "ISBNs must be iterable");
+    if (seq == NULL) {
+        return NULL;
+    }
+    size = PySequence_Fast_GET_SIZE(seq);
+    result = PyList_New(size);
+    empty = PyUnicode_New(0, 0);
+    for (Py_ssize_t i = 0; result && empty && i < size; i++) {
+        PyObject *isbn = PySequence_Fast_GET_ITEM(seq, i);
+        PyObject *item;
+        char out[ISBN13_LENGTH + 1] = {0};
+
+        if (fast_convert(isbn, code, out)) {
+            item = convert_result(out);
+        } else {
+            item = call_quietly(py_convert, isbn, code, empty);
+        }
+        if (item == NULL) {
+            Py_CLEAR(result);
+            break;
+        }
+        PyList_SET_ITEM(result, i, item);
+    }
+    if (empty == NULL) {
+        Py_CLEAR(result);
+    }
+    Py_XDECREF(empty);
+    Py_DECREF(seq);
+    return result;
+}
+
+static PyMethodDef speedups_methods[] = {
+    {"checksum", checksum, METH_O, checksum_doc},
+    {"validate", validate, METH_O, validate_doc},
+    {"convert", (PyCFunction)(void (*)(void))convert,
+     METH_VARARGS | METH_KEYWORDS, convert_doc},
+    {"validate_many", validate_many, METH_O, validate_many_doc},
+    {"convert_many", (PyCFunction)(void (*)(void))convert_many,
+     METH_VARARGS | METH_KEYWORDS, convert_many_doc},
+    {NULL, NULL, 0, NULL},
+};
+
+static struct PyModuleDef speedups_module = {
+    PyModuleDef_HEAD_INIT,
+    .m_name = "pyisbn._speedups",
+    .m_doc = "Optional compiled accelerator for pyisbn.",
+    .m_size = -1,
+    .m_methods = speedups_methods,
+};
+
+static PyObject *
+import_attr(const char *module_name, const char *name)
+{
+    PyObject *module = PyImport_ImportModule(module_name);
+    PyObject *attr;
+
+    if (module == NULL) {
+        return NULL;
+    }
+    attr = PyObject_GetAttrString(module, name);
+    Py_DECREF(module);
+    return attr;
+}
+
+PyMODINIT_FUNC
+PyInit__speedups(void)
+{
+    /* pyisbn.func imports this module once its own functions are defined, so
+     * they can be captured here as fallbacks before being replaced */
+    if (!(isbn_error = import_attr("pyisbn._exceptions", "IsbnError"))
+        || !(py_checksum = import_attr("pyisbn.func", "calculate_checksum"))
+        || !(py_convert = import_attr("pyisbn.func", "convert"))
+        || !(py_validate = import_attr("pyisbn.func", "validate"))
+        || !(default_code = PyUnicode_FromString("978"))) {
+        return NULL;
+    }
+    return PyModule_Create(&speedups_module);
+}
@@ -17,62 +17,312 @@
 # You should have received a copy of the GNU General Public License along with
 # pyisbn.  If not, see <http://www.gnu.org/licenses/>.
 
+import re
+from operator import mul
+from typing import AnyStr
+
 from . import _constants
 from ._exceptions import IsbnError
-from ._types import TIsbn
 
+#: Leading label, such as ``ISBN-13:``, for lenient cleansing
+_LABEL = r"ISBN(?:-1[03])?:?\s*"
+#: Dashes, Bookland prefixes, empty string, zero, X and label for ``str`` input
+_STR_VALUES = (
+    _constants.DASHES,
+    _constants.BOOKLAND_PREFIXES,
+    "",
+    "0",
+    "X",
+    re.compile(_LABEL, re.IGNORECASE),
+)
+#: Dashes, Bookland prefixes, empty string, zero, X and label for ``bytes``
+#: input
+_BYTES_VALUES = (
+    _constants.DASHES_BYTES,
+    _constants.BOOKLAND_PREFIXES_BYTES,
+    b"",
+    b"0",
+    b"X",
+    re.compile(_LABEL.encode(), re.IGNORECASE),
+)
+#: Error for ISBNs with non-digit characters before the checksum
+NON_DIGIT_ERROR = "non-digit parts"
+#: Error for ISBN-13s without a Bookland prefix
+BOOKLAND_ERROR = "invalid Bookland region"
+#: Error for ISBNs of an unknown length
+LENGTH_ERROR = "ISBN must be either 10 or 13 characters long"
+#: Errors for ISBNs with a digit body and malformed checksum, by length
+CHECKSUM_ERRORS = {
+    _constants.ISBN10_LENGTH: "non-digit or X checksum",
+    _constants.ISBN13_LENGTH: "non-digit checksum",
+}
+
+#: Lengths of SBNs, ISBN-10s and ISBN-13s with checksums
+_DIGIT_LENGTHS = frozenset({
+    _constants.SBN_LENGTH,
+    _constants.ISBN10_LENGTH,
+    _constants.ISBN13_LENGTH,
+})
+
+
+def _values(isbn: AnyStr) -> tuple:
+    """Find type specific values for ISBN.
+
+    Args:
+        isbn: SBN, ISBN-10 or ISBN-13
+
+    Returns:
+        Dashes, Bookland prefixes, empty string, zero, X and label
+
+    Raises:
+        TypeError: ``isbn`` is not a ``str`` or ``bytes`` type
+
+    """
+    if isinstance(isbn, str):
+        return _STR_VALUES
+    if isinstance(isbn, bytes):
+        return _BYTES_VALUES
+    raise TypeError(f"ISBN must be a string, received {isbn!r}")
+
+
+def _scrub(isbn: AnyStr, dashes: list[AnyStr], empty: AnyStr) -> AnyStr:
+    """Remove dashes from ISBN.
+
+    Args:
+        isbn: SBN, ISBN-10 or ISBN-13
+        dashes: Dashes to remove, HYPHEN-MINUS first
+        empty: Empty value of ``isbn``'s type
+
+    Returns:
+        ISBN with dashes removed
+
+    """
+    # A single str.replace beats both str.translate and a loop by a wide margin,
+    # and HYPHEN-MINUS is the only dash that can appear in ASCII input
+    if isbn.isascii():
+        return isbn.replace(dashes[0], empty)
+    for dash in dashes:
+        isbn = isbn.replace(dash, empty)
+    return isbn
+
+
+def _unlabel(isbn: AnyStr, label: re.Pattern[AnyStr], empty: AnyStr) -> AnyStr:
+    """Remove leading label and whitespace from ISBN.
+
+    Args:
+        isbn: SBN, ISBN-10 or ISBN-13
+        label: Pattern matching a leading label
+        empty: Empty value of ``isbn``'s type
+
+    Returns:
+        ISBN with label and whitespace removed
+
+    """
+    isbn = isbn.strip()
+    if match := label.match(isbn):
+        isbn = isbn[match.end() :]
+    return empty.join(isbn.split())
+
+
+def _shape_digits(
+    isbn: AnyStr, prefixes: tuple[AnyStr, ...], zero: AnyStr
+) -> tuple[AnyStr, str | None]:
+    """Check Bookland prefix of an all-digit ISBN.
+
+    Args:
+        isbn: Dash-free SBN, ISBN-10 or ISBN-13
+        prefixes: Bookland prefixes of ``isbn``'s type
+        zero: Zero of ``isbn``'s type
+
+    Returns:
+        ISBN, including when called with a SBN, and error message for an
+        invalid Bookland region
+
+    """
+    length = len(isbn)
+    if length == _constants.SBN_LENGTH:
+        return zero + isbn, None
+    if length == _constants.ISBN13_LENGTH and not isbn.startswith(prefixes):
+        return isbn, BOOKLAND_ERROR
+    return isbn, None
+
+
+def _shape(
+    isbn: AnyStr, prefixes: tuple[AnyStr, ...], zero: AnyStr, x: AnyStr
+) -> tuple[AnyStr, str | None]:
+    """Check shape of an ISBN with checksum, without raising errors.
+
+    Args:
+        isbn: Dash-free SBN, ISBN-10 or ISBN-13
+        prefixes: Bookland prefixes of ``isbn``'s type
+        zero: Zero of ``isbn``'s type
+        x: X of ``isbn``'s type
+
+    Returns:
+        ISBN, including when called with a SBN, and error message for
+        malformed input
+
+    """
+    # All-digit input of a valid length is by far the most common shape, and
+    # needs only a Bookland check
+    if len(isbn) in _DIGIT_LENGTHS and isbn.isdigit():
+        return _shape_digits(isbn, prefixes, zero)
+    if not isbn[:-1].isdigit():
+        return isbn, NON_DIGIT_ERROR
+    if len(isbn) == _constants.SBN_LENGTH:
+        isbn = zero + isbn
+    if len(isbn) == _constants.ISBN10_LENGTH and isbn[-1:].upper() == x:
+        return isbn, None
+    return isbn, CHECKSUM_ERRORS.get(len(isbn), LENGTH_ERROR)
+
+
+def isbn_shape(isbn: AnyStr) -> tuple[AnyStr, str | None]:
+    """Remove dashes from ISBN, and check its shape without raising errors.
+
+    This applies the same rules as :func:`isbn_cleanse`, for callers that
+    report failures without exceptions.
 
-def isbn_cleanse(isbn: TIsbn, *, checksum: bool = True) -> str:  # NoQA: C901, PLR0912
+    Args:
+        isbn: SBN, ISBN-10 or ISBN-13
+
+    Returns:
+        ISBN with dashes removed, including when called with a SBN, and error
+        message for malformed input
+
+    Raises:
+        TypeError: ``isbn`` is not a ``str`` or ``bytes`` type
+
+    """  # NoQA: DOC502
+    dashes, prefixes, empty, zero, x, _ = _values(isbn)
+    return _shape(_scrub(isbn, dashes, empty), prefixes, zero, x)
+
+
+def _classify_body(
+    isbn: AnyStr, prefixes: tuple[AnyStr, ...], zero: AnyStr
+) -> AnyStr:
+    """Check shape of an ISBN without checksum.
+
+    Args:
+        isbn: Dash-free SBN, ISBN-10 or ISBN-13 without checksum
+        prefixes: Bookland prefixes of ``isbn``'s type
+        zero: Zero of ``isbn``'s type
+
+    Returns:
+        ISBN, including when called with a SBN
+
+    Raises:
+        IsbnError: Incorrect length for ``isbn``
+        IsbnError: Incorrect SBN or ISBN formatting
+
+    """
+    if len(isbn) == _constants.SBN_LENGTH_NO_CHECKSUM:
+        isbn = zero + isbn
+    elif len(
+        isbn
+    ) == _constants.ISBN13_LENGTH_NO_CHECKSUM and not isbn.startswith(prefixes):
+        raise IsbnError(BOOKLAND_ERROR)
+    if not isbn.isdigit():
+        raise IsbnError(NON_DIGIT_ERROR)
+    if len(isbn) not in {
+        _constants.ISBN10_LENGTH_NO_CHECKSUM,
+        _constants.ISBN13_LENGTH_NO_CHECKSUM,
+    }:
+        raise IsbnError(
+            "ISBN must be either 9 or 12 characters long without checksum"
+        )
+    return isbn
+
+
+def isbn_cleanse(
+    isbn: AnyStr, *, checksum: bool = True, lenient: bool = False
+) -> AnyStr:
     """Check ISBN is a string, and passes basic sanity checks.
 
+    ``bytes`` input is also accepted, in which case only ASCII digits and UTF-8
+    encoded dashes are supported.
+
     Args:
         isbn: SBN, ISBN-10 or ISBN-13
         checksum: ``True`` if ``isbn`` includes checksum character
+        lenient: ``True`` to also remove whitespace and a leading label, such
+            as ``ISBN`` or ``ISBN-13:``
 
     Returns:
         ISBN with hyphenation removed, including when called with a SBN
 
     Raises:
-        TypeError: ``isbn`` is not a ``str`` type
+        TypeError: ``isbn`` is not a ``str`` or ``bytes`` type
         IsbnError: Incorrect length for ``isbn``
         IsbnError: Incorrect SBN or ISBN formatting
 
-    """
-    if not isinstance(isbn, str):
-        raise TypeError(f"ISBN must be a string, received {isbn!r}")
-
-    for dash in _constants.DASHES:
-        isbn = isbn.replace(dash, "")
-
-    if checksum:
-        if not isbn[:-1].isdigit():
-            raise IsbnError("non-digit parts")
-        if len(isbn) == _constants.SBN_LENGTH:
-            isbn = "0" + isbn
-        if len(isbn) == _constants.ISBN10_LENGTH:
-            if not (isbn[-1].isdigit() or isbn[-1] in "Xx"):
-                raise IsbnError("non-digit or X checksum")
-        elif len(isbn) == _constants.ISBN13_LENGTH:
-            if not isbn[-1].isdigit():
-                raise IsbnError("non-digit checksum")
-            if not isbn.startswith(_constants.BOOKLAND_PREFIXES):
-                raise IsbnError("invalid Bookland region")
-        else:
-            raise IsbnError("ISBN must be either 10 or 13 characters long")
-    else:
-        if len(isbn) == _constants.SBN_LENGTH_NO_CHECKSUM:
-            isbn = "0" + isbn
-        elif len(isbn) == _constants.ISBN13_LENGTH_NO_CHECKSUM and not isbn[
-            :3
-        ].startswith(_constants.BOOKLAND_PREFIXES):
-            raise IsbnError("invalid Bookland region")
-        if not isbn.isdigit():
-            raise IsbnError("non-digit parts")
-        if len(isbn) not in {
-            _constants.ISBN10_LENGTH_NO_CHECKSUM,
-            _constants.ISBN13_LENGTH_NO_CHECKSUM,
-        }:
-            raise IsbnError(
-                "ISBN must be either 9 or 12 characters long without checksum"
-            )
+    """  # NoQA: DOC502
+    dashes, prefixes, empty, zero, x, label = _values(isbn)
+    if lenient:
+        isbn = _unlabel(isbn, label, empty)
+    isbn = _scrub(isbn, dashes, empty)
+    if not checksum:
+        return _classify_body(isbn, prefixes, zero)
+    isbn, error = _shape(isbn, prefixes, zero, x)
+    if error:
+        raise IsbnError(error)
     return isbn
+
+
+def isbn_digits(isbn: str | bytes) -> bytes:
+    """Convert cleansed ISBN to ASCII digits.
+
+    Non-ASCII decimal digits are mapped to their ASCII equivalents, and
+    ``bytes`` input is returned as is.
+
+    Args:
+        isbn: Cleansed ISBN digits
+
+    Returns:
+        ASCII digits for use with checksum calculations
+
+    """
+    if isinstance(isbn, bytes):
+        return isbn
+    if isbn.isascii():
+        return isbn.encode()
+    return bytes(ord("0") + int(s) for s in isbn)
+
+
+def isbn10_checksum(digits: bytes) -> str:
+    """Calculate ISBN-10 checksum from cleansed digits.
+
+    Only the first nine digits are used, so ``digits`` may include a trailing
+    checksum character.
+
+    Args:
+        digits: ASCII digits of an ISBN-10
+
+    Returns:
+        Checksum for given digits
+
+    """
+    total = sum(map(mul, _constants.ISBN10_WEIGHTS, digits))
+    return _constants.ISBN10_CHECKSUMS[
+        (total - _constants.ISBN10_ORDINAL_OFFSET)
+        % _constants.ISBN10_CHECKSUM_MODULUS
+    ]
+
+
+def isbn13_checksum(digits: bytes) -> str:
+    """Calculate ISBN-13 checksum from cleansed digits.
+
+    Only the first twelve digits are used, so ``digits`` may include a trailing
+    checksum character.
+
+    Args:
+        digits: ASCII digits of an ISBN-13
+
+    Returns:
+        Checksum for given digits
+
+    """
+    total = sum(map(mul, _constants.ISBN13_WEIGHTS, digits))
+    return _constants.ISBN13_CHECKSUMS[
+        (_constants.ISBN13_ORDINAL_OFFSET - total)
+        % _constants.ISBN13_CHECKSUM_MODULUS
+    ]
@@ -0,0 +1,229 @@
+"""asyncio interface to ``pyisbn``.
+
+This module supports the validation of ISBNs from asynchronous sources with
+``validate_stream()``, and their conversion with ``convert_stream()``.  Any
+asynchronous iterable of ``str`` or ``bytes`` can be used, such as an
+:class:`asyncio.StreamReader` for a subprocess pipe or an HTTP response body.
+
+Items are read and processed in chunks with :mod:`pyisbn.batch`, to amortise
+the per-item overhead of the event loop.  A chunk is processed as soon as it
+is full or the source has nothing more ready, so results from a slow or
+interactive source aren't held back waiting for a full chunk.  Control is
+returned to the event loop after each chunk, so a source that never blocks
+can't stall other tasks.  Items are only read as results are consumed, with at
+most one chunk read ahead, so a slow consumer applies backpressure to the
+source.
+
+The results match those of :mod:`pyisbn.batch`, except that surrounding
+whitespace, such as line endings, is ignored.
+"""
+# Copyright © 2026-2026  James Rowe <jnrowe@gmail.com>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# This file is part of pyisbn.
+#
+# pyisbn is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# pyisbn is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# pyisbn.  If not, see <http://www.gnu.org/licenses/>.
+
+import asyncio
+from collections.abc import AsyncIterable, AsyncIterator, Callable
+from functools import partial
+from typing import TypeVar
+
+from ._types import TIsbn
+from .batch import convert_many, validate_many
+
+T = TypeVar("T")
+
+#: Default largest number of items processed at a time
+CHUNK_SIZE = 1 << 10
+
+
+class _ReadAhead:
+    """Items read from a source, waiting to be chunked."""
+
+    __slots__ = ("_buffer", "_exhausted", "_size", "_space", "ready")
+
+    def __init__(self, size: int) -> None:
+        """Initialise a new ``_ReadAhead`` object.
+
+        Args:
+            size: Largest number of items to read ahead
+
+        """
+        self._buffer: list[TIsbn | bytes] = []
+        self._exhausted = False
+        self._size = size
+        # Set when the buffer has room
+        self._space = asyncio.Event()
+        #: Set when the buffer has items, or the source is exhausted
+        self.ready = asyncio.Event()
+
+    async def fill(self, items: AsyncIterable[TIsbn | bytes]) -> None:
+        """Read items, pausing whenever the buffer is full.
+
+        Args:
+            items: Items to read
+
+        """
+        try:
+            async for item in items:
+                self._buffer.append(item.strip())
+                self.ready.set()
+                if len(self._buffer) == self._size:
+                    self._space.clear()
+                    await self._space.wait()
+        finally:
+            self._exhausted = True
+            self.ready.set()
+
+    def take(self) -> list[TIsbn | bytes]:
+        """Take every item read so far.
+
+        Returns:
+            Items, empty once the source is exhausted
+
+        """
+        chunk = self._buffer.copy()
+        self._buffer.clear()
+        if not self._exhausted:
+            self.ready.clear()
+        self._space.set()
+        return chunk
+
+
+async def _chunks(
+    items: AsyncIterable[TIsbn | bytes], size: int
+) -> AsyncIterator[list[TIsbn | bytes]]:
+    """Group items in to chunks, ignoring surrounding whitespace.
+
+    Items are read by a separate task, so that a partial chunk can be taken
+    whenever the source blocks.
+
+    Args:
+        items: Items to group
+        size: Largest number of items in each chunk
+
+    Yields:
+        Chunks of items, as they fill or the source blocks
+
+    """
+    read_ahead = _ReadAhead(size)
+    reader = asyncio.create_task(read_ahead.fill(items))
+    try:
+        # Waiting only finishes once the reader is paused, either for room or
+        # for the source
+        while True:
+            await read_ahead.ready.wait()
+            if not (chunk := read_ahead.take()):
+                break
+            yield chunk
+        # Raise any error from the source
+        await reader
+    finally:
+        reader.cancel()
+
+
+async def _map_stream(
+    func: Callable[[list[TIsbn | bytes]], list[T]],
+    items: AsyncIterable[TIsbn | bytes],
+    chunk_size: int,
+) -> AsyncIterator[T]:
+    """Process items from an asynchronous source in chunks.
+
+    Args:
+        func: Function to process a list of items
+        items: Items to process
+        chunk_size: Largest number of items to process at a time
+
+    Yields:
+        Results of ``func``, in input order
+
+    """
+    async for chunk in _chunks(items, chunk_size):
+        for result in func(chunk):
+            yield result
+        # Let other tasks run, even when the source never blocks
+        await asyncio.sleep(0)
+
+
+def map_stream(
+    func: Callable[[list[TIsbn | bytes]], list[T]],
+    items: AsyncIterable[TIsbn | bytes],
+    *,
+    chunk_size: int = CHUNK_SIZE,
+) -> AsyncIterator[T]:
+    """Process items from an asynchronous source in chunks.
+
+    Args:
+        func: Function to process a list of items, returning a result for each
+            item
+        items: Items to process
+        chunk_size: Largest number of items to process at a time
+
+    Returns:
+        Asynchronous iterator of results of ``func``, in input order
+
+    Raises:
+        ValueError: ``chunk_size`` is less than one
+
+    """
+    if chunk_size < 1:
+        msg = f"chunk_size must be at least 1, not {chunk_size!r}"
+        raise ValueError(msg)
+    return _map_stream(func, items, chunk_size)
+
+
+def validate_stream(
+    isbns: AsyncIterable[TIsbn | bytes], *, chunk_size: int = CHUNK_SIZE
+) -> AsyncIterator[bool]:
+    """Validate ISBNs from an asynchronous source.
+
+    Args:
+        isbns: SBNs, ISBN-10s or ISBN-13s
+        chunk_size: Largest number of ISBNs to process at a time
+
+    Returns:
+        Asynchronous iterator of ``True`` for each ISBN that is valid
+
+    Raises:
+        ValueError: ``chunk_size`` is less than one
+
+    """  # NoQA: DOC502
+    return map_stream(validate_many, isbns, chunk_size=chunk_size)
+
+
+def convert_stream(
+    isbns: AsyncIterable[TIsbn | bytes],
+    code: str = "978",
+    *,
+    chunk_size: int = CHUNK_SIZE,
+) -> AsyncIterator[str]:
+    """Convert ISBNs from an asynchronous source.
+
+    Args:
+        isbns: SBNs, ISBN-10s or ISBN-13s
+        code: EAN Bookland code
+        chunk_size: Largest number of ISBNs to process at a time
+
+    Returns:
+        Asynchronous iterator of converted ISBN-10 or ISBN-13 for each ISBN,
+        empty for malformed or unconvertible input
+
+    Raises:
+        ValueError: ``chunk_size`` is less than one
+
+    """  # NoQA: DOC502
+    return map_stream(
+        partial(convert_many, code=code), isbns, chunk_size=chunk_size
+    )
@@ -0,0 +1,135 @@
+"""Batch interface to ``pyisbn``.
+
+This module supports the validation of large collections of ISBNs with
+``iter_validate()`` and ``validate_many()``, and their conversion with
+``convert_many()``.  ``is_valid()`` validates a single ISBN with the same fast
+path, for callers that need their own iteration.
+
+The results match those of :func:`pyisbn.validate` and :func:`pyisbn.convert`,
+except that malformed ISBNs are reported as invalid or with an empty result
+instead of raising :exc:`pyisbn.IsbnError`.  This makes it possible to process
+dirty data without having to wrap each call.
+"""
+# Copyright © 2026-2026  James Rowe <jnrowe@gmail.com>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# This file is part of pyisbn.
+#
+# pyisbn is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# pyisbn is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# pyisbn.  If not, see <http://www.gnu.org/licenses/>.
+
+import contextlib
+from collections.abc import Iterable, Iterator
+
+from . import _constants
+from ._exceptions import IsbnError
+from ._types import TIsbn
+from ._utils import isbn10_checksum, isbn13_checksum
+from .func import convert, validate
+
+
+def is_valid(isbn: TIsbn | bytes) -> bool:
+    """Validate ISBN, without raising errors for malformed input.
+
+    ASCII input in the common SBN, ISBN-10 and ISBN-13 shapes is handled
+    directly, everything else falls back to :func:`pyisbn.validate`.
+
+    Args:
+        isbn: SBN, ISBN-10 or ISBN-13
+
+    Returns:
+        ``True`` if ISBN is valid
+
+    """
+    if isinstance(isbn, str) and isbn.isascii():
+        # str.replace beats str.translate by a wide margin for ASCII input
+        isbn = isbn.replace("-", "")
+        match len(isbn):
+            case _constants.ISBN13_LENGTH if isbn.isdigit() and isbn.startswith(
+                _constants.BOOKLAND_PREFIXES
+            ):
+                return isbn[-1] == isbn13_checksum(isbn.encode())
+            case _constants.ISBN10_LENGTH if isbn[:-1].isdigit():
+                return isbn[-1].upper() == isbn10_checksum(isbn.encode())
+            case _constants.SBN_LENGTH if isbn[:-1].isdigit():
+                return isbn[-1].upper() == isbn10_checksum(b"0" + isbn.encode())
+    try:
+        return validate(isbn)
+    except IsbnError:
+        return False
+
+
+def iter_validate(isbns: Iterable[TIsbn | bytes]) -> Iterator[bool]:
+    """Validate ISBNs lazily.
+
+    Args:
+        isbns: SBNs, ISBN-10s or ISBN-13s, which may be ASCII ``bytes``
+
+    Returns:
+        Iterator of ``True`` for each ISBN that is valid
+
+    """
+    return map(is_valid, isbns)
+
+
+def validate_many(isbns: Iterable[TIsbn | bytes]) -> list[bool]:
+    """Validate ISBNs.
+
+    Args:
+        isbns: SBNs, ISBN-10s or ISBN-13s, which may be ASCII ``bytes``
+
+    Returns:
+        ``True`` for each ISBN that is valid
+
+    """
+    return list(map(is_valid, isbns))
+
+
+def _convert(isbn: TIsbn | bytes, code: str) -> str:
+    """Convert ISBN, without raising errors for malformed input.
+
+    Args:
+        isbn: SBN, ISBN-10 or ISBN-13
+        code: EAN Bookland code
+
+    Returns:
+        Converted ISBN-10 or ISBN-13, empty for malformed or unconvertible
+        input
+
+    """
+    try:
+        return convert(isbn, code)
+    except IsbnError:
+        return ""
+
+
+def convert_many(
+    isbns: Iterable[TIsbn | bytes], code: str = "978"
+) -> list[str]:
+    """Convert ISBNs between ISBN-10 and ISBN-13.
+
+    Args:
+        isbns: SBNs, ISBN-10s or ISBN-13s, which may be ASCII ``bytes``
+        code: EAN Bookland code
+
+    Returns:
+        Converted ISBN-10 or ISBN-13 for each ISBN, empty for malformed or
+        unconvertible input
+
+    """
+    return [_convert(isbn, code) for isbn in isbns]
+
+
+# Must be last, see pyisbn.func
+with contextlib.suppress(ImportError):
+    from ._speedups import convert_many, validate_many  # NoQA: F401
@@ -0,0 +1,192 @@
+"""Interning cache for ``pyisbn`` models.
+
+This module supports sharing model objects for repeated ISBNs with
+``IsbnCache``, so that the ISBN is only cleansed and validated once however
+many times it is seen.
+
+.. note::
+
+    Objects returned from a cache are shared by every caller, and must not be
+    modified.  Assigning to :attr:`~pyisbn.Isbn.isbn` changes the object for
+    every caller holding it, although the cache itself will notice and create
+    a fresh object for later lookups.
+"""
+# Copyright © 2026-2026  James Rowe <jnrowe@gmail.com>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# This file is part of pyisbn.
+#
+# pyisbn is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# pyisbn is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# pyisbn.  If not, see <http://www.gnu.org/licenses/>.
+
+import contextlib
+from collections import OrderedDict
+from threading import Lock
+from typing import NamedTuple
+
+from ._exceptions import IsbnError
+from ._types import TIsbn
+from .models import Isbn
+
+#: Default maximum number of cached objects
+MAXSIZE = 1 << 18
+
+
+class CacheStats(NamedTuple):
+    """Cache usage statistics."""
+
+    #: Lookups that returned a cached object
+    hits: int
+    #: Lookups that created a new object
+    misses: int
+    #: Objects dropped to stay within ``maxsize``
+    evictions: int
+    #: Current number of cached objects
+    size: int
+    #: Maximum number of cached objects
+    maxsize: int | None
+
+
+class IsbnCache:
+    """Bounded cache of model objects, with least recently used eviction.
+
+    The cache is safe to share between threads.
+    """
+
+    __slots__ = (
+        "_data",
+        "_evictions",
+        "_hits",
+        "_lock",
+        "_misses",
+        "cls",
+        "maxsize",
+    )
+
+    def __init__(
+        self, maxsize: int | None = MAXSIZE, cls: type[Isbn] = Isbn
+    ) -> None:
+        """Initialise a new ``IsbnCache`` object.
+
+        Args:
+            maxsize: Maximum number of cached objects, or ``None`` for no limit
+            cls: Model class to create objects with
+
+        Raises:
+            ValueError: Negative ``maxsize``
+
+        """
+        if maxsize is not None and maxsize < 0:
+            msg = f"maxsize must not be negative, not {maxsize!r}"
+            raise ValueError(msg)
+        self.maxsize = maxsize
+        self.cls = cls
+        self._data: OrderedDict[str, tuple[Isbn, str]] = OrderedDict()
+        self._lock = Lock()
+        self._hits = self._misses = self._evictions = 0
+
+    def __repr__(self) -> str:
+        """Self-documenting string representation.
+
+        Returns:
+            String to recreate ``IsbnCache`` object
+
+        """
+        return (
+            f"{self.__class__.__name__}({self.maxsize!r}, {self.cls.__name__})"
+        )
+
+    def __len__(self) -> int:
+        """Number of cached objects.
+
+        Returns:
+            Size of cache
+
+        """
+        return len(self._data)
+
+    def __contains__(self, isbn: object) -> bool:
+        """Test for cached ISBN, without affecting its eviction order.
+
+        Args:
+            isbn: ISBN string
+
+        Returns:
+            ``True`` if ``isbn`` is cached
+
+        """
+        return isbn in self._data
+
+    def get(self, isbn: TIsbn) -> Isbn:
+        """Fetch model object for ISBN.
+
+        New objects are validated before they're cached, so that the result is
+        ready for later callers.  Input the model accepts but can't validate,
+        such as 12 digits without a check digit, is cached unvalidated.
+        Cached objects whose ISBN has been reassigned are replaced.
+
+        Args:
+            isbn: ISBN string
+
+        Returns:
+            Shared model object
+
+        """
+        with self._lock:
+            try:
+                obj, cleansed = self._data[isbn]
+            except KeyError:
+                pass
+            else:
+                if obj.isbn == cleansed:
+                    self._data.move_to_end(isbn)
+                    self._hits += 1
+                    return obj
+                del self._data[isbn]
+
+        # Creation happens outside the lock, so malformed input raises to the
+        # caller without blocking other threads
+        obj = self.cls(isbn)
+        with contextlib.suppress(IsbnError):
+            obj.validate()
+        with self._lock:
+            self._misses += 1
+            obj, _ = self._data.setdefault(isbn, (obj, obj.isbn))
+            self._data.move_to_end(isbn)
+            if self.maxsize is not None:
+                while len(self._data) > self.maxsize:
+                    self._data.popitem(last=False)
+                    self._evictions += 1
+        return obj
+
+    def stats(self) -> CacheStats:
+        """Report cache usage.
+
+        Returns:
+            Usage statistics
+
+        """
+        with self._lock:
+            return CacheStats(
+                self._hits,
+                self._misses,
+                self._evictions,
+                len(self._data),
+                self.maxsize,
+            )
+
+    def clear(self) -> None:
+        """Empty cache, and reset statistics."""
+        with self._lock:
+            self._data.clear()
+            self._hits = self._misses = self._evictions = 0
@@ -0,0 +1,176 @@
+"""Memoised function interface to ``pyisbn``.
+
+This module provides drop-in replacements for ``calculate_checksum()``,
+``convert()`` and ``validate()`` from :mod:`pyisbn.func`, which cache their
+results keyed on the raw input.
+
+Calls that raise :exc:`pyisbn.IsbnError` are cached too, and repeat calls raise
+a new exception with the same arguments.  Each function supports
+``cache_info()`` and ``cache_clear()`` in the same way as
+:func:`functools.lru_cache`, and ``configure()`` sets the size of all the
+caches at once.
+"""
+# Copyright © 2026-2026  James Rowe <jnrowe@gmail.com>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# This file is part of pyisbn.
+#
+# pyisbn is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# pyisbn is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# pyisbn.  If not, see <http://www.gnu.org/licenses/>.
+
+from collections.abc import Callable
+from functools import lru_cache, update_wrapper
+from typing import Generic, NamedTuple, ParamSpec, TypeVar
+
+from . import func
+from ._exceptions import IsbnError
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+#: Default maximum number of cached results for each function
+MAXSIZE = 1 << 16
+
+
+class CacheInfo(NamedTuple):
+    """Cache usage statistics, matching :func:`functools.lru_cache`."""
+
+    #: Calls that returned a cached result
+    hits: int
+    #: Calls that called the wrapped function
+    misses: int
+    #: Maximum number of cached results
+    maxsize: int | None
+    #: Current number of cached results
+    currsize: int
+
+
+def _capture(
+    wrapped: Callable[P, T], *args: P.args, **kwargs: P.kwargs
+) -> tuple[bool, T | tuple[object, ...]]:
+    """Call function, capturing ``IsbnError`` exceptions.
+
+    Args:
+        wrapped: Function to call
+        *args: Positional arguments for ``wrapped``
+        **kwargs: Keyword arguments for ``wrapped``
+
+    Returns:
+        ``True`` and the result, or ``False`` and the exception arguments
+
+    """
+    try:
+        return True, wrapped(*args, **kwargs)
+    except IsbnError as e:
+        return False, e.args
+
+
+def _hashable(*args: object) -> bool:
+    """Check arguments can be used as a cache key.
+
+    Args:
+        *args: Arguments to check
+
+    Returns:
+        ``True`` if all arguments are hashable
+
+    """
+    try:
+        hash(args)
+    except TypeError:
+        return False
+    return True
+
+
+class Memoised(Generic[P, T]):
+    """Function wrapper with a least recently used cache."""
+
+    def __init__(
+        self, wrapped: Callable[P, T], maxsize: int | None = MAXSIZE
+    ) -> None:
+        """Initialise a new ``Memoised`` object.
+
+        Args:
+            wrapped: Function to wrap
+            maxsize: Maximum number of cached results, or ``None`` for no limit
+
+        """
+        update_wrapper(self, wrapped)
+        self._func = wrapped
+        self.resize(maxsize)
+
+    def __call__(self, *args: P.args, **kwargs: P.kwargs) -> T:
+        """Call wrapped function, using cached result if available.
+
+        Calls with unhashable arguments bypass the cache.
+
+        Args:
+            *args: Positional arguments for wrapped function
+            **kwargs: Keyword arguments for wrapped function
+
+        Returns:
+            Result of wrapped function
+
+        Raises:
+            IsbnError: When wrapped function raised ``IsbnError``
+            TypeError: When wrapped function raised ``TypeError``
+
+        """
+        try:
+            success, value = self._cached(self._func, *args, **kwargs)
+        except TypeError:
+            if _hashable(*args, *kwargs.values()):
+                raise
+            return self._func(*args, **kwargs)
+        if not success:
+            raise IsbnError(*value)  # ty: ignore[not-iterable]
+        return value  # ty: ignore[invalid-return-type]
+
+    def resize(self, maxsize: int | None) -> None:
+        """Set maximum cache size, discarding cached results.
+
+        Args:
+            maxsize: Maximum number of cached results, or ``None`` for no limit
+
+        """
+        self._cached = lru_cache(maxsize)(_capture)
+
+    def cache_info(self) -> CacheInfo:
+        """Report cache usage.
+
+        Returns:
+            Hits, misses, maximum size and current size of cache
+
+        """
+        return CacheInfo(*self._cached.cache_info())
+
+    def cache_clear(self) -> None:
+        """Empty cache, and reset statistics."""
+        self._cached.cache_clear()
+
+
+calculate_checksum = Memoised(func.calculate_checksum)
+convert = Memoised(func.convert)
+validate = Memoised(func.validate)
+
+
+def configure(maxsize: int | None) -> None:
+    """Set maximum cache size for all functions, discarding cached results.
+
+    Args:
+        maxsize: Maximum number of cached results for each function, or
+            ``None`` for no limit
+
+    """
+    for memoised in (calculate_checksum, convert, validate):
+        memoised.resize(maxsize)
@@ -0,0 +1,175 @@
+"""ISBN extraction for ``pyisbn``.
+
+This module supports finding ISBNs in free text, such as MARC records, HTML
+pages or text extracted from PDFs, with ``find_isbns()``.  Large inputs can be
+processed a chunk at a time with ``find_isbns_stream()``, which finds ISBNs
+that span chunk boundaries.
+
+Candidates are digit runs of ISBN length, optionally separated by any of
+:data:`pyisbn._constants.DASHES`, which aren't part of a longer token.  Each
+candidate is validated as it is found, and only valid ISBNs are reported.  As
+one in eleven random nine digit numbers is a valid SBN, SBNs are only reported
+when they are labelled with ``SBN``, ``ISBN``, ``ISBN-10:`` or similar.
+
+The input is scanned with a single regular expression, whose matches are
+bounded in length, so extraction time is linear in the size of the input.
+"""
+# Copyright © 2026-2026  James Rowe <jnrowe@gmail.com>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# This file is part of pyisbn.
+#
+# pyisbn is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# pyisbn is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# pyisbn.  If not, see <http://www.gnu.org/licenses/>.
+
+import re
+from collections.abc import Iterable, Iterator
+from typing import NamedTuple
+
+from . import _constants
+from .batch import is_valid
+
+_DASH = f"[{''.join(map(re.escape, _constants.DASHES))}]"
+_PATTERN = re.compile(
+    rf"""
+    [0-9]
+    # Not a fragment of a longer token.  This is checked after the first
+    # digit, so that the search can skip quickly to the next digit.
+    (?<![\w{_DASH[1:-1]}][0-9])
+    (?:{_DASH}?[0-9]){{7,11}}{_DASH}?[0-9Xx]
+    (?!\w|{_DASH}\w)
+    """,
+    re.VERBOSE,
+)
+_LABEL = re.compile(r"\b(?i:i?sbn)(?:[-\s]?1[03])?[:\s]{0,3}\Z")
+#: Upper bound on the length of a label, including its preceding character
+_LABEL_LENGTH = 16
+#: Characters beyond a match that decide it
+_LOOKAHEAD = 2
+#: Upper bound on the length of a match, including its lookahead
+_MAX_LENGTH = 32
+
+
+class IsbnSpan(NamedTuple):
+    """ISBN found in text."""
+
+    #: ISBN, with separators removed
+    isbn: str
+    #: Offset of the first character of the ISBN
+    start: int
+    #: Offset after the last character of the ISBN
+    end: int
+
+
+def _check(text: str, match: re.Match[str]) -> str | None:
+    """Validate candidate.
+
+    Args:
+        text: Searched text
+        match: Candidate match
+
+    Returns:
+        ISBN, or ``None`` when the candidate is invalid
+
+    """
+    isbn = match[0].translate(_constants.DASHES_TABLE).upper()
+    if len(isbn) == _constants.SBN_LENGTH:
+        start = match.start()
+        if not _LABEL.search(text, max(start - _LABEL_LENGTH, 0), start):
+            return None
+    return isbn if is_valid(isbn) else None
+
+
+def _spans(
+    text: str, matches: Iterable[re.Match[str]], offset: int
+) -> Iterator[IsbnSpan]:
+    """Validate candidates.
+
+    Args:
+        text: Searched text
+        matches: Candidate matches
+        offset: Offset of searched text in the input
+
+    Yields:
+        Each valid ISBN, with its location in the input
+
+    """
+    for match in matches:
+        if isbn := _check(text, match):
+            start, end = match.span()
+            yield IsbnSpan(isbn, offset + start, offset + end)
+
+
+def _scan(buffer: str, pos: int) -> tuple[list[re.Match[str]], int]:
+    """Find candidates that can't be changed by following text.
+
+    Args:
+        buffer: Text to search
+        pos: Position to start searching from
+
+    Returns:
+        Candidate matches, and the position to resume searching from once
+        more text is available
+
+    """
+    matches = []
+    # Text near the end may yet start a candidate
+    resume = max(pos, len(buffer) - _MAX_LENGTH)
+    for match in _PATTERN.finditer(buffer, pos):
+        if match.end() > len(buffer) - _LOOKAHEAD:
+            # May still be extended, or invalidated, by following text
+            return matches, min(resume, match.start())
+        matches.append(match)
+        resume = max(resume, match.end())
+    return matches, resume
+
+
+def find_isbns(text: str) -> Iterator[IsbnSpan]:
+    """Find ISBNs in text.
+
+    Args:
+        text: Text to search
+
+    Returns:
+        Iterator of each valid ISBN, with its location in ``text``
+
+    """
+    return _spans(text, _PATTERN.finditer(text), 0)
+
+
+def find_isbns_stream(chunks: Iterable[str]) -> Iterator[IsbnSpan]:
+    """Find ISBNs in text, a chunk at a time.
+
+    Only a short tail of each chunk is kept between chunks, so memory use is
+    bounded by the chunk size regardless of the size of the input.
+
+    Args:
+        chunks: Text to search, for example the lines of a file
+
+    Yields:
+        Each valid ISBN, with its location in the concatenated ``chunks``
+
+    """
+    buffer = ""
+    # Offset of buffer in the input, and the position to resume searching from
+    offset = pos = 0
+    for chunk in chunks:
+        buffer += chunk
+        matches, resume = _scan(buffer, pos)
+        yield from _spans(buffer, matches, offset)
+        # Keep enough text before the resume point for labels and lookbehinds
+        keep = max(resume - _LABEL_LENGTH, 0)
+        buffer = buffer[keep:]
+        offset += keep
+        pos = resume - keep
+    yield from _spans(buffer, _PATTERN.finditer(buffer, pos), offset)
@@ -2,7 +2,8 @@
 
 This module supports the calculation of ISBN checksums with
 ``calculate_checksum()``, the conversion between ISBN-10 and ISBN-13 with
-``convert()`` and the validation of ISBNs with ``validate()``.
+``convert()`` and the validation of ISBNs with ``validate()``.  ISBNs can be
+tallied by registration group with ``group_counts()``.
 
 .. note::
 
@@ -16,6 +17,11 @@ This module supports the calculation of ISBN checksums with
 The functions in this module also support 9-digit SBNs for people with older
 books in their collection.
 
+If the optional compiled accelerator has been built, with
+``extra/build_speedups.py``, it replaces ``calculate_checksum()``,
+``convert()`` and ``validate()``.  It handles well-formed ASCII input directly,
+and falls back to the pure-Python functions for everything else.
+
 .. [#] Previous Python releases would have assumed it was octal representation
        of a number
 """
@@ -37,43 +43,33 @@ books in their collection.
 # You should have received a copy of the GNU General Public License along with
 # pyisbn.  If not, see <http://www.gnu.org/licenses/>.
 
+import contextlib
+from collections import Counter
+from collections.abc import Iterable
+
 from . import _constants
 from ._exceptions import IsbnError
 from ._types import TIsbn
-from ._utils import isbn_cleanse
+from ._utils import isbn10_checksum, isbn13_checksum, isbn_cleanse, isbn_digits
 
 
-def calculate_checksum(isbn: TIsbn) -> str:
+def calculate_checksum(isbn: TIsbn | bytes) -> str:
     """Calculate ISBN checksum.
 
     Args:
-        isbn: SBN, ISBN-10 or ISBN-13
+        isbn: SBN, ISBN-10 or ISBN-13, which may be ASCII ``bytes``
 
     Returns:
         Checksum for given ISBN or SBN
 
     """
-    digits = [int(i) for i in isbn_cleanse(isbn, checksum=False)]
+    digits = isbn_digits(isbn_cleanse(isbn, checksum=False))
     if len(digits) == _constants.ISBN10_LENGTH_NO_CHECKSUM:
-        products = [x * y for x, y in enumerate(digits, 1)]
-        check = sum(products) % _constants.ISBN10_CHECKSUM_MODULUS
-        if check == _constants.ISBN10_CHECKSUM_X:
-            check = "X"
-    else:
-        products = [
-            (x if n % 2 == 0 else x * _constants.ISBN13_ODD_MULTIPLIER)
-            for n, x in enumerate(digits)
-        ]
-        check = (
-            _constants.ISBN13_CHECKSUM_SUBTRACT
-            - sum(products) % _constants.ISBN13_CHECKSUM_MODULUS
-        )
-        if check == _constants.ISBN13_CHECKSUM_MODULUS:
-            check = _constants.ISBN13_CHECKSUM_TEN_REPLACEMENT
-    return str(check)
-
-
-def convert(isbn: TIsbn, code: str = "978") -> str:
+        return isbn10_checksum(digits)
+    return isbn13_checksum(digits)
+
+
+def convert(isbn: TIsbn | bytes, code: str = "978") -> str:
     """Convert ISBNs between ISBN-10 and ISBN-13.
 
     Note:
@@ -82,7 +78,7 @@ def convert(isbn: TIsbn, code: str = "978") -> str:
         allows ISBNs without hyphenation.
 
     Args:
-        isbn: SBN, ISBN-10 or ISBN-13
+        isbn: SBN, ISBN-10 or ISBN-13, which may be ``bytes``
         code: EAN Bookland code
 
     Returns:
@@ -93,19 +89,24 @@ def convert(isbn: TIsbn, code: str = "978") -> str:
 
     """
     isbn = isbn_cleanse(isbn)
+    if isinstance(isbn, bytes):
+        # Cleansed ISBNs contain only ASCII digits and X
+        isbn = TIsbn(isbn.decode("ascii"))
     if len(isbn) == _constants.ISBN10_LENGTH:
         isbn = code + isbn[:-1]
-        return isbn + calculate_checksum(isbn)
+        if code not in _constants.BOOKLAND_PREFIXES:
+            # Unusual codes need the full sanity checks
+            return isbn + calculate_checksum(isbn)
+        return isbn + isbn13_checksum(isbn_digits(isbn))
     if isbn.startswith(_constants.BOOKLAND_PREFIXES[0]):
-        return isbn[
-            _constants.BOOKLAND_PREFIX_LENGTH : -1
-        ] + calculate_checksum(isbn[_constants.BOOKLAND_PREFIX_LENGTH : -1])
+        isbn = isbn[_constants.BOOKLAND_PREFIX_LENGTH : -1]
+        return isbn + isbn10_checksum(isbn_digits(isbn))
     raise IsbnError(
         "Only ISBN-13s with 978 Bookland code can be converted to ISBN-10."
     )
 
 
-def validate(isbn: TIsbn) -> bool:
+def validate(isbn: TIsbn | bytes) -> bool:
     """Validate ISBNs.
 
     Warning:
@@ -118,11 +119,45 @@ def validate(isbn: TIsbn) -> bool:
         unlikely that they refuse to search for invalid published ISBNs.
 
     Args:
-        isbn: SBN, ISBN-10 or ISBN-13
+        isbn: SBN, ISBN-10 or ISBN-13, which may be ASCII ``bytes``
 
     Returns:
         ``True`` if ISBN is valid
 
     """
     isbn = isbn_cleanse(isbn)
-    return isbn[-1].upper() == calculate_checksum(isbn[:-1])
+    digits = isbn_digits(isbn[:-1])
+    check = chr(isbn[-1]) if isinstance(isbn, bytes) else isbn[-1]
+    if len(isbn) == _constants.ISBN10_LENGTH:
+        return check.upper() == isbn10_checksum(digits)
+    return check == isbn13_checksum(digits)
+
+
+def group_counts(isbns: Iterable[TIsbn]) -> Counter[str]:
+    """Count ISBNs in each registration group.
+
+    Args:
+        isbns: SBNs, ISBN-10s or ISBN-13s, which are consumed lazily
+
+    Returns:
+        Number of ISBNs in each registration group, with malformed or
+        undefined input counted under an empty key
+
+    See Also:
+        :func:`pyisbn.ranges.group_counts`
+
+    """
+    # Deferred, as the range database isn't needed for most uses
+    from .ranges import group_counts  # NoQA: PLC0415
+
+    return group_counts(isbns)
+
+
+# Must be last, as the accelerator captures the functions above as fallbacks
+with contextlib.suppress(ImportError):
+    # One statement, so a stale build can't replace only some of the functions
+    from ._speedups import (  # NoQA: F401, I001
+        checksum as calculate_checksum,
+        convert,
+        validate,
+    )
@@ -0,0 +1,210 @@
+"""Generation of ISBN sequences.
+
+This module supports generating every ISBN in a block, such as the block
+allocated to a registrant, with ``range()``.
+
+ISBNs in a block share a prefix and differ only in their trailing digits, so
+the weighted sum used for the check digit is updated as the block is walked,
+instead of being recalculated for each ISBN.  Stepping from one ISBN to the
+next only touches the digits that change, which is a single addition nine
+times out of ten.
+
+.. note::
+
+    ``range()`` shadows the builtin of the same name, so it is best used via
+    the module, as in ``generate.range()``.
+"""
+# Copyright © 2026-2026  James Rowe <jnrowe@gmail.com>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# This file is part of pyisbn.
+#
+# pyisbn is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# pyisbn is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# pyisbn.  If not, see <http://www.gnu.org/licenses/>.
+
+import builtins
+from collections.abc import Iterator
+from itertools import accumulate
+from typing import Literal, overload
+
+from . import _constants
+from ._exceptions import IsbnError
+
+_ISBN10_WEIGHTS = (*_constants.ISBN10_WEIGHTS, _constants.ISBN10_LENGTH)
+_ISBN13_WEIGHTS = (*_constants.ISBN13_WEIGHTS, 1)
+#: Weights, modulus and check characters, by ISBN length
+_SCHEMES = {
+    _constants.ISBN10_LENGTH: (
+        _ISBN10_WEIGHTS,
+        _constants.ISBN10_CHECKSUM_MODULUS,
+        _constants.ISBN10_CHECKSUMS,
+    ),
+    _constants.ISBN13_LENGTH: (
+        _ISBN13_WEIGHTS,
+        _constants.ISBN13_CHECKSUM_MODULUS,
+        _constants.ISBN13_CHECKSUMS,
+    ),
+}
+
+
+def _checks(prefix: str, length: int, start: int, stop: int) -> Iterator[int]:
+    """Calculate check values across a block.
+
+    Args:
+        prefix: Leading digits of the block
+        length: Length of ISBNs in the block
+        start: First item in the block
+        stop: Item to stop before
+
+    Yields:
+        Check value for each item
+
+    """
+    weights, modulus, _ = _SCHEMES[length]
+    width = length - 1 - len(prefix)
+    # Weights of the item digits, least significant first
+    digits = weights[-2 : len(prefix) - 1 : -1]
+    # Change in the weighted sum for an increment that carries past n nines,
+    # with a final entry for stepping off the end of the block
+    carries = [
+        w - 9 * s
+        for w, s in zip(digits, accumulate(digits, initial=0), strict=False)
+    ]
+    carries.append(0)
+    # The check digit must zero the sum once multiplied by its weight
+    inverse = -pow(weights[-1], -1, modulus)
+    total = sum(
+        int(d) * w
+        for d, w in zip(f"{prefix}{start:0{width}d}", weights, strict=False)
+    )
+    for n in builtins.range(start, stop):
+        yield total * inverse % modulus
+        nines, rest = 0, n
+        while rest % 10 == 9:  # NoQA: PLR2004
+            rest //= 10
+            nines += 1
+        total += carries[nines]
+
+
+def _block(prefix: str, length: int | None) -> tuple[str, int]:
+    """Check block definition.
+
+    Args:
+        prefix: Leading digits of the block
+        length: Length of ISBNs in the block, or ``None`` to infer it
+
+    Returns:
+        Cleansed prefix, and length of ISBNs in the block
+
+    Raises:
+        IsbnError: When ``prefix`` and ``length`` don't describe a block
+
+    """
+    prefix = prefix.translate(_constants.DASHES_TABLE)
+    if not (prefix.isascii() and prefix.isdigit()):
+        raise IsbnError("non-digit prefix")
+    bookland = prefix.startswith(_constants.BOOKLAND_PREFIXES)
+    if length is None:
+        length = (
+            _constants.ISBN13_LENGTH if bookland else _constants.ISBN10_LENGTH
+        )
+    if length not in _SCHEMES:
+        raise IsbnError("ISBN must be either 10 or 13 characters long")
+    if length == _constants.ISBN13_LENGTH and not bookland:
+        raise IsbnError("invalid Bookland region")
+    if len(prefix) >= length - 1:
+        raise IsbnError("prefix leaves no digits to generate")
+    return prefix, length
+
+
+@overload
+def range(  # NoQA: A001
+    prefix: str,
+    start: int = 0,
+    stop: int | None = None,
+    *,
+    length: int | None = None,
+    packed: Literal[False] = False,
+) -> Iterator[str]: ...
+
+
+@overload
+def range(  # NoQA: A001
+    prefix: str,
+    start: int = 0,
+    stop: int | None = None,
+    *,
+    length: int | None = None,
+    packed: Literal[True],
+) -> Iterator[int]: ...
+
+
+def range(  # NoQA: A001
+    prefix: str,
+    start: int = 0,
+    stop: int | None = None,
+    *,
+    length: int | None = None,
+    packed: bool = False,
+) -> Iterator[str] | Iterator[int]:
+    """Generate ISBNs across a block.
+
+    Items are numbered from zero within the block, so an ISBN-10 block with a
+    seven digit prefix holds items ``0`` to ``99``.
+
+    Args:
+        prefix: Leading digits of the block, with optional dashes
+        start: First item to generate
+        stop: Item to stop before, defaulting to the end of the block
+        length: Length of ISBNs, defaulting to 13 for prefixes with a Bookland
+            code and 10 otherwise
+        packed: Generate packed ISBN-13 integers, as used by
+            :mod:`pyisbn.packed`, instead of strings
+
+    Returns:
+        Iterator of ISBNs, in order
+
+    Raises:
+        IsbnError: When the block is invalid, or ``start`` and ``stop`` are
+            outside of it
+
+    """
+    prefix, length = _block(prefix, length)
+    width = length - 1 - len(prefix)
+    if stop is None:
+        stop = 10**width
+    if not 0 <= start <= stop <= 10**width:
+        raise IsbnError("range outside of block")
+    if packed:
+        if length == _constants.ISBN10_LENGTH:
+            prefix = _constants.BOOKLAND_PREFIXES[0] + prefix
+            length = _constants.ISBN13_LENGTH
+        base = int(prefix) * 10**width
+        return (
+            (base + n) * 10 + c
+            for n, c in zip(
+                builtins.range(start, stop),
+                _checks(prefix, length, start, stop),
+                strict=True,
+            )
+        )
+    template = f"{prefix}%0{width}d%s"
+    checks = _SCHEMES[length][2]
+    return (
+        template % (n, checks[c])
+        for n, c in zip(
+            builtins.range(start, stop),
+            _checks(prefix, length, start, stop),
+            strict=True,
+        )
+    )
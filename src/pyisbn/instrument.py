@@ -0,0 +1,265 @@
+"""Instrumentation of ``pyisbn`` hot paths.
+
+This module supports counting calls, failures and time spent in the most
+frequently used parts of ``pyisbn``, with ``enable()``, and exporting the
+counts with ``snapshot()`` or ``prometheus()``.
+
+Instrumentation is enabled by calling ``enable()``, or by setting the
+``PYISBN_INSTRUMENT`` environment variable to a non-empty value before
+``pyisbn`` is imported.  It works by replacing the instrumented functions and
+methods with counting wrappers, and ``disable()`` restores the originals, so
+there is no cost at all while it is disabled.
+
+.. note::
+
+    References to instrumented functions taken outside of ``pyisbn`` before
+    ``enable()`` is called, such as with ``from pyisbn import validate``, are
+    not instrumented.  Counters are updated without locking, so counts from
+    multiple threads may be approximate.
+"""
+# Copyright © 2026-2026  James Rowe <jnrowe@gmail.com>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# This file is part of pyisbn.
+#
+# pyisbn is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# pyisbn is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# pyisbn.  If not, see <http://www.gnu.org/licenses/>.
+
+import sys
+from collections import Counter
+from collections.abc import Callable, Iterator
+from functools import wraps
+from time import perf_counter_ns
+from typing import Any
+
+from ._exceptions import IsbnError
+
+#: Environment variable that enables instrumentation when ``pyisbn`` is
+#: imported
+ENVIRONMENT_VARIABLE = "PYISBN_INSTRUMENT"
+
+#: Instrumented functions and methods, by defining module
+TARGETS = {
+    "pyisbn._utils": ("isbn_cleanse",),
+    "pyisbn.func": ("calculate_checksum", "convert", "validate"),
+    "pyisbn.models": (
+        "Isbn.__init__",
+        "Isbn.__format__",
+        "Isbn.to_url",
+        "Isbn.to_urn",
+        "Isbn10.__init__",
+        "Isbn13.__init__",
+        "Sbn.__init__",
+    ),
+}
+
+
+class _Stats:
+    """Counters for an instrumented function."""
+
+    __slots__ = ("calls", "errors", "nanoseconds")
+
+    def __init__(self) -> None:
+        """Initialise a new ``_Stats`` object."""
+        self.calls = 0
+        self.errors: Counter[str] = Counter()
+        self.nanoseconds = 0
+
+
+def _wrap(func: Callable[..., Any], stats: _Stats) -> Callable[..., Any]:
+    """Wrap function with counters.
+
+    Args:
+        func: Function to wrap
+        stats: Counters to update
+
+    Returns:
+        Counting wrapper for ``func``
+
+    """
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:  # NoQA: ANN401
+        start = perf_counter_ns()
+        try:
+            return func(*args, **kwargs)
+        except IsbnError as e:
+            stats.errors[str(e)] += 1
+            raise
+        finally:
+            stats.calls += 1
+            stats.nanoseconds += perf_counter_ns() - start
+
+    return wrapper
+
+
+def _resolve(module: str, qualname: str) -> Callable[..., Any]:
+    """Find target function.
+
+    Args:
+        module: Module that defines the target
+        qualname: Qualified name of the target within ``module``
+
+    Returns:
+        Target function
+
+    """
+    obj = sys.modules[module]
+    for part in qualname.split("."):
+        obj = vars(obj)[part]
+    return obj
+
+
+_stats = {
+    f"{module}.{qualname}": _Stats()
+    for module, names in TARGETS.items()
+    for qualname in names
+}
+#: Original and wrapped versions of each target
+_functions = {
+    name: (func, _wrap(func, _stats[name]))
+    for name, func in (
+        (f"{module}.{qualname}", _resolve(module, qualname))
+        for module, names in TARGETS.items()
+        for qualname in names
+    )
+}
+#: Targets with wrappers installed
+_installed: set[str] = set()
+
+
+def _namespaces() -> Iterator[object]:
+    """Find namespaces that may hold targets.
+
+    Yields:
+        Loaded ``pyisbn`` modules, and the classes they define
+
+    """
+    for name, module in list(sys.modules.items()):
+        if name == "pyisbn" or name.startswith("pyisbn."):
+            yield module
+            yield from (
+                v
+                for v in vars(module).values()
+                if isinstance(v, type) and v.__module__ == name
+            )
+
+
+def _replace(replacements: dict[int, Callable[..., Any]]) -> None:
+    """Replace every reference to functions.
+
+    Args:
+        replacements: Replacement functions, by ``id()`` of the function they
+            replace
+
+    """
+    for namespace in _namespaces():
+        for attr, value in list(vars(namespace).items()):
+            if id(value) in replacements:
+                setattr(namespace, attr, replacements[id(value)])
+
+
+def enable() -> None:
+    """Install counting wrappers."""
+    _replace({id(func): wrapper for func, wrapper in _functions.values()})
+    _installed.update(_functions)
+
+
+def disable() -> None:
+    """Restore original functions."""
+    _replace({id(wrapper): func for func, wrapper in _functions.values()})
+    _installed.clear()
+
+
+def is_enabled() -> bool:
+    """Check whether instrumentation is enabled.
+
+    Returns:
+        ``True`` if counting wrappers are installed
+
+    """
+    return bool(_installed)
+
+
+def reset() -> None:
+    """Zero all counters."""
+    for stats in _stats.values():
+        stats.calls = stats.nanoseconds = 0
+        stats.errors.clear()
+
+
+def snapshot() -> dict[str, dict[str, Any]]:
+    """Export counters.
+
+    Returns:
+        Call count, ``IsbnError`` counts by message and cumulative time in
+        seconds, for each instrumented function
+
+    """
+    return {
+        name: {
+            "calls": stats.calls,
+            "errors": dict(stats.errors),
+            "seconds": stats.nanoseconds / 1e9,
+        }
+        for name, stats in _stats.items()
+    }
+
+
+def _label(value: str) -> str:
+    """Escape Prometheus label value.
+
+    Args:
+        value: Label value
+
+    Returns:
+        Quoted and escaped label value
+
+    """
+    escaped = (
+        value.replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n")
+    )
+    return f'"{escaped}"'
+
+
+def prometheus() -> str:
+    """Export counters in Prometheus text format.
+
+    Returns:
+        Metrics in Prometheus text exposition format
+
+    """
+    lines = [
+        "# HELP pyisbn_calls_total Calls to instrumented functions.",
+        "# TYPE pyisbn_calls_total counter",
+        *(
+            f"pyisbn_calls_total{{function={_label(name)}}} {stats.calls}"
+            for name, stats in _stats.items()
+        ),
+        "# HELP pyisbn_errors_total IsbnError exceptions raised, by message.",
+        "# TYPE pyisbn_errors_total counter",
+        *(
+            f"pyisbn_errors_total{{function={_label(name)},"
+            f"message={_label(message)}}} {count}"
+            for name, stats in _stats.items()
+            for message, count in sorted(stats.errors.items())
+        ),
+        "# HELP pyisbn_seconds_total Time spent in instrumented functions.",
+        "# TYPE pyisbn_seconds_total counter",
+        *(
+            f"pyisbn_seconds_total{{function={_label(name)}}} "
+            f"{stats.nanoseconds / 1e9}"
+            for name, stats in _stats.items()
+        ),
+    ]
+    return "\n".join(lines) + "\n"
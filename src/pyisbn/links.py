@@ -0,0 +1,197 @@
+"""Bulk link generation for ``pyisbn``.
+
+This module supports generating links to online book sites for whole
+catalogues with ``to_urls()``, and :rfc:`3187` URNs with ``to_urns()``.  The
+results match those of :meth:`pyisbn.Isbn.to_url` and
+:meth:`pyisbn.Isbn.to_urn`.
+
+A site's template is resolved for the requested country only once, and split
+around the ISBN, so each link is built with a single ``str.join()``.  Split
+templates are kept between calls, and rebuilt whenever their entry in
+:data:`pyisbn._constants.URL_MAP` is replaced.  Sites can be added at runtime
+with ``register_site()``, which prepares their templates immediately.
+"""
+# Copyright © 2026-2026  James Rowe <jnrowe@gmail.com>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# This file is part of pyisbn.
+#
+# pyisbn is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# pyisbn is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# pyisbn.  If not, see <http://www.gnu.org/licenses/>.
+
+from collections.abc import Iterable, Iterator
+
+from . import _constants
+from ._exceptions import CountryError, SiteError
+from ._types import TIsbn, _UrlMapTlds, _UrlMapValue
+from ._utils import isbn_cleanse
+
+#: Stand-in for the ISBN while splitting templates
+_PLACEHOLDER = "\0"
+
+#: Split templates by site and country, with the entry each was built from
+_TEMPLATES: dict[tuple[str, str | None], tuple[_UrlMapValue, list[str]]] = {}
+
+
+def _parse(value: _UrlMapValue) -> tuple[str, _UrlMapTlds | None]:
+    """Break out site's template and country TLDs.
+
+    Args:
+        value: Entry from :data:`pyisbn._constants.URL_MAP`
+
+    Returns:
+        URL template, and TLD for each country if the site has them
+
+    """
+    if isinstance(value, tuple):
+        return value
+    return value, None
+
+
+def _split(value: _UrlMapValue, country: str | None) -> list[str]:
+    """Resolve site's template for a country, and split it around the ISBN.
+
+    Args:
+        value: Entry from :data:`pyisbn._constants.URL_MAP`
+        country: Country specific version of site
+
+    Returns:
+        Template fragments to join with an ISBN
+
+    Raises:
+        CountryError: Unknown country value
+
+    """
+    url, tlds = _parse(value)
+    inject = {"isbn": _PLACEHOLDER}
+    if tlds:
+        if country not in tlds:
+            raise CountryError(country)
+        inject["tld"] = tlds[country] or country
+    return url.format_map(inject).split(_PLACEHOLDER)
+
+
+def _template(site: str, country: str | None) -> list[str]:
+    """Find split template for a site.
+
+    Args:
+        site: Site to create links to
+        country: Country specific version of ``site``
+
+    Returns:
+        Template fragments to join with an ISBN
+
+    Raises:
+        SiteError: Unknown site value
+
+    """
+    try:
+        value = _constants.URL_MAP[site]
+    except KeyError:
+        raise SiteError(site) from KeyError
+    # Country is ignored by sites without TLDs, so they share a single entry
+    key = (site, country if _parse(value)[1] else None)
+    cached = _TEMPLATES.get(key)
+    if cached and cached[0] is value:
+        return cached[1]
+    parts = _split(value, country)
+    _TEMPLATES[key] = (value, parts)
+    return parts
+
+
+def _checked(isbn: TIsbn) -> TIsbn:
+    """Check ISBN, with the same rules as :class:`pyisbn.Isbn`.
+
+    Args:
+        isbn: SBN, ISBN-10 or ISBN-13
+
+    Returns:
+        ``isbn`` as given
+
+    """
+    isbn_cleanse(
+        isbn,
+        checksum=len(isbn)
+        not in {_constants.SBN_LENGTH, _constants.ISBN13_LENGTH_NO_CHECKSUM},
+    )
+    return isbn
+
+
+def to_urls(
+    isbns: Iterable[TIsbn], site: str = "amazon", country: str | None = "us"
+) -> Iterator[str]:
+    """Generate links to an online book site.
+
+    The site and country are checked immediately, while ISBNs are consumed
+    lazily.
+
+    Args:
+        isbns: SBNs, ISBN-10s or ISBN-13s
+        site: Site to create links to
+        country: Country specific version of ``site``
+
+    Returns:
+        Iterator of URL on ``site`` for each ISBN, in input order
+
+    Raises:
+        SiteError: Unknown site value
+        CountryError: Unknown country value
+
+    """  # NoQA: DOC502
+    parts = _template(site, country)
+    return (_checked(isbn).join(parts) for isbn in isbns)
+
+
+def to_urns(isbns: Iterable[TIsbn]) -> Iterator[str]:
+    """Generate :rfc:`3187` URNs.
+
+    Args:
+        isbns: SBNs, ISBN-10s or ISBN-13s, which are consumed lazily
+
+    Returns:
+        Iterator of :rfc:`3187` compliant URN for each ISBN, in input order
+
+    """
+    return (f"URN:ISBN:{_checked(isbn)}" for isbn in isbns)
+
+
+def register_site(site: str, url: str, tlds: _UrlMapTlds | None = None) -> None:
+    """Add or replace a site in :data:`pyisbn._constants.URL_MAP`.
+
+    Templates for every country of the site are prepared immediately, so
+    errors in ``url`` are reported here rather than on first use.
+
+    Args:
+        site: Name of site
+        url: URL template, with ``{isbn}`` and optionally ``{tld}`` fields
+        tlds: TLD for each country, with ``None`` to use the country code,
+            required if ``url`` has a ``{tld}`` field
+
+    Raises:
+        ValueError: Unknown field in ``url``, including ``{tld}`` without
+            ``tlds``
+
+    """
+    value: _UrlMapValue = (url, tlds) if tlds else url
+    try:
+        templates = {
+            (site, country): (value, _split(value, country))
+            for country in (tlds or [None])
+        }
+    except KeyError as e:
+        msg = f"unknown field {e} in URL template {url!r}"
+        raise ValueError(msg) from None
+    for key in [key for key in _TEMPLATES if key[0] == site]:
+        del _TEMPLATES[key]
+    _constants.URL_MAP[site] = value
+    _TEMPLATES.update(templates)
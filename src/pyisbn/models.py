@@ -36,15 +36,23 @@ their collection.
 # You should have received a copy of the GNU General Public License along with
 # pyisbn.  If not, see <http://www.gnu.org/licenses/>.
 
+from typing import Self
+
 from . import _constants
-from ._exceptions import CountryError, SiteError
+from ._exceptions import CountryError, IsbnError, SiteError
 from ._types import TIsbn, TIsbn13, TSbn
 from ._utils import isbn_cleanse
 from .func import calculate_checksum, convert, validate
 
 
 class Isbn:
-    """Class for representing ISBN objects."""
+    """Class for representing ISBN objects.
+
+    The checksum, validity and converted form are calculated on first use,
+    and cached for later calls.  Assigning to :attr:`isbn` discards them.
+    """
+
+    __slots__ = ("_checksum", "_cleansed", "_converted", "_isbn", "_valid")
 
     def __init__(self, isbn: TIsbn) -> None:
         """Initialise a new ``Isbn`` object.
@@ -62,6 +70,49 @@ class Isbn:
         else:
             self.isbn = isbn_cleanse(isbn)
 
+    @property
+    def isbn(self) -> str:
+        """Cleansed ISBN string.
+
+        Returns:
+            ISBN with hyphenation removed
+
+        """
+        return self._cleansed
+
+    @isbn.setter
+    def isbn(self, isbn: str) -> None:
+        """Replace ISBN, discarding cached results.
+
+        Args:
+            isbn: Cleansed ISBN string
+
+        """
+        self._cleansed = isbn
+        self._checksum: str | None = None
+        self._converted: tuple[str, str] | None = None
+        self._valid: bool | None = None
+
+    def __getstate__(self) -> tuple[TIsbn, str]:
+        """Fetch state for pickling.
+
+        Cached results aren't included, as they're cheap to recalculate.
+
+        Returns:
+            Original and cleansed ISBN strings
+
+        """
+        return self._isbn, self._cleansed
+
+    def __setstate__(self, state: tuple[TIsbn, str]) -> None:
+        """Restore state when unpickling.
+
+        Args:
+            state: Original and cleansed ISBN strings
+
+        """
+        self._isbn, self.isbn = state
+
     def __repr__(self) -> str:
         """Self-documenting string representation.
 
@@ -114,6 +165,17 @@ class Isbn:
     def calculate_checksum(self) -> str:
         """Calculate ISBN checksum.
 
+        Returns:
+            ISBN checksum value
+
+        """
+        if self._checksum is None:
+            self._checksum = self._calculate_checksum()
+        return self._checksum
+
+    def _calculate_checksum(self) -> str:
+        """Calculate ISBN checksum, without caching.
+
         Returns:
             ISBN checksum value
 
@@ -128,6 +190,22 @@ class Isbn:
     def convert(self, code: str = "978") -> str:
         """Convert ISBNs between ISBN-10 and ISBN-13.
 
+        Args:
+            code: ISBN-13 prefix code
+
+        Returns:
+            Converted ISBN
+
+        """
+        # Only the most recent conversion is kept, as the vast majority of
+        # callers only ever use a single Bookland code
+        if self._converted is None or self._converted[0] != code:
+            self._converted = (code, self._convert(code))
+        return self._converted[1]
+
+    def _convert(self, code: str) -> str:
+        """Convert ISBNs between ISBN-10 and ISBN-13, without caching.
+
         Args:
             code: ISBN-13 prefix code
 
@@ -144,7 +222,89 @@ class Isbn:
             ``True`` if ISBN is valid
 
         """
-        return validate(self.isbn)
+        if self._valid is None:
+            self._valid = validate(self.isbn)
+        return self._valid
+
+    def hyphenate(self) -> str:
+        """Hyphenate ISBN with its registration group and registrant.
+
+        Returns:
+            Hyphenated ISBN
+
+        See Also:
+            :mod:`pyisbn.ranges`
+
+        """
+        # Deferred, as the range database isn't needed for most uses
+        from .ranges import hyphenate  # NoQA: PLC0415
+
+        return hyphenate(self.isbn)
+
+    @property
+    def group(self) -> str:
+        """Registration group, for example ``978-0``.
+
+        SBNs and ISBN-10s are reported in the ``978`` Bookland prefix, so that
+        all forms of an ISBN share a group.
+
+        See Also:
+            :mod:`pyisbn.ranges`
+
+        """
+        from .ranges import group  # NoQA: PLC0415
+
+        return group(self.isbn)
+
+    @property
+    def registrant(self) -> str:
+        """Registrant prefix, for example ``978-0-19``.
+
+        See Also:
+            :mod:`pyisbn.ranges`
+
+        """
+        from .ranges import registrant  # NoQA: PLC0415
+
+        return registrant(self.isbn)
+
+    def to_int(self) -> int:
+        """Pack ISBN in to an integer.
+
+        The packed form is always the ISBN-13 digits, so SBNs and ISBN-10s are
+        converted first.  As conversion recalculates the checksum, an invalid
+        SBN or ISBN-10 can't be packed.
+
+        Returns:
+            ISBN-13 digits as an integer
+
+        Raises:
+            IsbnError: When ISBN can't be packed
+
+        """
+        if len(self.isbn) == _constants.ISBN13_LENGTH:
+            return int(self.isbn)
+        if not self.validate():
+            raise IsbnError("invalid ISBN-10 can't be packed")
+        return int(self.convert())
+
+    @classmethod
+    def from_int(cls, value: int) -> Self:
+        """Unpack ISBN from an integer.
+
+        Args:
+            value: ISBN-13 digits as an integer
+
+        Returns:
+            Unpacked ISBN
+
+        Raises:
+            IsbnError: When ``value`` is out of range
+
+        """
+        if not 0 <= value < _constants.PACKED_LIMIT:
+            raise IsbnError(f"packed ISBN out of range {value!r}")
+        return cls(TIsbn(f"{value:013d}"))
 
     def to_url(self, site: str = "amazon", country: str | None = "us") -> str:
         """Generate a link to an online book site.
@@ -202,6 +362,8 @@ class Isbn10(Isbn):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, isbn: TIsbn) -> None:
         """Initialise a new ``Isbn10`` object.
 
@@ -214,6 +376,15 @@ class Isbn10(Isbn):
     def calculate_checksum(self) -> str:
         """Calculate ISBN-10 checksum.
 
+        Returns:
+            ISBN-10 checksum value
+
+        """
+        return super().calculate_checksum()
+
+    def _calculate_checksum(self) -> str:
+        """Calculate ISBN-10 checksum, without caching.
+
         Returns:
             ISBN-10 checksum value
 
@@ -232,7 +403,20 @@ class Isbn10(Isbn):
             ISBN-13 string
 
         """
-        return convert(self.isbn, code)
+        return super().convert(code)
+
+    @classmethod
+    def from_int(cls, value: int) -> Self:
+        """Unpack ISBN-10 from an integer.
+
+        Args:
+            value: ISBN-13 digits as an integer
+
+        Returns:
+            Unpacked ISBN-10
+
+        """
+        return cls(TIsbn(convert(Isbn13.from_int(value).isbn)))
 
 
 class Sbn(Isbn10):
@@ -243,6 +427,8 @@ class Sbn(Isbn10):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, sbn: TSbn) -> None:
         """Initialise a new ``Sbn`` object.
 
@@ -269,9 +455,7 @@ class Sbn(Isbn10):
             SBN checksum value
 
         """
-        return calculate_checksum(
-            self.isbn[: _constants.ISBN10_LENGTH_NO_CHECKSUM]
-        )
+        return super().calculate_checksum()
 
     def convert(self, code: str = "978") -> str:
         """Convert SBN to ISBN-13.
@@ -285,6 +469,25 @@ class Sbn(Isbn10):
         """
         return super().convert(code)
 
+    @classmethod
+    def from_int(cls, value: int) -> Self:
+        """Unpack SBN from an integer.
+
+        Args:
+            value: ISBN-13 digits as an integer
+
+        Returns:
+            Unpacked SBN
+
+        Raises:
+            IsbnError: When ``value`` has no SBN form
+
+        """
+        isbn = Isbn10.from_int(value).isbn
+        if not isbn.startswith("0"):
+            raise IsbnError(f"no SBN form for {value!r}")
+        return cls(TSbn(isbn[1:]))
+
 
 class Isbn13(Isbn):
     """Class for representing ISBN-13 objects.
@@ -294,6 +497,8 @@ class Isbn13(Isbn):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, isbn: TIsbn13) -> None:
         """Initialise a new ``Isbn13`` object.
 
@@ -306,6 +511,15 @@ class Isbn13(Isbn):
     def calculate_checksum(self) -> str:
         """Calculate ISBN-13 checksum.
 
+        Returns:
+            ISBN-13 checksum value
+
+        """
+        return super().calculate_checksum()
+
+    def _calculate_checksum(self) -> str:
+        """Calculate ISBN-13 checksum, without caching.
+
         Returns:
             ISBN-13 checksum value
 
@@ -327,4 +541,16 @@ class Isbn13(Isbn):
             ValueError: When ISBN-13 isn't a Bookland "978" ISBN
 
         """  # NoQA: DOC502
+        return super().convert()
+
+    def _convert(self, _code: str) -> str:
+        """Convert ISBN-13 to ISBN-10, without caching.
+
+        Args:
+            _code: Ignored, only for compatibility with ``Isbn``
+
+        Returns:
+            ISBN-10 string
+
+        """
         return convert(self.isbn)
@@ -0,0 +1,314 @@
+"""Packed storage of ISBNs.
+
+This module supports storing large numbers of ISBNs compactly, as 64-bit
+integers of their ISBN-13 digits, with ``IsbnArray``.
+
+SBNs and ISBN-10s are converted to their ISBN-13 form when they are packed,
+and ISBN-13 check digits are stored as given so that packed ISBNs can still be
+validated.
+"""
+# Copyright © 2026-2026  James Rowe <jnrowe@gmail.com>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# This file is part of pyisbn.
+#
+# pyisbn is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# pyisbn is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# pyisbn.  If not, see <http://www.gnu.org/licenses/>.
+
+import sys
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator
+from typing import Self, overload
+
+from . import _constants
+from ._exceptions import IsbnError
+from ._types import TIsbn
+from ._utils import isbn10_checksum, isbn13_checksum
+from .models import Isbn, Isbn13
+
+#: Type code of the backing array, an unsigned 64-bit integer
+TYPECODE = "Q"
+
+#: Scale of a Bookland prefix in a packed ISBN
+_BODY_SCALE = 10 ** (
+    _constants.ISBN13_LENGTH - _constants.BOOKLAND_PREFIX_LENGTH
+)
+#: Packed values with a Bookland prefix, which are the only ones that unpack
+#: to ``Isbn13`` objects
+_PACKED_RANGE = range(
+    int(min(_constants.BOOKLAND_PREFIXES)) * _BODY_SCALE,
+    (int(max(_constants.BOOKLAND_PREFIXES)) + 1) * _BODY_SCALE,
+)
+
+
+def pack(isbn: TIsbn | Isbn | int) -> int:
+    """Pack ISBN in to an integer.
+
+    Args:
+        isbn: SBN, ISBN-10, ISBN-13, ``Isbn`` object or packed ISBN
+
+    Returns:
+        ISBN-13 digits as an integer
+
+    Raises:
+        IsbnError: When ``isbn`` can't be packed, including packed ISBNs
+            without a Bookland prefix
+
+    """
+    if isinstance(isbn, int):
+        if isbn not in _PACKED_RANGE:
+            raise IsbnError(f"packed ISBN out of range {isbn!r}")
+        return isbn
+    if not isinstance(isbn, Isbn):
+        isbn = Isbn(isbn)
+    return isbn.to_int()
+
+
+def unpack(value: int) -> str:
+    """Unpack ISBN-13 string from an integer.
+
+    Args:
+        value: ISBN-13 digits as an integer
+
+    Returns:
+        ISBN-13 string
+
+    """
+    return f"{value:013d}"
+
+
+class IsbnArray:
+    """Compact container of packed ISBNs.
+
+    Each ISBN is stored as a 64-bit integer of its ISBN-13 digits, so an array
+    of a million ISBNs needs only eight megabytes.  ``Isbn13`` objects are
+    only created when elements are accessed.
+    """
+
+    __slots__ = ("_data", "_sorted")
+
+    def __init__(self, isbns: Iterable[TIsbn | Isbn | int] = ()) -> None:
+        """Initialise a new ``IsbnArray`` object.
+
+        Args:
+            isbns: SBNs, ISBN-10s, ISBN-13s, ``Isbn`` objects or packed ISBNs
+
+        """
+        self._data = array(TYPECODE, map(pack, isbns))
+        self._sorted = False
+
+    def __repr__(self) -> str:
+        """Self-documenting string representation.
+
+        Returns:
+            String to recreate ``IsbnArray`` object
+
+        """
+        return f"{self.__class__.__name__}({self.to_strings()!r})"
+
+    def __len__(self) -> int:
+        """Number of ISBNs in array.
+
+        Returns:
+            Length of array
+
+        """
+        return len(self._data)
+
+    @overload
+    def __getitem__(self, index: int) -> Isbn13: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Self: ...
+
+    def __getitem__(self, index: int | slice) -> Isbn13 | Self:
+        """Fetch ISBNs from array.
+
+        Args:
+            index: Position or slice of array
+
+        Returns:
+            ``Isbn13`` object, or ``IsbnArray`` for slices
+
+        """
+        if isinstance(index, slice):
+            arr = self.__class__()
+            arr._data = self._data[index]
+            return arr
+        return Isbn13.from_int(self._data[index])
+
+    def __iter__(self) -> Iterator[Isbn13]:
+        """Iterate over ISBNs in array.
+
+        Returns:
+            Iterator of ``Isbn13`` objects
+
+        """
+        return map(Isbn13.from_int, self._data)
+
+    def __contains__(self, isbn: object) -> bool:
+        """Test for ISBN in array.
+
+        Sorted arrays are searched with a bisection, otherwise a linear scan
+        of the packed values is made.
+
+        Args:
+            isbn: SBN, ISBN-10, ISBN-13, ``Isbn`` object or packed ISBN
+
+        Returns:
+            ``True`` if ``isbn`` is in the array
+
+        """
+        try:
+            value = pack(isbn)  # ty: ignore[invalid-argument-type]
+        except (IsbnError, TypeError):
+            return False
+        if self._sorted:
+            index = bisect_left(self._data, value)
+            return index < len(self._data) and self._data[index] == value
+        return value in self._data
+
+    def __eq__(self, other: object) -> bool:
+        """Compare arrays.
+
+        Args:
+            other: Object to compare with
+
+        Returns:
+            ``True`` if ``other`` contains the same ISBNs in the same order
+
+        """
+        if not isinstance(other, IsbnArray):
+            return NotImplemented
+        return self._data == other._data
+
+    __hash__ = None  # ty: ignore[invalid-assignment]
+
+    def append(self, isbn: TIsbn | Isbn | int) -> None:
+        """Add an ISBN to the end of the array.
+
+        Args:
+            isbn: SBN, ISBN-10, ISBN-13, ``Isbn`` object or packed ISBN
+
+        """
+        self._data.append(pack(isbn))
+        self._sorted = False
+
+    def extend(self, isbns: Iterable[TIsbn | Isbn | int]) -> None:
+        """Add ISBNs to the end of the array.
+
+        Args:
+            isbns: SBNs, ISBN-10s, ISBN-13s, ``Isbn`` objects or packed ISBNs
+
+        """
+        self._data.extend(map(pack, isbns))
+        self._sorted = False
+
+    def sort(self) -> None:
+        """Sort array in place.
+
+        Sorting also enables faster membership tests.
+        """
+        self._data = array(TYPECODE, sorted(self._data))
+        self._sorted = True
+
+    def validate(self) -> list[bool]:
+        """Validate ISBNs.
+
+        Returns:
+            ``True`` for each ISBN that is valid
+
+        """
+        return [
+            isbn.startswith(_constants.BOOKLAND_PREFIXES_BYTES)
+            and chr(isbn[-1]) == isbn13_checksum(isbn)
+            for isbn in map(b"%013d".__mod__, self._data)
+        ]
+
+    def convert(self) -> list[str]:
+        """Convert ISBN-13s to ISBN-10s.
+
+        Returns:
+            ISBN-10 for each ISBN, empty for ISBNs that can't be converted
+
+        """
+        prefix = _constants.BOOKLAND_PREFIXES_BYTES[0]
+        body = slice(
+            _constants.BOOKLAND_PREFIX_LENGTH, _constants.ISBN13_LENGTH - 1
+        )
+        return [
+            isbn[body].decode() + isbn10_checksum(isbn[body])
+            if isbn.startswith(prefix)
+            else ""
+            for isbn in map(b"%013d".__mod__, self._data)
+        ]
+
+    def to_ints(self) -> list[int]:
+        """Fetch packed ISBNs.
+
+        Returns:
+            ISBN-13 digits as integers
+
+        """
+        return self._data.tolist()
+
+    def to_strings(self) -> list[str]:
+        """Fetch ISBN-13 strings.
+
+        Returns:
+            ISBN-13 strings
+
+        """
+        return list(map(unpack, self._data))
+
+    def tobytes(self) -> bytes:
+        """Serialise array.
+
+        The packed values are stored as little-endian 64-bit integers,
+        regardless of the host byte order.
+
+        Returns:
+            Serialised array
+
+        """
+        if sys.byteorder == "big":
+            data = array(TYPECODE, self._data)
+            data.byteswap()
+            return data.tobytes()
+        return self._data.tobytes()
+
+    @classmethod
+    def frombytes(cls, data: bytes) -> Self:
+        """Deserialise array.
+
+        Args:
+            data: Serialised array, from :meth:`tobytes`
+
+        Returns:
+            Deserialised array
+
+        Raises:
+            IsbnError: When ``data`` contains out of range values, including
+                values without a Bookland prefix
+
+        """
+        arr = cls()
+        arr._data.frombytes(data)
+        if sys.byteorder == "big":
+            arr._data.byteswap()
+        if arr._data and not (
+            min(arr._data) in _PACKED_RANGE and max(arr._data) in _PACKED_RANGE
+        ):
+            raise IsbnError("packed ISBN out of range")
+        return arr
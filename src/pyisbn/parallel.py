@@ -0,0 +1,221 @@
+"""Parallel interface to ``pyisbn``.
+
+This module supports processing large files of ISBNs, one per line, across
+multiple processes with ``map_lines()`` and ``validate_file()``.
+
+Files are split in to byte ranges on line boundaries, and each range is read
+and processed by a worker process.  Results are returned in input order, and
+only a few ranges are in flight at any time, so memory use doesn't grow with
+the size of the input.
+
+.. note::
+
+    Functions given to ``map_chunks()`` and ``map_lines()`` must be picklable,
+    which in practice means they must be defined at the top level of a module.
+"""
+# Copyright © 2026-2026  James Rowe <jnrowe@gmail.com>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# This file is part of pyisbn.
+#
+# pyisbn is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# pyisbn is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# pyisbn.  If not, see <http://www.gnu.org/licenses/>.
+
+import io
+import os
+import pathlib
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import partial
+from itertools import pairwise
+from typing import TypeVar
+
+from .batch import validate_many
+
+T = TypeVar("T")
+
+#: Default size of byte ranges given to workers
+CHUNK_SIZE = 1 << 22
+
+
+def chunk_ranges(
+    path: pathlib.Path, chunk_size: int = CHUNK_SIZE
+) -> list[tuple[int, int]]:
+    """Split a file in to byte ranges on line boundaries.
+
+    Args:
+        path: File to split
+        chunk_size: Approximate size of each range
+
+    Returns:
+        Start and end offsets for each range
+
+    """
+    size = path.stat().st_size
+    bounds = [0]
+    with path.open("rb") as f:
+        for offset in range(chunk_size, size, chunk_size):
+            if offset <= bounds[-1]:
+                # Previous boundary search passed this offset already
+                continue
+            f.seek(offset)
+            f.readline()
+            bounds.append(f.tell())
+    if bounds[-1] < size:
+        bounds.append(size)
+    return list(pairwise(bounds))
+
+
+def _read_chunk(
+    func: Callable[[list[str]], list[T]],
+    path: pathlib.Path,
+    start: int,
+    end: int,
+) -> list[T]:
+    """Process lines from a byte range of a file.
+
+    Lines are split as they are when reading the file in text mode, ignoring
+    the other Unicode line boundaries that :meth:`str.splitlines` uses.
+
+    Args:
+        func: Function to process lines with
+        path: File to read
+        start: Offset to start reading at
+        end: Offset to stop reading at
+
+    Returns:
+        Result of ``func``
+
+    """
+    with path.open("rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+    with io.TextIOWrapper(
+        io.BytesIO(data), encoding="utf-8", errors="replace"
+    ) as f:
+        text = f.read()
+    return func(text.removesuffix("\n").split("\n"))
+
+
+def map_chunks(
+    func: Callable[[list[str]], list[T]],
+    path: pathlib.Path,
+    *,
+    jobs: int | None = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> Iterator[T]:
+    """Process lines of a file in bulk across multiple processes.
+
+    Args:
+        func: Function to process a list of lines, without line endings,
+            returning a result for each line
+        path: File to read
+        jobs: Number of worker processes, defaulting to the number of CPUs
+        chunk_size: Approximate size of byte ranges given to workers
+
+    Yields:
+        Results of ``func``, in input order
+
+    """
+    ranges = chunk_ranges(path, chunk_size)
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1:
+        for start, end in ranges:
+            yield from _read_chunk(func, path, start, end)
+        return
+
+    executor = ProcessPoolExecutor(jobs)
+    pending: deque[Future[list[T]]] = deque()
+    try:
+        for start, end in ranges:
+            pending.append(executor.submit(_read_chunk, func, path, start, end))
+            # Keep every worker busy, without reading ahead indefinitely
+            if len(pending) > jobs * 2:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+def _map(func: Callable[[str], T], lines: list[str]) -> list[T]:
+    """Apply function to each line.
+
+    Args:
+        func: Function to process a line
+        lines: Lines to process
+
+    Returns:
+        Result of ``func`` for each line
+
+    """
+    return list(map(func, lines))
+
+
+def map_lines(
+    func: Callable[[str], T],
+    path: pathlib.Path,
+    *,
+    jobs: int | None = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> Iterator[T]:
+    """Process lines of a file across multiple processes.
+
+    Args:
+        func: Function to process a line, without line ending
+        path: File to read
+        jobs: Number of worker processes, defaulting to the number of CPUs
+        chunk_size: Approximate size of byte ranges given to workers
+
+    Returns:
+        Iterator of results of ``func``, in input order
+
+    """
+    return map_chunks(
+        partial(_map, func), path, jobs=jobs, chunk_size=chunk_size
+    )
+
+
+def _validate_lines(lines: list[str]) -> list[bool]:
+    """Validate ISBNs from lines, ignoring surrounding whitespace.
+
+    Args:
+        lines: Lines to process
+
+    Returns:
+        ``True`` for each line that contains a valid ISBN
+
+    """
+    return validate_many([s.strip() for s in lines])
+
+
+def validate_file(
+    path: pathlib.Path,
+    *,
+    jobs: int | None = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> Iterator[bool]:
+    """Validate ISBNs from a file, one per line.
+
+    Args:
+        path: File to read
+        jobs: Number of worker processes, defaulting to the number of CPUs
+        chunk_size: Approximate size of byte ranges given to workers
+
+    Returns:
+        Iterator of ``True`` for each line that contains a valid ISBN, in input
+        order
+
+    """
+    return map_chunks(_validate_lines, path, jobs=jobs, chunk_size=chunk_size)
@@ -0,0 +1,593 @@
+"""Registration group and registrant ranges for ``pyisbn``.
+
+This module supports splitting ISBNs in to their registration group,
+registrant and publication elements with ``split()``, and hyphenating them
+with ``hyphenate()``.
+
+The ranges are taken from the International ISBN Agency's `RangeMessage
+<https://www.isbn-international.org/range_file_generation>`__ data, which is
+bundled with ``pyisbn`` as a compiled database.  The database is memory-mapped
+on first use, so importing ``pyisbn`` doesn't pay for it.  Updated data can be
+converted with ``parse_range_message()``, and then written with ``dump()`` and
+``dump_compiled()``.
+
+The compiled database is a sorted array of fixed-width records, one for each
+registrant range, keyed on the first twelve digits of an ISBN-13.  A lookup is
+a single binary search over the record keys, which are read in place from the
+map.
+"""
+# Copyright © 2026-2026  James Rowe <jnrowe@gmail.com>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# This file is part of pyisbn.
+#
+# pyisbn is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# pyisbn is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# pyisbn.  If not, see <http://www.gnu.org/licenses/>.
+
+import mmap
+import pathlib
+import sys
+from array import array
+from bisect import bisect_right
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from functools import cache, partial
+from typing import NamedTuple, Self
+
+from . import _constants
+from ._exceptions import IsbnError
+from ._types import TIsbn
+from ._utils import isbn_cleanse
+
+#: Width of the ranges defined in RangeMessage data
+RANGE_WIDTH = 7
+#: Longest registration group identifier
+GROUP_MAX_LENGTH = 5
+#: Magic bytes at the start of compiled range databases
+MAGIC = b"PYISBNR\x01"
+#: Type code for the unsigned 64-bit integers of compiled range databases
+TYPECODE = "Q"
+#: Integers in each compiled range record; start, end and packed lengths
+RECORD_FIELDS = 3
+
+#: Location of bundled range data
+RANGES_FILE = pathlib.Path(__file__).with_name("ranges.dat")
+#: Location of bundled compiled range database
+DATABASE_FILE = pathlib.Path(__file__).with_name("ranges.bin")
+
+_KEY_LENGTH = _constants.ISBN13_LENGTH_NO_CHECKSUM
+_ITEM_SIZE = array(TYPECODE).itemsize
+_HEADER_SIZE = len(MAGIC) + _ITEM_SIZE
+
+
+class IsbnParts(NamedTuple):
+    """Elements of an ISBN."""
+
+    #: Bookland prefix, empty for ISBN-10s
+    prefix: str
+    #: Registration group element
+    group: str
+    #: Registrant element
+    registrant: str
+    #: Publication element
+    publication: str
+    #: Check digit
+    checksum: str
+
+
+class GroupRanges(NamedTuple):
+    """Registration group definition."""
+
+    #: Bookland prefix and group, for example ``978-0``
+    prefix: str
+    #: Registrant ranges, for example ``00-19``
+    ranges: list[str]
+    #: Registration agency name
+    agency: str
+
+
+def _isbn13(isbn: str) -> str:
+    """Add Bookland prefix to cleansed ISBN, if necessary.
+
+    The check digit isn't used for range lookups, so it isn't recalculated.
+
+    Args:
+        isbn: Cleansed SBN, ISBN-10 or ISBN-13
+
+    Returns:
+        ISBN-13, with the original check digit
+
+    """
+    if len(isbn) == _constants.ISBN13_LENGTH:
+        return isbn
+    return _constants.BOOKLAND_PREFIXES[0] + isbn
+
+
+def _group_records(
+    index: int, prefix: str, ranges: list[str]
+) -> Iterator[tuple[int, int, int]]:
+    """Build records covering a registration group.
+
+    Gaps between the defined ranges are filled with records of zero registrant
+    length, so that undefined ranges can be told apart from undefined groups.
+
+    Args:
+        index: Position of group in the database
+        prefix: Bookland prefix and group digits
+        ranges: Registrant ranges
+
+    Yields:
+        Start, end and packed lengths of each record
+
+    """
+    group_length = len(prefix) - _constants.BOOKLAND_PREFIX_LENGTH
+    start = int(prefix.ljust(_KEY_LENGTH, "0"))
+    for first, last in sorted(r.split("-") for r in ranges):
+        low = int((prefix + first).ljust(_KEY_LENGTH, "0"))
+        high = int((prefix + last).ljust(_KEY_LENGTH, "9"))
+        if low > start:
+            yield start, low - 1, group_length | index << 16
+        yield low, high, group_length | len(first) << 8 | index << 16
+        start = high + 1
+    end = int(prefix.ljust(_KEY_LENGTH, "9"))
+    if start <= end:
+        yield start, end, group_length | index << 16
+
+
+def build(groups: Iterable[GroupRanges]) -> bytes:
+    """Compile range database.
+
+    Args:
+        groups: Registration group definitions
+
+    Returns:
+        Compiled range database
+
+    """
+    records = []
+    agencies = []
+    for index, (prefix, ranges, agency) in enumerate(groups):
+        records.extend(_group_records(index, prefix.replace("-", ""), ranges))
+        agencies.append(agency)
+    data = array(TYPECODE, [len(records)])
+    for record in sorted(records):
+        data.extend(record)
+    if sys.byteorder == "big":
+        data.byteswap()
+    return MAGIC + data.tobytes() + "\n".join(agencies).encode()
+
+
+def _native(data: memoryview) -> memoryview:
+    """Read little-endian integers in host byte order.
+
+    Args:
+        data: Little-endian unsigned 64-bit integers
+
+    Returns:
+        Integers, read in place unless the host is big-endian
+
+    """
+    if sys.byteorder == "big":
+        swapped = array(TYPECODE)
+        swapped.frombytes(data)
+        swapped.byteswap()
+        return memoryview(swapped)
+    return data.cast(TYPECODE)
+
+
+class RangeIndex:
+    """Index of registration groups and their registrant ranges."""
+
+    __slots__ = ("_agencies", "_ends", "_groups", "_info", "_starts")
+
+    def __init__(self, data: bytes | mmap.mmap) -> None:
+        """Initialise a new ``RangeIndex`` object.
+
+        Args:
+            data: Compiled range database
+
+        Raises:
+            ValueError: When ``data`` isn't a compiled range database
+
+        """
+        if data[: len(MAGIC)] != MAGIC:
+            raise ValueError("not a compiled range database")
+        view = memoryview(data)
+        (count,) = _native(view[len(MAGIC) : _HEADER_SIZE])
+        end = _HEADER_SIZE + count * RECORD_FIELDS * _ITEM_SIZE
+        records = _native(view[_HEADER_SIZE:end])
+        self._starts = records[0::RECORD_FIELDS]
+        self._ends = records[1::RECORD_FIELDS]
+        self._info = records[2::RECORD_FIELDS]
+        self._agencies = bytes(view[end:]).decode().split("\n")
+        self._groups: dict[str, str] | None = None
+
+    @classmethod
+    def from_groups(cls, groups: Iterable[GroupRanges]) -> Self:
+        """Build index from registration group definitions.
+
+        Args:
+            groups: Registration group definitions
+
+        Returns:
+            Range index
+
+        """
+        return cls(build(groups))
+
+    def __len__(self) -> int:
+        """Number of registration groups in index.
+
+        Returns:
+            Number of registration groups
+
+        """
+        return len(self._agencies)
+
+    def _lookup(self, isbn: str) -> tuple[int, int, int]:
+        """Find registrant range for ISBN-13.
+
+        Args:
+            isbn: Cleansed ISBN-13
+
+        Returns:
+            Group length, registrant length and group index
+
+        Raises:
+            IsbnError: When ISBN isn't in a defined registration group or
+                registrant range
+
+        """
+        value = int(isbn[:_KEY_LENGTH])
+        index = bisect_right(self._starts, value) - 1
+        if index < 0 or value > self._ends[index]:
+            raise IsbnError("undefined registration group")
+        info = self._info[index]
+        if not info & 0xFF00:
+            raise IsbnError("undefined registrant range")
+        return info & 0xFF, info >> 8 & 0xFF, info >> 16
+
+    def _group_index(self) -> dict[str, str]:
+        """Map registration group digits to their prefixes.
+
+        The map is only built on first use.
+
+        Returns:
+            Bookland prefix and group digits, mapped to hyphenated prefixes
+
+        """
+        if self._groups is None:
+            length = _constants.BOOKLAND_PREFIX_LENGTH
+            self._groups = {}
+            for start, info in zip(self._starts, self._info, strict=True):
+                key = f"{start:0{_KEY_LENGTH}d}"[: length + (info & 0xFF)]
+                self._groups[key] = f"{key[:length]}-{key[length:]}"
+        return self._groups
+
+    def group(self, isbn: TIsbn) -> str:
+        """Find registration group for ISBN.
+
+        Groups are prefix-free, so this is a dictionary probe for each
+        possible group length instead of a search of the registrant ranges.
+
+        Args:
+            isbn: SBN, ISBN-10 or ISBN-13
+
+        Returns:
+            Bookland prefix and registration group, for example ``978-0``
+
+        Raises:
+            IsbnError: When ISBN isn't in a defined registration group
+
+        """
+        isbn13 = _isbn13(isbn_cleanse(isbn))
+        groups = self._group_index()
+        for length in range(
+            _constants.BOOKLAND_PREFIX_LENGTH + 1,
+            _constants.BOOKLAND_PREFIX_LENGTH + GROUP_MAX_LENGTH + 1,
+        ):
+            if (group := groups.get(isbn13[:length])) is not None:
+                return group
+        raise IsbnError("undefined registration group")
+
+    def registrant(self, isbn: TIsbn) -> str:
+        """Find registrant for ISBN.
+
+        Args:
+            isbn: SBN, ISBN-10 or ISBN-13
+
+        Returns:
+            Bookland prefix, registration group and registrant, for example
+            ``978-0-19``
+
+        """
+        isbn13 = _isbn13(isbn_cleanse(isbn))
+        group_length, registrant_length, _ = self._lookup(isbn13)
+        group = _constants.BOOKLAND_PREFIX_LENGTH + group_length
+        return "-".join((
+            isbn13[: _constants.BOOKLAND_PREFIX_LENGTH],
+            isbn13[_constants.BOOKLAND_PREFIX_LENGTH : group],
+            isbn13[group : group + registrant_length],
+        ))
+
+    def agency(self, isbn: TIsbn) -> str:
+        """Find registration agency for ISBN.
+
+        Args:
+            isbn: SBN, ISBN-10 or ISBN-13
+
+        Returns:
+            Registration agency name
+
+        """
+        return self._agencies[self._lookup(_isbn13(isbn_cleanse(isbn)))[2]]
+
+    def split(self, isbn: TIsbn) -> IsbnParts:
+        """Split ISBN in to its elements.
+
+        Args:
+            isbn: SBN, ISBN-10 or ISBN-13
+
+        Returns:
+            Elements of ISBN, in the same form as ``isbn``
+
+        """
+        isbn = isbn_cleanse(isbn)
+        isbn13 = _isbn13(isbn)
+        group_length, registrant_length, _ = self._lookup(isbn13)
+        body = isbn13[_constants.BOOKLAND_PREFIX_LENGTH : -1]
+        rest = body[group_length:]
+        return IsbnParts(
+            isbn[: len(isbn) - _constants.ISBN10_LENGTH],
+            body[:group_length],
+            rest[:registrant_length],
+            rest[registrant_length:],
+            isbn[-1],
+        )
+
+    def hyphenate(self, isbn: TIsbn) -> str:
+        """Hyphenate ISBN.
+
+        Args:
+            isbn: SBN, ISBN-10 or ISBN-13
+
+        Returns:
+            ISBN with its elements separated by hyphens
+
+        """
+        return "-".join(filter(None, self.split(isbn)))
+
+
+def parse_range_message(data: bytes) -> Iterator[GroupRanges]:
+    """Parse RangeMessage XML data.
+
+    Args:
+        data: RangeMessage XML
+
+    Yields:
+        Registration group definitions
+
+    """
+    # Only needed when regenerating data, so kept out of the import path
+    from xml.etree import ElementTree  # NoQA: PLC0415, S405
+
+    root = ElementTree.fromstring(data)  # NoQA: S314
+    for group in root.iterfind("RegistrationGroups/Group"):
+        ranges = []
+        for rule in group.iterfind("Rules/Rule"):
+            length = int(rule.findtext("Length", "0"))
+            if length:
+                start, end = rule.findtext("Range", "").split("-")
+                ranges.append(f"{start[:length]}-{end[:length]}")
+        yield GroupRanges(
+            group.findtext("Prefix", ""), ranges, group.findtext("Agency", "")
+        )
+
+
+def read(path: pathlib.Path) -> Iterator[GroupRanges]:
+    """Read range data file.
+
+    Args:
+        path: File to read, as written by ``dump()``
+
+    Yields:
+        Registration group definitions
+
+    """
+    with path.open(encoding="utf-8") as f:
+        for line in f:
+            if line.startswith("#"):
+                continue
+            prefix, ranges, agency = line.rstrip("\n").split("\t")
+            yield GroupRanges(
+                prefix, ranges.split(",") if ranges else [], agency
+            )
+
+
+def dump(
+    groups: Iterable[GroupRanges], path: pathlib.Path, header: str = ""
+) -> None:
+    """Write range data file.
+
+    Args:
+        groups: Registration group definitions
+        path: File to write
+        header: Comment to write at the start of the file
+
+    """
+    with path.open("w", encoding="utf-8") as f:
+        f.writelines(f"# {line}\n" for line in header.splitlines())
+        for prefix, ranges, agency in groups:
+            f.write(f"{prefix}\t{','.join(ranges)}\t{agency}\n")
+
+
+def dump_compiled(groups: Iterable[GroupRanges], path: pathlib.Path) -> None:
+    """Write compiled range database.
+
+    Args:
+        groups: Registration group definitions
+        path: File to write
+
+    """
+    path.write_bytes(build(groups))
+
+
+def load(path: pathlib.Path) -> RangeIndex:
+    """Load compiled range database.
+
+    The file is memory-mapped, so only the pages touched by lookups are read.
+
+    Args:
+        path: File to read, as written by ``dump_compiled()``
+
+    Returns:
+        Range index
+
+    """
+    with path.open("rb") as f:
+        return RangeIndex(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+
+@cache
+def default_index() -> RangeIndex:
+    """Load bundled range database.
+
+    The database is only mapped on first use.
+
+    Returns:
+        Range index
+
+    """
+    return load(DATABASE_FILE)
+
+
+def split(isbn: TIsbn) -> IsbnParts:
+    """Split ISBN in to its elements, using bundled range data.
+
+    Args:
+        isbn: SBN, ISBN-10 or ISBN-13
+
+    Returns:
+        Elements of ISBN, in the same form as ``isbn``
+
+    """
+    return default_index().split(isbn)
+
+
+def hyphenate(isbn: TIsbn) -> str:
+    """Hyphenate ISBN, using bundled range data.
+
+    Args:
+        isbn: SBN, ISBN-10 or ISBN-13
+
+    Returns:
+        ISBN with its elements separated by hyphens
+
+    """
+    return default_index().hyphenate(isbn)
+
+
+def group(isbn: TIsbn) -> str:
+    """Find registration group for ISBN, using bundled range data.
+
+    Args:
+        isbn: SBN, ISBN-10 or ISBN-13
+
+    Returns:
+        Bookland prefix and registration group
+
+    """
+    return default_index().group(isbn)
+
+
+def registrant(isbn: TIsbn) -> str:
+    """Find registrant for ISBN, using bundled range data.
+
+    Args:
+        isbn: SBN, ISBN-10 or ISBN-13
+
+    Returns:
+        Bookland prefix, registration group and registrant
+
+    """
+    return default_index().registrant(isbn)
+
+
+def _hyphenate(index: RangeIndex, isbn: TIsbn) -> str:
+    """Hyphenate ISBN, without raising errors for malformed input.
+
+    Args:
+        index: Range index to use
+        isbn: SBN, ISBN-10 or ISBN-13
+
+    Returns:
+        Hyphenated ISBN, empty for malformed or undefined input
+
+    """
+    try:
+        return index.hyphenate(isbn)
+    except IsbnError:
+        return ""
+
+
+def hyphenate_many(
+    isbns: Iterable[TIsbn], index: RangeIndex | None = None
+) -> list[str]:
+    """Hyphenate ISBNs.
+
+    Args:
+        isbns: SBNs, ISBN-10s or ISBN-13s
+        index: Range index to use, defaulting to the bundled data
+
+    Returns:
+        Hyphenated ISBNs, empty for malformed or undefined input
+
+    """
+    return list(map(partial(_hyphenate, index or default_index()), isbns))
+
+
+def _group(index: RangeIndex, isbn: TIsbn) -> str:
+    """Find registration group, without raising errors for malformed input.
+
+    Args:
+        index: Range index to use
+        isbn: SBN, ISBN-10 or ISBN-13
+
+    Returns:
+        Registration group, empty for malformed or undefined input
+
+    """
+    try:
+        return index.group(isbn)
+    except IsbnError:
+        return ""
+
+
+def group_counts(
+    isbns: Iterable[TIsbn], index: RangeIndex | None = None
+) -> Counter[str]:
+    """Count ISBNs in each registration group.
+
+    ``isbns`` is consumed lazily, so it may be a generator over a source
+    that doesn't fit in memory.
+
+    Args:
+        isbns: SBNs, ISBN-10s or ISBN-13s
+        index: Range index to use, defaulting to the bundled data
+
+    Returns:
+        Number of ISBNs in each registration group, with malformed or
+        undefined input counted under an empty key
+
+    """
+    return Counter(map(partial(_group, index or default_index()), isbns))
@@ -0,0 +1,257 @@
+"""Error correcting suggestions for ``pyisbn``.
+
+This module supports finding the valid ISBNs that an invalid ISBN may have
+been mistyped from with ``suggest()``, and for many ISBNs at once with
+``suggest_many()``.
+
+Two kinds of error are corrected: a single substituted character, and two
+swapped adjacent characters.  Together they account for roughly nine in ten
+transcription errors.  Swaps are ranked first, as an invalid ISBN has few
+candidate swaps but many candidate substitutions, making any one swap that
+produces a valid ISBN the more likely correction.
+
+Candidates are found without validating each one.  The weighted sum of a
+valid ISBN, including its check digit, is zero modulo the checksum modulus.
+A substitution changes one term of that sum, so the only replacement value
+that repairs each position follows directly from the modular inverse of its
+weight.  A swap changes two terms, by an amount that depends only on the
+swapped digits and their weights.  Finding every suggestion for an ISBN is
+therefore a single pass over its characters.
+"""
+# Copyright © 2026-2026  James Rowe <jnrowe@gmail.com>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# This file is part of pyisbn.
+#
+# pyisbn is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# pyisbn is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# pyisbn.  If not, see <http://www.gnu.org/licenses/>.
+
+from collections.abc import Iterable
+from operator import mul
+from typing import NamedTuple
+
+from . import _constants
+
+#: Kind for two adjacent characters being swapped
+TRANSPOSITION = "transposition"
+#: Kind for a single character being replaced
+SUBSTITUTION = "substitution"
+
+#: Value for characters that can't appear at their position
+_UNREADABLE = -1
+_DIGITS = {str(n): n for n in range(10)}
+_ISBN10_WEIGHTS = (*_constants.ISBN10_WEIGHTS, _constants.ISBN10_LENGTH)
+_ISBN13_WEIGHTS = (*_constants.ISBN13_WEIGHTS, 1)
+#: Weights, modular inverses of the weights, modulus and check characters, by
+#: ISBN length
+_SCHEMES = {
+    _constants.ISBN10_LENGTH: (
+        _ISBN10_WEIGHTS,
+        [
+            pow(w, -1, _constants.ISBN10_CHECKSUM_MODULUS)
+            for w in _ISBN10_WEIGHTS
+        ],
+        _constants.ISBN10_CHECKSUM_MODULUS,
+        _constants.ISBN10_CHECKSUMS,
+    ),
+    _constants.ISBN13_LENGTH: (
+        _ISBN13_WEIGHTS,
+        [
+            pow(w, -1, _constants.ISBN13_CHECKSUM_MODULUS)
+            for w in _ISBN13_WEIGHTS
+        ],
+        _constants.ISBN13_CHECKSUM_MODULUS,
+        _constants.ISBN13_CHECKSUMS,
+    ),
+}
+
+
+class Suggestion(NamedTuple):
+    """Valid ISBN that an invalid ISBN may have been mistyped from."""
+
+    #: Suggested ISBN, in the same cleansed form as the invalid ISBN
+    isbn: str
+    #: Kind of error corrected
+    kind: str
+    #: Offset of the first changed character in the cleansed ISBN
+    position: int
+
+
+def _values(isbn: str) -> list[int]:
+    """Read character values.
+
+    Args:
+        isbn: Cleansed ISBN-10 or ISBN-13
+
+    Returns:
+        Value of each character, :data:`_UNREADABLE` for characters that
+        can't appear at their position
+
+    """
+    checks = _SCHEMES[len(isbn)][3]
+    values = [_DIGITS.get(c, _UNREADABLE) for c in isbn[:-1]]
+    values.append(checks.find(isbn[-1]))
+    return values
+
+
+def _substitutions(
+    values: list[int], positions: Iterable[int], total: int
+) -> list[tuple[int, int]]:
+    """Find substitutions that zero a weighted sum.
+
+    Args:
+        values: Value of each character
+        positions: Positions to try substituting
+        total: Weighted sum of ``values``
+
+    Returns:
+        Position and replacement value of each substitution
+
+    """
+    weights, inverses, modulus, _ = _SCHEMES[len(values)]
+    last = len(values) - 1
+    result = []
+    for i in positions:
+        value = (weights[i] * values[i] - total) * inverses[i] % modulus
+        if value < len(_DIGITS) or i == last:
+            result.append((i, value))
+    return result
+
+
+def _transpositions(values: list[int], start: int, total: int) -> list[int]:
+    """Find adjacent transpositions that zero a weighted sum.
+
+    Args:
+        values: Value of each character
+        start: First position that may be moved
+        total: Weighted sum of ``values``
+
+    Returns:
+        Position of the first character of each transposition
+
+    """
+    weights, _, modulus, _ = _SCHEMES[len(values)]
+    result = []
+    for i in range(start, len(values) - 1):
+        a, b = values[i], values[i + 1]
+        delta = (weights[i] - weights[i + 1]) * (b - a)
+        if (
+            a != b
+            and max(a, b) < len(_DIGITS)
+            and (total + delta) % modulus == 0
+        ):
+            result.append(i)
+    return result
+
+
+def _misplaced_check(isbn: str) -> list[int]:
+    """Find a transposition that moves an ``X`` in to the check position.
+
+    Args:
+        isbn: Cleansed ISBN-10 or ISBN-13, with a single unreadable character
+
+    Returns:
+        Position of the transposition, if it produces a valid checksum
+
+    """
+    weights, _, modulus, _ = _SCHEMES[len(isbn)]
+    swapped = _values(isbn[:-2] + isbn[-1] + isbn[-2])
+    if _UNREADABLE in swapped or sum(map(mul, weights, swapped)) % modulus:
+        return []
+    return [len(isbn) - 2]
+
+
+def _edits(isbn: str, start: int) -> list[tuple[str, int, str]]:
+    """Find edits that produce a valid checksum.
+
+    Args:
+        isbn: Cleansed ISBN-10 or ISBN-13
+        start: First position that may be edited
+
+    Returns:
+        Kind, position and replacement characters of each edit
+
+    """
+    values = _values(isbn)
+    weights, _, modulus, checks = _SCHEMES[len(isbn)]
+    total = sum(map(mul, weights, values))
+    unreadable = [i for i, v in enumerate(values) if v == _UNREADABLE]
+    if len(unreadable) > 1:
+        return []
+    if unreadable:
+        # Only editing the unreadable character can produce a valid ISBN
+        positions = unreadable
+        swaps = _misplaced_check(isbn) if isbn[-2] == "X" else []
+    elif total % modulus:
+        positions = range(start, len(isbn))
+        swaps = _transpositions(values, start, total)
+    elif isbn.startswith(_constants.BOOKLAND_PREFIXES) or len(isbn) == (
+        _constants.ISBN10_LENGTH
+    ):
+        return []
+    else:
+        # ISBN-13 transpositions of digits five apart keep a valid checksum,
+        # so a mangled Bookland prefix may still be repairable
+        positions = []
+        swaps = _transpositions(values, start, total)
+    return [(TRANSPOSITION, i, isbn[i + 1] + isbn[i]) for i in swaps] + [
+        (SUBSTITUTION, i, checks[v])
+        for i, v in _substitutions(values, positions, total)
+    ]
+
+
+def suggest(isbn: str) -> list[Suggestion]:
+    """Suggest corrections for an invalid ISBN.
+
+    Suggestions are ranked from most to least likely, with swapped characters
+    before substituted characters and earlier positions before later ones.
+    Each suggestion is a distinct ISBN, so no two suggestions share an ISBN-10
+    or ISBN-13 form.
+
+    Args:
+        isbn: Invalid SBN, ISBN-10 or ISBN-13
+
+    Returns:
+        Valid ISBNs that differ from ``isbn`` by a single substitution or
+        transposition, empty for valid or unrepairable input
+
+    """
+    cleansed = isbn.translate(_constants.DASHES_TABLE).upper()
+    # SBNs are checked as ISBN-10s, but the implied leading zero can't be edited
+    start = int(len(cleansed) == _constants.SBN_LENGTH)
+    body = "0" * start + cleansed
+    if len(body) not in _SCHEMES:
+        return []
+    isbn13 = len(body) == _constants.ISBN13_LENGTH
+    result = []
+    for kind, position, replacement in _edits(body, start):
+        candidate = (
+            body[:position] + replacement + body[position + len(replacement) :]
+        )
+        if isbn13 and not candidate.startswith(_constants.BOOKLAND_PREFIXES):
+            continue
+        result.append(Suggestion(candidate[start:], kind, position - start))
+    return result
+
+
+def suggest_many(isbns: Iterable[str]) -> list[list[Suggestion]]:
+    """Suggest corrections for many invalid ISBNs.
+
+    Args:
+        isbns: Invalid SBNs, ISBN-10s or ISBN-13s
+
+    Returns:
+        Suggestions for each ISBN, as returned by :func:`suggest`
+
+    """
+    return list(map(suggest, isbns))
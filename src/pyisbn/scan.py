@@ -0,0 +1,126 @@
+"""Memory-mapped scanning of ISBN files.
+
+This module supports finding invalid records in large files of ISBNs, one per
+line, with ``scan_file()``.
+
+The file is memory-mapped and walked as ``bytes``, so records are never decoded
+to ``str``.  Dashes are stripped and checksums calculated at the byte level,
+which means only ASCII digits and UTF-8 encoded dashes are supported.
+"""
+# Copyright © 2026-2026  James Rowe <jnrowe@gmail.com>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# This file is part of pyisbn.
+#
+# pyisbn is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# pyisbn is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# pyisbn.  If not, see <http://www.gnu.org/licenses/>.
+
+import mmap
+import pathlib
+from collections.abc import Iterator
+from operator import mul
+
+from . import _constants
+
+#: Size of windows split from the buffer at once
+WINDOW_SIZE = 1 << 20
+
+# Including the check digit in the weighted sum means a valid ISBN sums to
+# zero, and the ASCII offset of each digit cancels out for both moduli
+_ISBN10_WEIGHTS = (*_constants.ISBN10_WEIGHTS, _constants.ISBN10_LENGTH)
+_ISBN13_WEIGHTS = (*_constants.ISBN13_WEIGHTS, 1)
+#: Byte whose digit value is ten, for use as an ``X`` check digit
+_ISBN10_TEN = b":"
+
+
+def _valid(record: bytes) -> bool:  # NoQA: C901
+    """Validate a single record.
+
+    Args:
+        record: SBN, ISBN-10 or ISBN-13 without surrounding whitespace
+
+    Returns:
+        ``True`` if ``record`` is a valid ISBN
+
+    """
+    if record.isascii():
+        record = record.replace(b"-", b"")
+    else:
+        for dash in _constants.DASHES_BYTES:
+            record = record.replace(dash, b"")
+    if len(record) == _constants.SBN_LENGTH:
+        record = b"0" + record
+    match len(record):
+        case _constants.ISBN13_LENGTH if record.isdigit():
+            return record.startswith(
+                _constants.BOOKLAND_PREFIXES_BYTES
+            ) and not (
+                sum(map(mul, _ISBN13_WEIGHTS, record))
+                % _constants.ISBN13_CHECKSUM_MODULUS
+            )
+        case _constants.ISBN10_LENGTH if record[:-1].isdigit():
+            if record[-1] in b"Xx":
+                record = record[:-1] + _ISBN10_TEN
+            elif not record[-1:].isdigit():
+                return False
+            return not (
+                sum(map(mul, _ISBN10_WEIGHTS, record))
+                % _constants.ISBN10_CHECKSUM_MODULUS
+            )
+    return False
+
+
+def scan(data: bytes | mmap.mmap) -> Iterator[tuple[int, bytes]]:
+    """Find invalid records in a buffer of ISBNs, one per line.
+
+    Blank lines and whitespace surrounding records are ignored.
+
+    Args:
+        data: Buffer to scan
+
+    Yields:
+        Offset and content of each invalid record, with the offset pointing at
+        the record itself rather than any leading whitespace
+
+    """
+    start = 0
+    size = len(data)
+    while start < size:
+        # Splitting a window at once is far cheaper than a search per line
+        end = data.find(b"\n", start + WINDOW_SIZE)
+        end = size if end == -1 else end + 1
+        offset = start
+        for line in data[start:end].split(b"\n"):
+            record = line.strip()
+            if record and not _valid(record):
+                yield offset + len(line) - len(line.lstrip()), record
+            offset += len(line) + 1
+        start = end
+
+
+def scan_file(path: pathlib.Path) -> Iterator[tuple[int, bytes]]:
+    """Find invalid records in a file of ISBNs, one per line.
+
+    Args:
+        path: File to scan
+
+    Yields:
+        Offset and content of each invalid record
+
+    """
+    with path.open("rb") as f:
+        if path.stat().st_size == 0:
+            # Zero length maps aren't supported
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            yield from scan(data)
@@ -0,0 +1,321 @@
+"""Line protocol server for ``pyisbn``.
+
+This module supports keeping a warm process to answer ISBN requests, so that
+callers such as shell scripts don't pay interpreter start up costs for each
+ISBN.  ``serve()`` listens on a Unix domain socket, and ``serve_stream()``
+answers requests over a pair of streams such as stdin and stdout.  ``Client``
+connects to a socket, and can pipeline requests.
+
+Each request is a line containing a command, an ISBN and any arguments for
+the command, separated by whitespace::
+
+    validate 9780199564095
+    convert 0199564094 979
+    url 0199564094 google
+
+Each response is a line of ``ok`` followed by the result, or ``error``
+followed by a message.  Responses are written in request order, so a client
+can send many requests before reading any responses.
+
+The commands are:
+
+``check``
+    Check ISBN, with a result of the formatted ISBN or an error for an invalid
+    checksum
+``checksum``
+    Calculate checksum
+``convert [code]``
+    Convert between ISBN-10 and ISBN-13
+``hyphenate``
+    Hyphenate ISBN
+``url [site [country]]``
+    Generate link to online book site
+``urn``
+    Generate :rfc:`3187` URN
+``validate``
+    Validate ISBN, with a result of ``True`` or ``False``
+
+.. note::
+
+    Unix domain sockets aren't available on all platforms, but
+    ``serve_stream()`` is.
+"""
+# Copyright © 2026-2026  James Rowe <jnrowe@gmail.com>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# This file is part of pyisbn.
+#
+# pyisbn is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# pyisbn is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# pyisbn.  If not, see <http://www.gnu.org/licenses/>.
+
+import contextlib
+import os
+import pathlib
+import socket
+import socketserver
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from types import TracebackType
+from typing import Self, TextIO
+
+from ._exceptions import IsbnError, PyisbnError
+from .models import Isbn
+
+
+def _check(isbn: Isbn) -> str:
+    """Check ISBN.
+
+    Args:
+        isbn: ISBN to check
+
+    Returns:
+        Formatted ISBN
+
+    Raises:
+        IsbnError: Invalid checksum
+
+    """
+    if not isbn.validate():
+        raise IsbnError("Invalid checksum")
+    return str(isbn)
+
+
+#: Commands accepted by the server
+COMMANDS: dict[str, Callable[..., str | bool]] = {
+    "check": _check,
+    "checksum": Isbn.calculate_checksum,
+    "convert": Isbn.convert,
+    "hyphenate": Isbn.hyphenate,
+    "url": Isbn.to_url,
+    "urn": Isbn.to_urn,
+    "validate": Isbn.validate,
+}
+#: Largest number of requests a client sends ahead of their responses
+WINDOW = 256
+
+
+def handle(line: str) -> str:
+    """Answer a single request.
+
+    Args:
+        line: Request
+
+    Returns:
+        Response, without line ending
+
+    """
+    match line.split():
+        case [command, isbn, *args] if command in COMMANDS:
+            try:
+                obj = Isbn(isbn)
+            except PyisbnError as e:
+                return f"error {e} {isbn!r}"
+            try:
+                return f"ok {COMMANDS[command](obj, *args)}"
+            except PyisbnError as e:
+                return f"error {e}"
+            except TypeError:
+                return f"error invalid arguments for {command}"
+        case [command, *_] if command not in COMMANDS:
+            return f"error unknown command {command}"
+        case _:
+            return "error invalid request"
+
+
+def serve_stream(reader: TextIO, writer: TextIO) -> None:
+    """Answer requests from a stream until it is closed.
+
+    Args:
+        reader: Stream to read requests from
+        writer: Stream to write responses to
+
+    """
+    for line in reader:
+        writer.write(handle(line) + "\n")
+        writer.flush()
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    """Answer requests from a socket connection."""
+
+    def handle(self) -> None:
+        """Answer requests until the client disconnects."""
+        for line in self.rfile:
+            self.wfile.write(handle(line.decode(errors="replace")).encode())
+            self.wfile.write(b"\n")
+
+
+class Server(socketserver.ThreadingUnixStreamServer):
+    """Unix domain socket server, with a thread per connection."""
+
+    daemon_threads = True
+
+    def __init__(self, path: pathlib.Path) -> None:
+        """Initialise a new ``Server`` object.
+
+        Args:
+            path: Socket to listen on
+
+        """
+        super().__init__(os.fspath(path), _Handler)
+
+    def server_close(self) -> None:
+        """Close server, and remove its socket."""
+        super().server_close()
+        pathlib.Path(self.server_address).unlink(missing_ok=True)
+
+
+def serve(path: pathlib.Path) -> None:
+    """Answer requests on a Unix domain socket until interrupted.
+
+    Args:
+        path: Socket to listen on, which is removed on exit
+
+    """
+    with Server(path) as server:
+        server.serve_forever()
+
+
+class Client:
+    """Connection to a server."""
+
+    __slots__ = ("_file", "_socket")
+
+    def __init__(self, path: pathlib.Path) -> None:
+        """Initialise a new ``Client`` object.
+
+        Args:
+            path: Socket to connect to
+
+        """
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._socket.connect(os.fspath(path))
+        self._file = self._socket.makefile("rw", encoding="utf-8")
+
+    def __enter__(self) -> Self:
+        """Use connection as a context manager.
+
+        Returns:
+            Connection
+
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Close connection on leaving context."""
+        self.close()
+
+    def close(self) -> None:
+        """Close connection."""
+        with contextlib.suppress(OSError):
+            self._file.close()
+        self._socket.close()
+
+    def _send(self, request: Sequence[str]) -> None:
+        """Send a request, without waiting for its response.
+
+        Args:
+            request: Command, ISBN and command arguments
+
+        """
+        self._file.write(" ".join(request) + "\n")
+
+    def _receive(self) -> tuple[bool, str]:
+        """Read a response.
+
+        Returns:
+            Success flag and result or error message
+
+        Raises:
+            ConnectionError: When the server closes the connection
+
+        """
+        if not (line := self._file.readline()):
+            raise ConnectionError("server closed connection")
+        status, _, result = line.rstrip("\n").partition(" ")
+        return status == "ok", result
+
+    def _exchange(
+        self, batch: Sequence[Sequence[str]]
+    ) -> Iterator[tuple[bool, str]]:
+        """Send a batch of requests, and then read their responses.
+
+        Args:
+            batch: Command, ISBN and command arguments for each request
+
+        Yields:
+            Success flag and result or error message, in request order
+
+        """
+        for request in batch:
+            self._send(request)
+        self._file.flush()
+        remaining = len(batch)
+        try:
+            while remaining:
+                remaining -= 1
+                yield self._receive()
+        finally:
+            # Discard responses to abandoned requests, so the connection can
+            # still be used
+            for _ in range(remaining):
+                self._receive()
+
+    def request(self, command: str, isbn: str, *args: str) -> str:
+        """Make a single request.
+
+        Args:
+            command: Command to run
+            isbn: ISBN to operate on
+            args: Arguments for command
+
+        Returns:
+            Result of command
+
+        Raises:
+            ValueError: When the server reports an error
+
+        """
+        self._send((command, isbn, *args))
+        self._file.flush()
+        ok, result = self._receive()
+        if not ok:
+            raise ValueError(result)
+        return result
+
+    def pipeline(
+        self, requests: Iterable[Sequence[str]]
+    ) -> Iterator[tuple[bool, str]]:
+        """Make many requests, without waiting for each response.
+
+        Requests are sent in batches of :data:`WINDOW`, so neither side can
+        block on a full socket buffer.
+
+        Args:
+            requests: Command, ISBN and command arguments for each request
+
+        Yields:
+            Success flag and result or error message, in request order
+
+        """
+        batch: list[Sequence[str]] = []
+        for request in requests:
+            batch.append(request)
+            if len(batch) == WINDOW:
+                yield from self._exchange(batch)
+                batch.clear()
+        yield from self._exchange(batch)
@@ -0,0 +1,173 @@
+"""test__speedups - Test compiled accelerator against pure Python."""
+# Copyright © 2026-2026  James Rowe <jnrowe@gmail.com>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# This file is part of pyisbn.
+#
+# pyisbn is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# pyisbn is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# pyisbn.  If not, see <http://www.gnu.org/licenses/>.
+
+import importlib.util
+import inspect
+import sys
+from collections.abc import Callable
+from types import ModuleType
+from unittest import mock
+
+import pytest
+from hypothesis import given
+from hypothesis.strategies import booleans, lists, one_of, sampled_from, text
+
+import pyisbn.batch
+import pyisbn.func
+from pyisbn import IsbnError
+from tests.data import TEST_BOOKS, TEST_ISBNS, TEST_SBNS
+
+speedups = pytest.importorskip("pyisbn._speedups")
+
+# NOTE: Depending on your typeface and editor you may notice that some of the
+# following dashes are not HYPHEN-MINUS.  They're not, and this is on purpose
+ISBNS = one_of(
+    text(alphabet="0123456789Xx-–a", max_size=16),  # NoQA: RUF001
+    sampled_from(TEST_ISBNS + TEST_SBNS + list(TEST_BOOKS.values())),
+)
+CODES = sampled_from(["978", "979", "977", "97", b"978"])
+
+
+def _pure(name: str) -> ModuleType:
+    """Load a separate copy of a module without the accelerator.
+
+    Args:
+        name: Module to load
+
+    Returns:
+        Module using pure-Python implementations
+
+    """
+    spec = importlib.util.find_spec(name)
+    assert spec
+    assert spec.loader
+    module = importlib.util.module_from_spec(spec)
+    with mock.patch.dict(sys.modules, {"pyisbn._speedups": None}):
+        spec.loader.exec_module(module)
+    return module
+
+
+func = _pure("pyisbn.func")
+batch = _pure("pyisbn.batch")
+
+
+def _call(f: Callable[..., object], *args: object, **kwargs: object) -> object:
+    try:
+        return f(*args, **kwargs)
+    except (IsbnError, TypeError) as e:
+        return type(e), str(e)
+
+
+def _encode(isbn: str, *, as_bytes: bool) -> str | bytes:
+    return isbn.encode() if as_bytes else isbn
+
+
+def test_picked_up():
+    """Test accelerated functions replace pure-Python ones."""
+    assert pyisbn.func.validate is speedups.validate
+    assert pyisbn.func.calculate_checksum is speedups.checksum
+    assert pyisbn.batch.validate_many is speedups.validate_many
+
+
+def test_fallback():
+    """Test pure-Python functions are used without the accelerator."""
+    assert inspect.isfunction(func.validate)
+    assert inspect.isfunction(batch.validate_many)
+
+
+@pytest.mark.parametrize(
+    "isbn", TEST_ISBNS + TEST_SBNS + list(TEST_BOOKS.values())
+)
+def test_books(isbn: str):
+    """Test sample books match pure Python."""
+    assert speedups.validate(isbn) is func.validate(isbn) is True
+    assert speedups.checksum(isbn[:-1]) == func.calculate_checksum(isbn[:-1])
+    assert _call(speedups.convert, isbn) == _call(func.convert, isbn)
+
+
+@given(ISBNS, booleans())
+def test_validate(isbn: str, as_bytes: bool):  # NoQA: FBT001
+    """Test validating matches pure Python."""
+    isbn = _encode(isbn, as_bytes=as_bytes)
+    assert _call(speedups.validate, isbn) == _call(func.validate, isbn)
+
+
+@given(ISBNS, booleans())
+def test_checksum(isbn: str, as_bytes: bool):  # NoQA: FBT001
+    """Test calculating checksums matches pure Python."""
+    isbn = _encode(isbn[:-1], as_bytes=as_bytes)
+    assert _call(speedups.checksum, isbn) == _call(
+        func.calculate_checksum, isbn
+    )
+
+
+@given(ISBNS, booleans(), CODES)
+def test_convert(isbn: str, as_bytes: bool, code: str):  # NoQA: FBT001
+    """Test converting matches pure Python."""
+    isbn = _encode(isbn, as_bytes=as_bytes)
+    assert _call(speedups.convert, isbn, code) == _call(
+        func.convert, isbn, code
+    )
+
+
+@given(lists(ISBNS))
+def test_validate_many(isbns: list[str]):
+    """Test validating in bulk matches pure Python."""
+    assert speedups.validate_many(isbns) == batch.validate_many(isbns)
+
+
+@given(lists(ISBNS), CODES)
+def test_convert_many(isbns: list[str], code: str):
+    """Test converting in bulk matches pure Python."""
+    assert _call(speedups.convert_many, isbns, code) == _call(
+        batch.convert_many, isbns, code
+    )
+
+
+def test_defaults():
+    """Test default arguments match pure Python."""
+    assert speedups.convert("0140621180") == func.convert("0140621180")
+    assert speedups.convert_many(iter(["0140621180"])) == [
+        func.convert("0140621180")
+    ]
+
+
+@pytest.mark.parametrize(
+    ("function", "arg"),
+    [
+        (speedups.validate, 1),
+        (speedups.checksum, 1),
+        (speedups.convert, 1),
+        (speedups.validate_many, [1]),
+        (speedups.convert_many, [1]),
+    ],
+)
+def test_invalid_type(function: Callable[[object], object], arg: object):
+    """Test non-string input."""
+    with pytest.raises(TypeError, match="ISBN must be a string"):
+        function(arg)
+
+
+@pytest.mark.parametrize(
+    "function", [speedups.validate_many, speedups.convert_many]
+)
+def test_not_iterable(function: Callable[[object], object]):
+    """Test non-iterable bulk input."""
+    with pytest.raises(TypeError, match="ISBNs must be iterable"):
+        function(1)
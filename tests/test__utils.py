@@ -22,8 +22,13 @@ from hypothesis import given
 from hypothesis.strategies import sampled_from
 
 from pyisbn import IsbnError
-from pyisbn._utils import isbn_cleanse  # NoQA: PLC2701
-from tests.data import TEST_ISBNS
+from pyisbn._utils import (  # NoQA: PLC2701
+    isbn10_checksum,
+    isbn13_checksum,
+    isbn_cleanse,
+    isbn_digits,
+)
+from tests.data import TEST_ISBN10S, TEST_ISBN13S, TEST_ISBNS
 
 
 @given(sampled_from(TEST_ISBNS))
@@ -64,13 +69,45 @@ def test__isbn_cleanse_unicode_dash(isbn: str):
     [
         "978–1–84724–253–2",  # NoQA: RUF001
         "978-0-385-08695-0",
+        "978–1–84724–253–2".encode(),  # NoQA: RUF001
+        b"0-14-062118-0",
     ],
 )
-def test__isbn_cleanse_reflect_type(isbn: str):
+def test__isbn_cleanse_reflect_type(isbn: str | bytes):
     """Test that the cleansed ISBN has the same type as the original."""
     assert type(isbn_cleanse(isbn)) is type(isbn)
 
 
+@pytest.mark.parametrize(
+    "isbn",
+    [
+        " 978-0-14-062118-1 ",
+        "ISBN 978 0 14 062118 1",
+        "isbn-13: 978-0-14-062118-1",
+        "ISBN:9780140621181",
+        b"ISBN-13 978-0-14-062118-1",
+    ],
+)
+def test__isbn_cleanse_lenient(isbn: str | bytes):
+    """Test cleansing labelled ISBNs with whitespace."""
+    assert isbn_cleanse(isbn, lenient=True) in {
+        "9780140621181",
+        b"9780140621181",
+    }
+
+
+def test__isbn_cleanse_lenient_no_checksum():
+    """Test cleansing labelled ISBNs without checksum."""
+    isbn = "ISBN-10: 0 14 062118"
+    assert isbn_cleanse(isbn, checksum=False, lenient=True) == "014062118"
+
+
+def test__isbn_cleanse_strict():
+    """Test whitespace and labels are rejected by default."""
+    with pytest.raises(IsbnError, match="non-digit parts"):
+        isbn_cleanse("ISBN 978-0-14-062118-1")
+
+
 def test__isbn_cleanse_invalid_type():
     """Test cleansing an invalid type."""
     with pytest.raises(TypeError, match="ISBN must be a string, received 2"):
@@ -104,9 +141,15 @@ def test__isbn_cleanse_invalid_length(
         ("012345678901b", "non-digit checksum"),
         ("xxxxxxxxxxxx1", "non-digit parts"),
         ("0x0000000", "non-digit parts"),
+        ("0", "non-digit parts"),
+        ("9770140621181", "invalid Bookland region"),
+        ("97801406211", "ISBN must be either 10 or 13 characters long"),
+        (b"1-x4343", "non-digit parts"),
+        (b"123456789-b", "non-digit or X checksum"),
+        (b"8790000000001", "invalid Bookland region"),
     ],
 )
-def test__isbn_cleanse_invalid(isbn: str, message: str):
+def test__isbn_cleanse_invalid(isbn: str | bytes, message: str):
     """Test cleansing an invalid ISBN."""
     with pytest.raises(IsbnError, match=message):
         isbn_cleanse(isbn)
@@ -123,3 +166,29 @@ def test__isbn_cleanse_invalid_no_checksum(isbn: str, message: str):
     """Test cleansing an invalid ISBN without checksum."""
     with pytest.raises(IsbnError, match=message):
         isbn_cleanse(isbn, checksum=False)
+
+
+@pytest.mark.parametrize(
+    ("isbn", "result"),
+    [
+        ("354000978", b"354000978"),
+        # NOTE: These are ARABIC-INDIC DIGITs
+        ("٣٥٤٠٠٠٩٧٨", b"354000978"),
+        (b"014062118", b"014062118"),
+    ],
+)
+def test_isbn_digits(isbn: str | bytes, result: bytes):
+    """Test converting ISBNs to ASCII digits."""
+    assert isbn_digits(isbn) == result
+
+
+@given(sampled_from(TEST_ISBN10S))
+def test_isbn10_checksum(isbn: str):
+    """Test calculating ISBN-10 checksums from digits."""
+    assert isbn10_checksum(isbn.encode()) == isbn[-1]
+
+
+@given(sampled_from(TEST_ISBN13S))
+def test_isbn13_checksum(isbn: str):
+    """Test calculating ISBN-13 checksums from digits."""
+    assert isbn13_checksum(isbn.encode()) == isbn[-1]
@@ -0,0 +1,145 @@
+"""test_aio - Test asyncio interface."""
+# Copyright © 2026-2026  James Rowe <jnrowe@gmail.com>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# This file is part of pyisbn.
+#
+# pyisbn is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# pyisbn is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# pyisbn.  If not, see <http://www.gnu.org/licenses/>.
+
+import asyncio
+from collections.abc import AsyncIterator, Iterable
+
+import pytest
+
+from pyisbn.aio import convert_stream, validate_stream
+from pyisbn.batch import convert_many, validate_many
+from tests.data import TEST_BOOKS, TEST_ISBNS
+
+ISBNS = [*TEST_ISBNS, *TEST_BOOKS.values(), "", "bogus", "3540009780"]
+
+
+async def _aiter(items: Iterable[str]) -> AsyncIterator[str]:  # NoQA: RUF029
+    for item in items:
+        yield item
+
+
+async def _collect(results: AsyncIterator[str | bool]) -> list[str | bool]:
+    return [result async for result in results]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1 << 10])
+def test_validate_stream(chunk_size: int):
+    """Test validating ISBNs from asynchronous sources."""
+    results = validate_stream(_aiter(ISBNS), chunk_size=chunk_size)
+    assert asyncio.run(_collect(results)) == validate_many(ISBNS)
+
+
+@pytest.mark.parametrize("code", ["978", "979"])
+def test_convert_stream(code: str):
+    """Test converting ISBNs from asynchronous sources."""
+    results = convert_stream(_aiter(ISBNS), code, chunk_size=5)
+    assert asyncio.run(_collect(results)) == convert_many(ISBNS, code)
+
+
+def test_stream_reader():
+    """Test reading ISBNs from stream lines."""
+
+    async def run() -> list[str | bool]:
+        reader = asyncio.StreamReader()
+        reader.feed_data(b"3540009787\r\n0-x4343\n9783540009788")
+        reader.feed_eof()
+        return await _collect(convert_stream(reader))
+
+    assert asyncio.run(run()) == ["9783540009788", "", "3540009787"]
+
+
+def test_backpressure():
+    """Test ISBNs are only read as results are consumed."""
+    read = 0
+
+    async def source() -> AsyncIterator[str]:  # NoQA: RUF029
+        nonlocal read
+        for isbn in ISBNS:
+            read += 1
+            yield isbn
+
+    async def run() -> None:
+        results = validate_stream(source(), chunk_size=4)
+        await anext(results)
+        assert read == 4  # NoQA: PLR2004
+        await results.aclose()
+
+    asyncio.run(run())
+
+
+def test_partial_chunks():
+    """Test items are processed when the source has nothing ready."""
+    more = asyncio.Event()
+
+    async def source() -> AsyncIterator[str]:
+        yield "3540009787"
+        yield "0-14-062118-0"
+        await more.wait()
+        yield "bogus"
+
+    async def run() -> None:
+        results = validate_stream(source())
+        assert [await anext(results), await anext(results)] == [True, True]
+        more.set()
+        assert await _collect(results) == [False]
+
+    asyncio.run(run())
+
+
+def test_source_error():
+    """Test errors from the source are raised after earlier results."""
+
+    async def source() -> AsyncIterator[str]:  # NoQA: RUF029
+        yield "3540009787"
+        raise OSError("broken pipe")
+
+    async def run() -> None:
+        results = validate_stream(source(), chunk_size=4)
+        assert await anext(results) is True
+        with pytest.raises(OSError, match="broken pipe"):
+            await anext(results)
+
+    asyncio.run(run())
+
+
+@pytest.mark.parametrize("chunk_size", [0, -1])
+def test_invalid_chunk_size(chunk_size: int):
+    """Test chunk sizes that would never be processed are rejected."""
+    with pytest.raises(ValueError, match="at least 1"):
+        validate_stream(_aiter(ISBNS), chunk_size=chunk_size)
+
+
+def test_yields_to_loop():
+    """Test other tasks run while processing sources that never block."""
+    ticks = 0
+
+    async def ticker() -> None:
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0)
+
+    async def run() -> None:
+        task = asyncio.create_task(ticker())
+        results = validate_stream(_aiter(ISBNS * 4), chunk_size=8)
+        await _collect(results)
+        task.cancel()
+
+    asyncio.run(run())
+    assert ticks >= len(ISBNS * 4) // 8
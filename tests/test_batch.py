@@ -0,0 +1,82 @@
+"""test_batch - Test batch interface."""
+# Copyright © 2026-2026  James Rowe <jnrowe@gmail.com>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# This file is part of pyisbn.
+#
+# pyisbn is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# pyisbn is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# pyisbn.  If not, see <http://www.gnu.org/licenses/>.
+
+import pytest
+from hypothesis import example, given
+from hypothesis.strategies import lists, sampled_from, text
+
+from pyisbn import IsbnError, convert, validate
+from pyisbn.batch import convert_many, is_valid, iter_validate, validate_many
+from tests.data import TEST_BOOKS, TEST_ISBNS, TEST_SBNS
+
+
+def _validate(isbn: str) -> bool:
+    try:
+        return validate(isbn)
+    except IsbnError:
+        return False
+
+
+@given(lists(sampled_from(TEST_ISBNS + TEST_SBNS + list(TEST_BOOKS.values()))))
+def test_validate_many(isbns: list[str]):
+    """Test validating ISBNs."""
+    assert validate_many(isbns) == [True] * len(isbns)
+
+
+# NOTE: Depending on your typeface and editor you may notice that some of the
+# following dashes are not HYPHEN-MINUS.  They're not, and this is on purpose
+@example("978–1–84724–253–2")  # NoQA: RUF001
+@example("354000978x")
+@example("35400097x")
+@example("9790000000001")
+@example("2901568582497")
+@example("0-x4343")
+@example("")
+@given(text(alphabet="0123456789Xx-–", max_size=16))  # NoQA: RUF001
+def test_iter_validate(isbn: str):
+    """Test validating ISBNs matches validate()."""
+    assert list(iter_validate([isbn])) == [_validate(isbn)]
+    assert is_valid(isbn) is _validate(isbn)
+
+
+def test_iter_validate_lazy():
+    """Test ISBNs are validated on demand."""
+    results = iter_validate(["3540009787", 2])
+    assert next(results) is True
+    with pytest.raises(TypeError, match="ISBN must be a string"):
+        next(results)
+
+
+@pytest.mark.parametrize(
+    ("code", "result"),
+    [
+        ("978", ["9783540009788", "3540009787", "", ""]),
+        ("979", ["9793540009787", "3540009787", "", ""]),
+    ],
+)
+def test_convert_many(code: str, result: list[str]):
+    """Test converting ISBNs, with empty results for malformed input."""
+    isbns = ["3540009787", "9783540009788", "9790000000001", "bogus"]
+    assert convert_many(isbns, code) == result
+
+
+@given(lists(sampled_from(TEST_ISBNS)))
+def test_convert_many_matches(isbns: list[str]):
+    """Test converting ISBNs matches convert()."""
+    assert convert_many(isbns) == [convert(s) for s in isbns]
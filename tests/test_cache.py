@@ -0,0 +1,142 @@
+"""test_cache - Test interning cache."""
+# Copyright © 2026-2026  James Rowe <jnrowe@gmail.com>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# This file is part of pyisbn.
+#
+# pyisbn is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# pyisbn is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# pyisbn.  If not, see <http://www.gnu.org/licenses/>.
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pyisbn import Isbn, Isbn13, IsbnError
+from pyisbn.cache import CacheStats, IsbnCache
+from tests.data import TEST_ISBN13S, TEST_ISBNS
+
+
+def test_get():
+    """Test repeated lookups share objects."""
+    cache = IsbnCache()
+    book = cache.get("978-0-19-956409-5")
+    assert isinstance(book, Isbn)
+    assert cache.get("978-0-19-956409-5") is book
+    assert cache.stats() == CacheStats(1, 1, 0, 1, cache.maxsize)
+
+
+def test_get_validated(monkeypatch: pytest.MonkeyPatch):
+    """Test cached objects are already validated."""
+    cache = IsbnCache()
+    cache.get("3540009780")
+    monkeypatch.setattr("pyisbn.models.validate", None)
+    assert cache.get("3540009780").validate() is False
+
+
+def test_get_invalid():
+    """Test malformed ISBNs aren't cached."""
+    cache = IsbnCache()
+    with pytest.raises(IsbnError):
+        cache.get("bogus")
+    assert "bogus" not in cache
+    assert len(cache) == 0
+
+
+def test_get_without_checksum():
+    """Test ISBNs without a check digit are cached."""
+    cache = IsbnCache()
+    book = cache.get("978019956409")
+    assert book.isbn == "978019956409"
+    assert book.calculate_checksum() == "5"
+    assert cache.get("978019956409") is book
+    assert cache.stats() == CacheStats(1, 1, 0, 1, cache.maxsize)
+
+
+def test_cls():
+    """Test creating objects with a specific class."""
+    cache = IsbnCache(cls=Isbn13)
+    assert type(cache.get(TEST_ISBN13S[0])) is Isbn13
+
+
+def test_eviction():
+    """Test least recently used objects are evicted."""
+    cache = IsbnCache(2)
+    first, second, third = TEST_ISBNS[:3]
+    cache.get(first)
+    cache.get(second)
+    cache.get(first)
+    cache.get(third)
+    assert first in cache
+    assert second not in cache
+    assert cache.stats() == CacheStats(1, 3, 1, 2, 2)
+
+
+def test_unbounded():
+    """Test caches without a size limit."""
+    cache = IsbnCache(None)
+    for isbn in TEST_ISBNS:
+        cache.get(isbn)
+    assert cache.stats() == CacheStats(
+        0, len(TEST_ISBNS), 0, len(TEST_ISBNS), None
+    )
+
+
+def test_clear():
+    """Test emptying caches."""
+    cache = IsbnCache()
+    cache.get(TEST_ISBNS[0])
+    cache.clear()
+    assert cache.stats() == CacheStats(0, 0, 0, 0, cache.maxsize)
+
+
+def test_threads():
+    """Test sharing caches between threads."""
+    cache = IsbnCache(len(TEST_ISBNS) // 2)
+    with ThreadPoolExecutor(4) as executor:
+        books = list(executor.map(cache.get, TEST_ISBNS * 20))
+    assert [b.isbn for b in books] == TEST_ISBNS * 20
+    stats = cache.stats()
+    assert stats.hits + stats.misses == len(books)
+    assert stats.size == cache.maxsize
+    assert stats.evictions <= stats.misses - stats.size
+
+
+def test_repr():
+    """Test the repr of the IsbnCache object."""
+    assert repr(IsbnCache(4, Isbn13)) == "IsbnCache(4, Isbn13)"
+
+
+def test_get_reassigned():
+    """Test cached objects with reassigned ISBNs are replaced."""
+    cache = IsbnCache()
+    book = cache.get(TEST_ISBNS[0])
+    book.isbn = TEST_ISBNS[1]
+    fresh = cache.get(TEST_ISBNS[0])
+    assert fresh is not book
+    assert fresh.isbn == TEST_ISBNS[0]
+    assert cache.get(TEST_ISBNS[0]) is fresh
+    assert cache.stats() == CacheStats(1, 2, 0, 1, cache.maxsize)
+
+
+def test_maxsize_zero():
+    """Test caches that hold nothing."""
+    cache = IsbnCache(0)
+    book = cache.get(TEST_ISBNS[0])
+    assert book.isbn == TEST_ISBNS[0]
+    assert len(cache) == 0
+
+
+def test_maxsize_negative():
+    """Test negative sizes are rejected."""
+    with pytest.raises(ValueError, match="must not be negative"):
+        IsbnCache(-1)
@@ -0,0 +1,111 @@
+"""test_cached - Test memoised function interface."""
+# Copyright © 2026-2026  James Rowe <jnrowe@gmail.com>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# This file is part of pyisbn.
+#
+# pyisbn is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# pyisbn is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# pyisbn.  If not, see <http://www.gnu.org/licenses/>.
+
+from collections.abc import Iterator
+
+import pytest
+from hypothesis import given
+from hypothesis.strategies import sampled_from
+
+from pyisbn import IsbnError, cached, func
+from tests.data import TEST_ISBNS
+
+
+@pytest.fixture(autouse=True)
+def clear_caches() -> Iterator[None]:
+    """Reset caches around each test.
+
+    Yields:
+        Nothing, the caches are reset on exit
+
+    """
+    cached.configure(cached.MAXSIZE)
+    yield
+    cached.configure(cached.MAXSIZE)
+
+
+@given(sampled_from(TEST_ISBNS))
+def test_matches(isbn: str):
+    """Test memoised functions match the originals."""
+    assert cached.validate(isbn) == func.validate(isbn)
+    assert cached.convert(isbn) == func.convert(isbn)
+    assert cached.calculate_checksum(isbn[:-1]) == func.calculate_checksum(
+        isbn[:-1]
+    )
+
+
+def test_cache_info():
+    """Test cache statistics."""
+    cached.validate("3540009787")
+    cached.validate("3540009787")
+    cached.validate("0-14-062118-0")
+    info = cached.validate.cache_info()
+    assert isinstance(info, cached.CacheInfo)
+    assert (info.hits, info.misses, info.currsize) == (1, 2, 2)
+    cached.validate.cache_clear()
+    assert cached.validate.cache_info().currsize == 0
+
+
+def test_keyword_arguments():
+    """Test calls with keyword arguments."""
+    assert cached.convert("3540009787", code="979") == "9793540009787"
+    assert cached.convert("3540009787") == "9783540009788"
+
+
+def test_negative_caching():
+    """Test IsbnError results are cached."""
+    with pytest.raises(IsbnError, match="non-digit parts") as first:
+        cached.validate("bogus")
+    with pytest.raises(IsbnError, match="non-digit parts") as second:
+        cached.validate("bogus")
+    assert first.value is not second.value
+    assert cached.validate.cache_info().hits == 1
+
+
+def test_type_error():
+    """Test TypeError results aren't cached."""
+    with pytest.raises(TypeError, match="ISBN must be a string"):
+        cached.validate(2)  # ty: ignore[invalid-argument-type]
+    assert cached.validate.cache_info().currsize == 0
+
+
+def test_unhashable():
+    """Test unhashable arguments bypass the cache."""
+    with pytest.raises(TypeError, match="ISBN must be a string"):
+        cached.validate(["3540009787"])  # ty: ignore[invalid-argument-type]
+    with pytest.raises(TypeError, match="ISBN must be a string"):
+        cached.convert(isbn=["3540009787"])  # ty: ignore[invalid-argument-type]
+    assert cached.validate.cache_info() == cached.CacheInfo(
+        0, 0, cached.MAXSIZE, 0
+    )
+
+
+def test_configure():
+    """Test setting cache sizes."""
+    cached.configure(1)
+    cached.validate("3540009787")
+    cached.validate("0-14-062118-0")
+    info = cached.validate.cache_info()
+    assert (info.maxsize, info.currsize) == (1, 1)
+
+
+def test_wrapper():
+    """Test memoised functions look like the originals."""
+    assert cached.validate.__name__ == "validate"
+    assert cached.validate.__doc__ == func.validate.__doc__
@@ -0,0 +1,90 @@
+"""test_extract - Test ISBN extraction."""
+# Copyright © 2026-2026  James Rowe <jnrowe@gmail.com>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# This file is part of pyisbn.
+#
+# pyisbn is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# pyisbn is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# pyisbn.  If not, see <http://www.gnu.org/licenses/>.
+
+from itertools import pairwise
+
+import pytest
+from hypothesis import given
+from hypothesis.strategies import integers, lists, sampled_from, text
+
+from pyisbn.extract import IsbnSpan, find_isbns, find_isbns_stream
+from tests.data import TEST_BOOKS
+
+# NOTE: Depending on your typeface and editor you may notice that some of the
+# following dashes are not HYPHEN-MINUS.  They're not, and this is on purpose
+SAMPLE = (
+    "See ISBN-13: 978-0-19-956409-5, or ISBN 0–19–956409–4.\n"  # NoQA: RUF001
+    "Reprinted as 3540009787 (not 3540009788) and isbn-10:0-8044-2957-x.\n"
+    "Call 0140621180123, SBN 140-62118-0, but not 140621180."
+)
+FOUND = [
+    IsbnSpan("9780199564095", 13, 30),
+    IsbnSpan("0199564094", 40, 53),
+    IsbnSpan("3540009787", 68, 78),
+    IsbnSpan("080442957X", 108, 121),
+    IsbnSpan("140621180", 147, 158),
+]
+
+
+def test_find_isbns():
+    """Test finding ISBNs in text."""
+    assert list(find_isbns(SAMPLE)) == FOUND
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "97801995640951",
+        "19780199564095",
+        "978-0-19-956409-5-1",
+        "x9780199564095",
+        "9780199564095x",
+        "ISBN9780199564095",
+        "978--0-19-956409-5",
+        "9780199564096",
+        "3540009787" * 2,
+    ],
+)
+def test_find_isbns_fragments(text: str):
+    """Test ISBNs aren't found as fragments of other tokens."""
+    assert list(find_isbns(text)) == []
+
+
+@given(
+    lists(sampled_from(list(TEST_BOOKS.values())), min_size=1),
+    text(alphabet="abc ,.\n", min_size=1),
+)
+def test_find_isbns_books(isbns: list[str], filler: str):
+    """Test finding ISBNs surrounded by text."""
+    filler = f" {filler} "
+    found = find_isbns(filler + filler.join(isbns) + filler)
+    assert [s.isbn for s in found] == [s.replace("-", "") for s in isbns]
+
+
+@given(lists(integers(min_value=0, max_value=len(SAMPLE))))
+def test_find_isbns_stream(cuts: list[int]):
+    """Test finding ISBNs across chunk boundaries."""
+    bounds = [0, *sorted(cuts), len(SAMPLE)]
+    chunks = [SAMPLE[a:b] for a, b in pairwise(bounds)]
+    assert list(find_isbns_stream(chunks)) == FOUND
+
+
+def test_find_isbns_stream_lines():
+    """Test finding ISBNs in the lines of a file."""
+    assert list(find_isbns_stream(SAMPLE.splitlines(keepends=True))) == FOUND
@@ -25,6 +25,7 @@ from pyisbn import (
     IsbnError,
     calculate_checksum,
     convert,
+    group_counts,
     validate,
 )
 from tests.data import TEST_ISBNS
@@ -36,12 +37,48 @@ def test_calculate_checksum(isbn: str):
     assert calculate_checksum(isbn[:-1]) == isbn[-1]
 
 
+@given(sampled_from(TEST_ISBNS))
+def test_calculate_checksum_bytes(isbn: str):
+    """Test calculating the checksum of a bytes ISBN."""
+    assert calculate_checksum(isbn[:-1].encode()) == isbn[-1]
+
+
 @given(sampled_from(TEST_ISBNS))
 def test_convert(isbn: str):
     """Test converting an ISBN."""
     assert convert(convert(isbn)) == isbn
 
 
+@pytest.mark.parametrize(
+    ("code", "result"),
+    [
+        ("978", "9783540009788"),
+        ("979", "9793540009787"),
+    ],
+)
+def test_convert_code(code: str, result: str):
+    """Test converting an ISBN with a Bookland code."""
+    assert convert("3540009787", code) == result
+
+
+def test_convert_bytes():
+    """Test converting a bytes ISBN."""
+    assert convert(b"3540009787") == "9783540009788"
+
+
+def test_convert_bytes_dashes():
+    """Test converting a bytes ISBN with UTF-8 encoded dashes."""
+    assert convert("978\u20130\u201319\u2013956409\u20135".encode()) == (
+        "0199564094"
+    )
+
+
+def test_convert_invalid_code():
+    """Test converting an ISBN with an invalid Bookland code."""
+    with pytest.raises(IsbnError, match="invalid Bookland region"):
+        convert("3540009787", "123")
+
+
 def test_convert_invalid():
     """Test converting an invalid ISBN."""
     with pytest.raises(
@@ -51,6 +88,12 @@ def test_convert_invalid():
         convert("9790000000001")
 
 
+# NOTE: These are ARABIC-INDIC DIGITs, which Python considers to be decimals
+def test_calculate_checksum_non_ascii():
+    """Test calculating the checksum with non-ASCII digits."""
+    assert calculate_checksum("٣٥٤٠٠٠٩٧٨") == "7"
+
+
 @given(sampled_from(TEST_ISBNS))
 def test_validate(isbn: str):
     """Test validating an ISBN."""
@@ -68,3 +111,15 @@ def test_validate(isbn: str):
 def test_validate_invalid(isbn: str):
     """Test validating an invalid ISBN."""
     assert validate(isbn) is False
+
+
+@given(sampled_from(TEST_ISBNS))
+def test_validate_bytes(isbn: str):
+    """Test validating a bytes ISBN."""
+    assert validate(isbn.encode())
+    assert validate(isbn.lower().encode())
+
+
+def test_group_counts():
+    """Test counting ISBNs in registration groups."""
+    assert group_counts(iter(TEST_ISBNS))["978-0"] > 0
@@ -0,0 +1,103 @@
+"""test_generate - Test ISBN sequence generation."""
+# Copyright © 2026-2026  James Rowe <jnrowe@gmail.com>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# This file is part of pyisbn.
+#
+# pyisbn is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# pyisbn is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# pyisbn.  If not, see <http://www.gnu.org/licenses/>.
+
+import pytest
+from hypothesis import given
+from hypothesis.strategies import data, integers, sampled_from
+
+from pyisbn import IsbnError, calculate_checksum, generate
+from pyisbn.packed import pack
+
+PREFIXES = ["0-19", "3540", "08044295", "978-0-19", "979", "9791"]
+
+
+@given(sampled_from(PREFIXES), data())
+def test_range(prefix: str, draw: data):
+    """Test generating blocks matches calculate_checksum()."""
+    digits = prefix.replace("-", "")
+    length = 13 if digits.startswith(("978", "979")) else 10
+    size = 10 ** (length - 1 - len(digits))
+    start = draw.draw(integers(0, size))
+    stop = draw.draw(integers(start, min(size, start + 1_000)))
+    bodies = [
+        f"{digits}{n:0{length - 1 - len(digits)}d}" for n in range(start, stop)
+    ]
+    expected = [s + calculate_checksum(s) for s in bodies]
+    assert list(generate.range(prefix, start, stop)) == expected
+    assert list(generate.range(prefix, start, stop, packed=True)) == [
+        pack(s) for s in expected
+    ]
+
+
+def test_range_block():
+    """Test generating a whole block."""
+    assert list(generate.range("0-19-95640")) == [
+        "0199564000",
+        "0199564019",
+        "0199564027",
+        "0199564035",
+        "0199564043",
+        "0199564051",
+        "019956406X",
+        "0199564078",
+        "0199564086",
+        "0199564094",
+    ]
+
+
+@pytest.mark.parametrize(
+    ("prefix", "start", "stop"),
+    [
+        ("978-0", 9_999_990, 10_000_010),
+        ("978-0", 99_999_990, 100_000_000),
+        ("3540", 99_990, 100_000),
+    ],
+)
+def test_range_carry(prefix: str, start: int, stop: int):
+    """Test generating across carries, and to the end of a block."""
+    digits = prefix.replace("-", "")
+    width = len(str(stop - 1))
+    assert list(generate.range(prefix, start, stop)) == [
+        s + calculate_checksum(s)
+        for s in (f"{digits}{n:0{width}d}" for n in range(start, stop))
+    ]
+
+
+def test_range_length():
+    """Test generating ISBN-10s with a Bookland-like prefix."""
+    assert next(generate.range("979", length=10)) == "9790000006"
+
+
+@pytest.mark.parametrize(
+    ("prefix", "kwargs", "message"),
+    [
+        ("0-19-X", {}, "non-digit prefix"),
+        ("", {}, "non-digit prefix"),
+        ("0-19", {"length": 12}, "ISBN must be either 10 or 13"),
+        ("0-19", {"length": 13}, "invalid Bookland region"),
+        ("019956409", {}, "prefix leaves no digits"),
+        ("0-19", {"start": -1}, "range outside of block"),
+        ("0-19", {"start": 2, "stop": 1}, "range outside of block"),
+        ("0-19", {"stop": 10**7 + 1}, "range outside of block"),
+    ],
+)
+def test_range_invalid(prefix: str, kwargs: dict[str, int], message: str):
+    """Test generating from invalid blocks."""
+    with pytest.raises(IsbnError, match=message):
+        generate.range(prefix, **kwargs)
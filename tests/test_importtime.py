@@ -0,0 +1,111 @@
+"""test_importtime - Test import and start up costs."""
+# Copyright © 2026-2026  James Rowe <jnrowe@gmail.com>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# This file is part of pyisbn.
+#
+# pyisbn is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# pyisbn is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# pyisbn.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import pathlib
+import subprocess  # NoQA: S404
+import sys
+
+import pytest
+
+TOOL = pathlib.Path(__file__).parent.parent / "extra" / "tool.py"
+
+#: Modules that must only be imported when they're needed
+DEFERRED = {
+    "importlib.metadata",
+    "multiprocessing",
+    "pyisbn.instrument",
+    "pyisbn.parallel",
+    "pyisbn.ranges",
+    "unicodedata",
+}
+
+#: Upper bound on ``import pyisbn`` time, in microseconds
+IMPORT_LIMIT = 100_000
+#: Upper bound on total import time for a tool run, in microseconds
+TOOL_LIMIT = 150_000
+
+
+def _import_times(*args: str, top_level: bool = False) -> dict[str, int]:
+    """Run Python with import timing enabled.
+
+    Args:
+        args: Arguments for the interpreter
+        top_level: Only report imports that weren't triggered by another
+            import, so that the times can be summed without counting nested
+            imports repeatedly
+
+    Returns:
+        Cumulative import time of each import, in microseconds
+
+    """
+    proc = subprocess.run(  # NoQA: S603
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        # Nested imports are indented beyond the single separating space
+        if top_level and name.startswith("  "):
+            continue
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ("-c", "import pyisbn"),
+        ("-c", "import pyisbn; pyisbn.Isbn('0140621180').to_url()"),
+        (str(TOOL), "--convert", "0140621180"),
+    ],
+)
+def test_deferred_imports(args: tuple[str, ...]):
+    """Test costly modules aren't imported for common operations."""
+    assert not DEFERRED & _import_times(*args).keys()
+
+
+def test_deferred_imports_used():
+    """Test deferred modules are still imported when needed."""
+    assert "importlib.metadata" in _import_times(str(TOOL), "--version")
+
+
+@pytest.mark.skipif(
+    "GITHUB_WORKFLOW" in os.environ,
+    reason="Timing test for use on quiet machines",
+)
+def test_import_time():
+    """Test import time of pyisbn."""
+    assert _import_times("-c", "import pyisbn")["pyisbn"] < IMPORT_LIMIT
+
+
+@pytest.mark.skipif(
+    "GITHUB_WORKFLOW" in os.environ,
+    reason="Timing test for use on quiet machines",
+)
+def test_tool_startup():
+    """Test total import time for a tool run."""
+    times = _import_times(str(TOOL), "--convert", "0140621180", top_level=True)
+    assert sum(times.values()) < TOOL_LIMIT
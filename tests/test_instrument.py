@@ -0,0 +1,141 @@
+"""test_instrument - Test instrumentation of hot paths."""
+# Copyright © 2026-2026  James Rowe <jnrowe@gmail.com>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# This file is part of pyisbn.
+#
+# pyisbn is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# pyisbn is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# pyisbn.  If not, see <http://www.gnu.org/licenses/>.
+
+import importlib
+from collections.abc import Iterator
+from contextlib import suppress
+
+import pytest
+
+import pyisbn
+from pyisbn import IsbnError, Sbn, func, instrument, models
+from pyisbn.instrument import _label  # NoQA: PLC2701
+
+ORIGINAL = func.validate
+
+
+@pytest.fixture
+def instrumented() -> Iterator[None]:
+    """Enable instrumentation, with zeroed counters.
+
+    Yields:
+        Nothing, instrumentation is disabled on exit
+
+    """
+    instrument.reset()
+    instrument.enable()
+    yield
+    instrument.disable()
+    instrument.reset()
+
+
+def test_disabled():
+    """Test nothing is wrapped when instrumentation is disabled."""
+    assert not instrument.is_enabled()
+    assert pyisbn.validate is func.validate is ORIGINAL
+
+
+@pytest.mark.usefixtures("instrumented")
+def test_enable():
+    """Test every reference to a target is wrapped, once."""
+    assert instrument.is_enabled()
+    assert pyisbn.validate is func.validate
+    assert func.validate.__wrapped__ is ORIGINAL
+    instrument.enable()
+    assert func.validate.__wrapped__ is ORIGINAL
+
+
+@pytest.mark.usefixtures("instrumented")
+def test_disable():
+    """Test originals are restored."""
+    instrument.disable()
+    assert not instrument.is_enabled()
+    assert pyisbn.validate is func.validate is ORIGINAL
+    pyisbn.validate("0140621180")
+    assert instrument.snapshot()["pyisbn.func.validate"]["calls"] == 0
+
+
+def test_environment(monkeypatch: pytest.MonkeyPatch):
+    """Test enabling instrumentation on import."""
+    monkeypatch.setenv(instrument.ENVIRONMENT_VARIABLE, "1")
+    try:
+        importlib.reload(pyisbn)
+        assert instrument.is_enabled()
+    finally:
+        instrument.disable()
+
+
+@pytest.mark.usefixtures("instrumented")
+def test_counts():
+    """Test counting calls and time."""
+    pyisbn.validate("0140621180")
+    format(Sbn("140621180"), "url:google")
+    stats = instrument.snapshot()
+    assert stats["pyisbn.func.validate"]["calls"] == 1
+    assert stats["pyisbn.func.validate"]["seconds"] > 0
+    assert stats["pyisbn.models.Sbn.__init__"]["calls"] == 1
+    assert stats["pyisbn.models.Isbn10.__init__"]["calls"] == 1
+    assert stats["pyisbn.models.Isbn.__format__"]["calls"] == 1
+    assert stats["pyisbn.models.Isbn.to_url"]["calls"] == 1
+    assert stats["pyisbn.func.convert"]["calls"] == 0
+
+
+@pytest.mark.usefixtures("instrumented")
+def test_errors():
+    """Test counting errors by message."""
+    isbns = ["bogus", "bogus", "9790140621180", "0140621180"]
+    for isbn in isbns:
+        with suppress(IsbnError):
+            pyisbn.convert(isbn)
+    stats = instrument.snapshot()["pyisbn.func.convert"]
+    assert stats["calls"] == len(isbns)
+    assert stats["errors"] == {
+        "non-digit parts": 2,
+        "Only ISBN-13s with 978 Bookland code can be converted to ISBN-10.": 1,
+    }
+
+
+@pytest.mark.usefixtures("instrumented")
+def test_reset():
+    """Test zeroing counters."""
+    with pytest.raises(IsbnError):
+        models.Isbn("bogus")
+    instrument.reset()
+    stats = instrument.snapshot()["pyisbn.models.Isbn.__init__"]
+    assert stats == {"calls": 0, "errors": {}, "seconds": 0}
+
+
+@pytest.mark.usefixtures("instrumented")
+def test_prometheus():
+    """Test exporting counters in Prometheus text format."""
+    for isbn in ["0140621180", "bogus"]:
+        with suppress(IsbnError):
+            pyisbn.validate(isbn)
+    lines = instrument.prometheus().splitlines()
+    assert 'pyisbn_calls_total{function="pyisbn.func.validate"} 2' in lines
+    assert (
+        'pyisbn_errors_total{function="pyisbn.func.validate",'
+        'message="non-digit parts"} 1'
+    ) in lines
+    assert "# TYPE pyisbn_seconds_total counter" in lines
+
+
+def test_label():
+    """Test escaping Prometheus label values."""
+    assert _label('a "b"\\\n') == r'"a \"b\"\\\n"'
@@ -17,13 +17,14 @@
 # You should have received a copy of the GNU General Public License along with
 # pyisbn.  If not, see <http://www.gnu.org/licenses/>.
 
+import pickle  # NoQA: S403
 from sys import version_info
 
 import pytest
 from hypothesis import example, given
 from hypothesis.strategies import sampled_from
 
-from pyisbn import CountryError, Isbn, SiteError
+from pyisbn import CountryError, Isbn, Isbn10, Isbn13, IsbnError, Sbn, SiteError
 from tests.data import TEST_ISBNS
 
 
@@ -111,6 +112,124 @@ def test_validate(data: tuple[str, bool]):
     assert Isbn(isbn).validate() == result
 
 
+def test_cached(monkeypatch: pytest.MonkeyPatch):
+    """Test derived values are only calculated once."""
+    book = Isbn("0071148167")
+    assert book.calculate_checksum() == "7"
+    assert book.convert() == "9780071148160"
+    assert book.validate() is True
+    for name in ("calculate_checksum", "convert", "validate"):
+        monkeypatch.setattr(f"pyisbn.models.{name}", None)
+    assert book.calculate_checksum() == "7"
+    assert book.convert() == "9780071148160"
+    assert book.validate() is True
+
+
+def test_cached_code():
+    """Test conversions with differing Bookland codes."""
+    book = Isbn("0071148167")
+    assert book.convert("979") == "9790071148169"
+    assert book.convert() == "9780071148160"
+
+
+def test_cached_reset():
+    """Test assigning an ISBN discards derived values."""
+    book = Isbn("0199564094")
+    assert book.validate() is True
+    assert book.convert() == "9780199564095"
+    book.isbn = "0071148167"
+    assert book.validate() is True
+    assert book.calculate_checksum() == "7"
+    assert book.convert() == "9780071148160"
+    book.isbn = "0199564095"
+    assert book.validate() is False
+
+
+@pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+@pytest.mark.parametrize(
+    "book",
+    [
+        Isbn("0-19-956409-4"),
+        Isbn10("0071148167"),
+        Isbn13("978-0-19-956409-5"),
+        Sbn("071148167"),
+    ],
+    ids=repr,
+)
+def test_pickle(book: Isbn, protocol: int):
+    """Test pickling with every protocol."""
+    book.validate()
+    copy = pickle.loads(pickle.dumps(book, protocol))  # NoQA: S301
+    assert type(copy) is type(book)
+    assert (repr(copy), str(copy), copy.isbn) == (
+        repr(book),
+        str(book),
+        book.isbn,
+    )
+    assert copy.validate() is True
+
+
+@pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+def test_pickle_reassigned(protocol: int):
+    """Test pickling objects with a reassigned ISBN."""
+    book = Isbn("0199564094")
+    assert book.validate() is True
+    book.isbn = "0199564095"
+    copy = pickle.loads(pickle.dumps(book, protocol))  # NoQA: S301
+    assert copy.isbn == "0199564095"
+    assert copy.validate() is False
+
+
+def test_slots():
+    """Test Isbn objects don't carry an instance dictionary."""
+    assert not hasattr(Isbn("0071148167"), "__dict__")
+
+
+def test_hyphenate():
+    """Test hyphenating an ISBN."""
+    assert Isbn("9780199564095").hyphenate() == "978-0-19-956409-5"
+
+
+def test_group():
+    """Test finding an ISBN's registration group and registrant."""
+    book = Isbn("0199564094")
+    assert book.group == "978-0"
+    assert book.registrant == "978-0-19"
+
+
+@pytest.mark.parametrize(
+    ("isbn", "result"),
+    [
+        ("978-0-19-956409-5", 9780199564095),
+        ("0-14-062118-0", 9780140621181),
+        # Invalid ISBN-13s are packed as given
+        ("9780199564090", 9780199564090),
+    ],
+)
+def test_to_int(isbn: str, result: int):
+    """Test packing an ISBN."""
+    assert Isbn(isbn).to_int() == result
+
+
+def test_to_int_invalid():
+    """Test packing an invalid ISBN-10."""
+    with pytest.raises(IsbnError, match="invalid ISBN-10 can't be packed"):
+        Isbn("3540009780").to_int()
+
+
+@given(sampled_from(TEST_ISBNS))
+def test_from_int(isbn: str):
+    """Test unpacking an ISBN."""
+    assert Isbn.from_int(Isbn(isbn).to_int()).validate()
+
+
+@pytest.mark.parametrize("value", [-1, 10**13])
+def test_from_int_out_of_range(value: int):
+    """Test unpacking an out of range value."""
+    with pytest.raises(IsbnError, match="packed ISBN out of range"):
+        Isbn.from_int(value)
+
+
 @pytest.mark.parametrize(
     ("country", "result"),
     [
@@ -36,3 +36,9 @@ def test_calculate_checksum(isbn: str):
 def test_convert(isbn: str):
     """Test converting an ISBN-10."""
     assert Isbn10(isbn).convert()[:-1] == "978" + isbn[:-1]
+
+
+@given(sampled_from(TEST_ISBN10S))
+def test_from_int(isbn: str):
+    """Test unpacking an ISBN-10."""
+    assert Isbn10.from_int(Isbn10(isbn).to_int()).isbn == isbn
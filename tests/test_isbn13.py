@@ -36,3 +36,9 @@ def test_calculate_checksum(isbn: str):
 def test_convert(isbn: str):
     """Test converting an ISBN-13."""
     assert Isbn13(isbn).convert()[:-1] == isbn[3:-1]
+
+
+@given(sampled_from(TEST_ISBN13S))
+def test_from_int(isbn: str):
+    """Test unpacking an ISBN-13."""
+    assert Isbn13.from_int(Isbn13(isbn).to_int()).isbn == isbn
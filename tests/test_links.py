@@ -0,0 +1,126 @@
+"""test_links - Test bulk link generation."""
+# Copyright © 2026-2026  James Rowe <jnrowe@gmail.com>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# This file is part of pyisbn.
+#
+# pyisbn is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# pyisbn is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# pyisbn.  If not, see <http://www.gnu.org/licenses/>.
+
+from collections.abc import Iterator
+from unittest import mock
+
+import pytest
+
+from pyisbn import CountryError, Isbn, IsbnError, SiteError, links
+from pyisbn._constants import URL_MAP  # NoQA: PLC2701
+from tests.data import TEST_BOOKS, TEST_ISBNS
+
+ISBNS = list(TEST_BOOKS.values()) + TEST_ISBNS
+
+
+@pytest.fixture(autouse=True)
+def _isolate() -> Iterator[None]:
+    """Restore site data after each test."""
+    with (
+        mock.patch.dict(URL_MAP),
+        mock.patch.dict(links._TEMPLATES),
+    ):
+        yield
+
+
+@pytest.mark.parametrize("site", sorted(URL_MAP))
+@pytest.mark.parametrize("country", ["us", "uk", "de"])
+def test_to_urls(site: str, country: str):
+    """Test bulk links match Isbn.to_url()."""
+    expected = [Isbn(s).to_url(site, country) for s in ISBNS]
+    assert list(links.to_urls(ISBNS, site, country)) == expected
+    # Second call reuses the split template
+    assert list(links.to_urls(iter(ISBNS), site, country)) == expected
+
+
+def test_to_urls_invalid_site():
+    """Test unknown sites are reported before ISBNs are consumed."""
+    with pytest.raises(SiteError, match="nosite"):
+        links.to_urls([], "nosite")
+
+
+def test_to_urls_invalid_country():
+    """Test unknown countries are reported before ISBNs are consumed."""
+    with pytest.raises(CountryError, match="zh"):
+        links.to_urls([], country="zh")
+
+
+def test_to_urls_invalid_isbn():
+    """Test malformed ISBNs are reported when reached."""
+    result = links.to_urls(["0071148167", "bogus"])
+    assert next(result) == Isbn("0071148167").to_url()
+    with pytest.raises(IsbnError, match="non-digit parts"):
+        next(result)
+
+
+def test_to_urns():
+    """Test bulk URNs match Isbn.to_urn()."""
+    assert list(links.to_urns(ISBNS)) == [Isbn(s).to_urn() for s in ISBNS]
+
+
+def test_register_site():
+    """Test adding a site."""
+    links.register_site("openlibrary", "https://openlibrary.org/isbn/{isbn}")
+    assert ("openlibrary", None) in links._TEMPLATES
+    assert list(links.to_urls(ISBNS, "openlibrary")) == [
+        Isbn(s).to_url("openlibrary") for s in ISBNS
+    ]
+
+
+def test_register_site_tlds():
+    """Test adding a site with country specific versions."""
+    links.register_site(
+        "abebooks",
+        "https://www.abebooks.{tld}/{isbn}/",
+        {"de": None, "uk": "co.uk"},
+    )
+    for country in ["de", "uk"]:
+        assert list(links.to_urls(ISBNS, "abebooks", country)) == [
+            Isbn(s).to_url("abebooks", country) for s in ISBNS
+        ]
+    with pytest.raises(CountryError, match="us"):
+        links.to_urls(ISBNS, "abebooks")
+
+
+def test_register_site_replace():
+    """Test replacing a site discards its old templates."""
+    assert next(links.to_urls(ISBNS, "google")).startswith("https://books.")
+    links.register_site("google", "https://www.google.com/search?q={isbn}")
+    assert next(links.to_urls(ISBNS, "google")).startswith("https://www.")
+
+
+def test_register_site_invalid():
+    """Test broken templates leave sites untouched."""
+    with pytest.raises(ValueError, match="unknown field 'title'"):
+        links.register_site("google", "https://example.com/{title}")
+    assert next(links.to_urls(ISBNS, "google")).startswith("https://books.")
+
+
+def test_register_site_tld_without_tlds():
+    """Test templates with a TLD field require TLDs."""
+    with pytest.raises(ValueError, match="unknown field 'tld'"):
+        links.register_site("example", "https://example.{tld}/{isbn}")
+    assert "example" not in URL_MAP
+
+
+def test_url_map_replaced():
+    """Test direct changes to URL_MAP are noticed."""
+    assert next(links.to_urls(ISBNS, "isbndb")).startswith("https://isbndb")
+    URL_MAP["isbndb"] = "https://example.com/{isbn}"
+    assert next(links.to_urls(ISBNS, "isbndb")).startswith("https://example")
@@ -0,0 +1,153 @@
+"""test_packed - Test packed storage interface."""
+# Copyright © 2026-2026  James Rowe <jnrowe@gmail.com>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# This file is part of pyisbn.
+#
+# pyisbn is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# pyisbn is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# pyisbn.  If not, see <http://www.gnu.org/licenses/>.
+
+import pickle  # NoQA: S403
+import sys
+
+import pytest
+from hypothesis import given
+from hypothesis.strategies import lists, sampled_from
+
+from pyisbn import Isbn, Isbn13, IsbnError, convert
+from pyisbn.packed import IsbnArray, pack, unpack
+from tests.data import TEST_ISBN13S, TEST_ISBNS
+
+
+@given(sampled_from(TEST_ISBNS))
+def test_pack(isbn: str):
+    """Test packing ISBNs."""
+    assert unpack(pack(isbn)) == str(Isbn(isbn).to_int())
+    assert pack(Isbn(isbn)) == pack(isbn) == pack(pack(isbn))
+
+
+@pytest.mark.parametrize("value", [-1, 5, 9770000000000, 9800000000000, 10**13])
+def test_pack_out_of_range(value: int):
+    """Test packing out of range values."""
+    with pytest.raises(IsbnError, match="packed ISBN out of range"):
+        pack(value)
+
+
+@given(lists(sampled_from(TEST_ISBNS)))
+def test_isbn_array(isbns: list[str]):
+    """Test building arrays."""
+    arr = IsbnArray(isbns)
+    assert len(arr) == len(isbns)
+    assert arr.to_strings() == [Isbn13.from_int(pack(s)).isbn for s in isbns]
+    assert [b.isbn for b in arr] == arr.to_strings()
+    assert arr.to_ints() == list(map(pack, isbns))
+    assert all(arr.validate())
+
+
+def test_repr():
+    """Test the repr of the IsbnArray object."""
+    assert repr(IsbnArray(["3540009787"])) == "IsbnArray(['9783540009788'])"
+
+
+def test_getitem():
+    """Test indexing and slicing arrays."""
+    arr = IsbnArray(TEST_ISBN13S)
+    assert isinstance(arr[0], Isbn13)
+    assert arr[-1].isbn == TEST_ISBN13S[-1]
+    assert arr[1:3] == IsbnArray(TEST_ISBN13S[1:3])
+
+
+def test_eq():
+    """Test comparing arrays."""
+    assert IsbnArray(["3540009787"]) == IsbnArray(["9783540009788"])
+    assert IsbnArray(["3540009787"]) != ["9783540009788"]
+
+
+def test_append_extend():
+    """Test adding to arrays."""
+    arr = IsbnArray()
+    arr.append("3540009787")
+    arr.extend(TEST_ISBN13S)
+    assert arr == IsbnArray(["3540009787", *TEST_ISBN13S])
+
+
+@pytest.mark.parametrize("sort", [False, True])
+def test_contains(sort: bool):  # NoQA: FBT001
+    """Test membership of arrays."""
+    arr = IsbnArray(TEST_ISBN13S)
+    if sort:
+        arr.sort()
+    assert all(s in arr for s in TEST_ISBN13S)
+    assert "3540009787" not in arr
+    assert int(TEST_ISBN13S[0]) + 1 not in arr
+    assert "bogus" not in arr
+    assert None not in arr
+
+
+def test_sort():
+    """Test sorting arrays."""
+    arr = IsbnArray(TEST_ISBN13S)
+    arr.sort()
+    assert arr.to_strings() == sorted(TEST_ISBN13S)
+    arr.append("3540009787")
+    assert "3540009787" in arr
+
+
+def test_validate():
+    """Test validating packed ISBNs."""
+    arr = IsbnArray([9783540009788, 9783540009780, 9790000000000])
+    assert arr.validate() == [True, False, False]
+
+
+@given(lists(sampled_from(TEST_ISBN13S)))
+def test_convert(isbns: list[str]):
+    """Test converting packed ISBNs."""
+    assert IsbnArray(isbns).convert() == [
+        convert(s) if s.startswith("978") else "" for s in isbns
+    ]
+
+
+@pytest.mark.parametrize("byteorder", ["little", "big"])
+def test_bytes(monkeypatch: pytest.MonkeyPatch, byteorder: str):
+    """Test serialising arrays."""
+    arr = IsbnArray(TEST_ISBN13S)
+    data = arr.tobytes()
+    assert len(data) == 8 * len(arr)
+    assert data[:8] == int(TEST_ISBN13S[0]).to_bytes(8, "little")
+    monkeypatch.setattr(sys, "byteorder", byteorder)
+    assert IsbnArray.frombytes(arr.tobytes()) == arr
+
+
+def test_frombytes_out_of_range():
+    """Test deserialising out of range values."""
+    with pytest.raises(IsbnError, match="packed ISBN out of range"):
+        IsbnArray.frombytes((10**13).to_bytes(8, "little"))
+
+
+def test_frombytes_without_bookland():
+    """Test deserialising values without a Bookland prefix."""
+    data = (9783540009788).to_bytes(8, "little") + (5).to_bytes(8, "little")
+    with pytest.raises(IsbnError, match="packed ISBN out of range"):
+        IsbnArray.frombytes(data)
+
+
+def test_pack_round_trip():
+    """Test every packable value unpacks to an ISBN."""
+    values = [9780000000000, 9799999999999]
+    assert [isbn.to_int() for isbn in IsbnArray(values)] == values
+
+
+def test_pickle():
+    """Test pickling arrays."""
+    arr = IsbnArray(TEST_ISBN13S)
+    assert pickle.loads(pickle.dumps(arr)) == arr  # NoQA: S301
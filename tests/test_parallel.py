@@ -0,0 +1,97 @@
+"""test_parallel - Test parallel interface."""
+# Copyright © 2026-2026  James Rowe <jnrowe@gmail.com>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# This file is part of pyisbn.
+#
+# pyisbn is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# pyisbn is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# pyisbn.  If not, see <http://www.gnu.org/licenses/>.
+
+import pathlib
+from itertools import pairwise
+
+import pytest
+
+from pyisbn.batch import validate_many
+from pyisbn.parallel import chunk_ranges, map_lines, validate_file
+from tests.data import TEST_BOOKS, TEST_ISBNS
+
+LINES = [*TEST_ISBNS, "", " 0-14-062118-0 ", "3540009780", "bogus"]
+
+
+@pytest.fixture
+def isbn_file(tmp_path: pathlib.Path) -> pathlib.Path:
+    """Sample file of ISBNs.
+
+    Returns:
+        Path to file
+
+    """
+    path = tmp_path / "isbns.txt"
+    path.write_text("\n".join(LINES) + "\n", encoding="utf-8")
+    return path
+
+
+@pytest.mark.parametrize("chunk_size", [1, 64, 1 << 20])
+def test_chunk_ranges(isbn_file: pathlib.Path, chunk_size: int):
+    """Test splitting files on line boundaries."""
+    data = isbn_file.read_bytes()
+    ranges = chunk_ranges(isbn_file, chunk_size)
+    assert ranges[0][0] == 0
+    assert ranges[-1][1] == len(data)
+    for (_, end), (start, _) in pairwise(ranges):
+        assert end == start
+        assert data[end - 1 : end] == b"\n"
+
+
+def test_chunk_ranges_empty(tmp_path: pathlib.Path):
+    """Test splitting an empty file."""
+    path = tmp_path / "empty.txt"
+    path.touch()
+    assert chunk_ranges(path) == []
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_map_lines(isbn_file: pathlib.Path, jobs: int):
+    """Test processing lines in order."""
+    result = map_lines(str.upper, isbn_file, jobs=jobs, chunk_size=64)
+    assert list(result) == [s.upper() for s in LINES]
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_map_lines_endings(tmp_path: pathlib.Path, jobs: int):
+    """Test lines are split as they are when reading in text mode."""
+    path = tmp_path / "endings.txt"
+    path.write_bytes(
+        b"bad\x0c1\n0199564094\r\nbad\xe2\x80\xa8\xc2\x85\n\rbad2\n\n"
+    )
+    with path.open(encoding="utf-8") as f:
+        expected = [line.removesuffix("\n") for line in f]
+    result = map_lines(str, path, jobs=jobs, chunk_size=8)
+    assert list(result) == expected
+
+
+@pytest.mark.parametrize("jobs", [None, 1, 2])
+def test_validate_file(isbn_file: pathlib.Path, jobs: int | None):
+    """Test validating files."""
+    result = validate_file(isbn_file, jobs=jobs, chunk_size=128)
+    assert list(result) == validate_many([s.strip() for s in LINES])
+
+
+def test_validate_file_abandoned(tmp_path: pathlib.Path):
+    """Test abandoning results part way through."""
+    path = tmp_path / "books.txt"
+    path.write_text("\n".join(TEST_BOOKS.values()), encoding="utf-8")
+    result = validate_file(path, jobs=2, chunk_size=32)
+    assert next(result) is True
+    result.close()
@@ -0,0 +1,220 @@
+"""test_ranges - Test registration range interface."""
+# Copyright © 2026-2026  James Rowe <jnrowe@gmail.com>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# This file is part of pyisbn.
+#
+# pyisbn is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# pyisbn is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# pyisbn.  If not, see <http://www.gnu.org/licenses/>.
+
+import pathlib
+import sys
+
+import pytest
+from hypothesis import given
+from hypothesis.strategies import sampled_from
+
+from pyisbn import IsbnError
+from pyisbn.ranges import (
+    DATABASE_FILE,
+    RANGES_FILE,
+    GroupRanges,
+    IsbnParts,
+    RangeIndex,
+    build,
+    default_index,
+    dump,
+    dump_compiled,
+    group,
+    group_counts,
+    hyphenate,
+    hyphenate_many,
+    load,
+    parse_range_message,
+    read,
+    registrant,
+    split,
+)
+from tests.data import TEST_BOOKS
+
+RANGE_MESSAGE = b"""<?xml version="1.0" encoding="utf-8"?>
+<ISBNRangeMessage>
+  <MessageSource>International ISBN Agency</MessageSource>
+  <RegistrationGroups>
+    <Group>
+      <Prefix>978-0</Prefix>
+      <Agency>English language</Agency>
+      <Rules>
+        <Rule><Range>0000000-1999999</Range><Length>2</Length></Rule>
+        <Rule><Range>2000000-6999999</Range><Length>0</Length></Rule>
+        <Rule><Range>7000000-8499999</Range><Length>4</Length></Rule>
+      </Rules>
+    </Group>
+    <Group>
+      <Prefix>979-12</Prefix>
+      <Agency>Italy</Agency>
+      <Rules>
+        <Rule><Range>2000000-2999999</Range><Length>3</Length></Rule>
+      </Rules>
+    </Group>
+  </RegistrationGroups>
+</ISBNRangeMessage>
+"""
+GROUPS = [
+    GroupRanges("978-0", ["00-19", "7000-8499"], "English language"),
+    GroupRanges("979-12", ["200-299"], "Italy"),
+]
+
+
+@given(sampled_from([s for s in TEST_BOOKS.values() if "-" in s]))
+def test_hyphenate(isbn: str):
+    """Test hyphenating ISBNs."""
+    assert hyphenate(isbn.replace("-", "")) == isbn
+
+
+@pytest.mark.parametrize(
+    ("isbn", "result"),
+    [
+        ("9780199564095", IsbnParts("978", "0", "19", "956409", "5")),
+        ("3540009787", IsbnParts("", "3", "540", "00978", "7")),
+        ("140621180", IsbnParts("", "0", "14", "062118", "0")),
+        ("9791032305690", IsbnParts("979", "10", "323", "0569", "0")),
+    ],
+)
+def test_split(isbn: str, result: IsbnParts):
+    """Test splitting ISBNs."""
+    assert split(isbn) == result
+
+
+@pytest.mark.parametrize(
+    ("isbn", "message"),
+    [
+        ("9789999999999", "undefined registration group"),
+        ("9791210000000", "undefined registrant range"),
+        ("9791230000000", "undefined registrant range"),
+    ],
+)
+def test_split_undefined(isbn: str, message: str):
+    """Test splitting ISBNs outside the defined ranges."""
+    with pytest.raises(IsbnError, match=message):
+        split(isbn)
+
+
+def test_hyphenate_many():
+    """Test hyphenating ISBNs in bulk."""
+    assert hyphenate_many(["3540009787", "9789999999999", "bogus"]) == [
+        "3-540-00978-7",
+        "",
+        "",
+    ]
+
+
+@given(sampled_from([s for s in TEST_BOOKS.values() if "-" in s]))
+def test_group(isbn: str):
+    """Test finding registration groups and registrants."""
+    parts = isbn.split("-")
+    if len(parts) == 4:  # NoQA: PLR2004
+        parts.insert(0, "978")
+    assert group(isbn) == "-".join(parts[:2])
+    assert registrant(isbn) == "-".join(parts[:3])
+
+
+def test_group_undefined():
+    """Test finding groups of ISBNs outside defined groups."""
+    with pytest.raises(IsbnError, match="undefined registration group"):
+        group("9789999999999")
+
+
+def test_group_counts():
+    """Test counting ISBNs in registration groups."""
+    isbns = (s for s in ["0140621180", "9780199564095", "3540009787", "bogus"])
+    assert group_counts(isbns) == {"978-0": 2, "978-3": 1, "": 1}
+
+
+def test_agency():
+    """Test finding registration agencies."""
+    assert default_index().agency("3540009787") == "German language"
+
+
+def test_parse_range_message():
+    """Test parsing RangeMessage data."""
+    assert list(parse_range_message(RANGE_MESSAGE)) == GROUPS
+
+
+def test_index():
+    """Test building indexes from group definitions."""
+    index = RangeIndex.from_groups(GROUPS)
+    assert len(index) == len(GROUPS)
+    assert index.hyphenate("9780701234560") == "978-0-7012-3456-0"
+    assert index.agency("9791220012345") == "Italy"
+    assert hyphenate_many(["9780701234560"], index) == ["978-0-7012-3456-0"]
+    assert index.group("9791220012345") == "979-12"
+    assert index.registrant("9791220012345") == "979-12-200"
+    assert group_counts(["9780701234560", "9789999999999"], index) == {
+        "978-0": 1,
+        "": 1,
+    }
+
+
+@pytest.mark.parametrize(
+    ("isbn", "message"),
+    [
+        ("9780200000000", "undefined registrant range"),
+        ("9780900000000", "undefined registrant range"),
+        ("9791230000000", "undefined registrant range"),
+        ("9791100000000", "undefined registration group"),
+        ("9790000000000", "undefined registration group"),
+    ],
+)
+def test_index_undefined(isbn: str, message: str):
+    """Test lookups in gaps between defined ranges."""
+    with pytest.raises(IsbnError, match=message):
+        RangeIndex.from_groups(GROUPS).split(isbn)
+
+
+def test_index_invalid():
+    """Test building indexes from invalid data."""
+    with pytest.raises(ValueError, match="not a compiled range database"):
+        RangeIndex(b"bogus")
+
+
+def test_big_endian(monkeypatch: pytest.MonkeyPatch):
+    """Test byte order handling of compiled databases."""
+    little = build(GROUPS)
+    monkeypatch.setattr(sys, "byteorder", "big")
+    big = build(GROUPS)
+    assert big != little
+    assert RangeIndex(big).split("9780701234560") == split("9780701234560")
+
+
+def test_dump_read(tmp_path: pathlib.Path):
+    """Test writing and reading range data files."""
+    path = tmp_path / "ranges.dat"
+    groups = [*GROUPS, GroupRanges("978-611", [], "Thailand")]
+    dump(groups, path, "header")
+    assert path.read_text(encoding="utf-8").startswith("# header\n")
+    assert list(read(path)) == groups
+
+
+def test_dump_compiled_load(tmp_path: pathlib.Path):
+    """Test writing and loading compiled databases."""
+    path = tmp_path / "ranges.bin"
+    dump_compiled(GROUPS, path)
+    index = load(path)
+    assert len(index) == len(GROUPS)
+    assert index.split("9780701234560") == split("9780701234560")
+
+
+def test_bundled_database():
+    """Test bundled database matches bundled range data."""
+    assert DATABASE_FILE.read_bytes() == build(read(RANGES_FILE))
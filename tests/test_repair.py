@@ -0,0 +1,148 @@
+"""test_repair - Test error correcting suggestions."""
+# Copyright © 2026-2026  James Rowe <jnrowe@gmail.com>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# This file is part of pyisbn.
+#
+# pyisbn is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# pyisbn is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# pyisbn.  If not, see <http://www.gnu.org/licenses/>.
+
+from string import digits
+
+import pytest
+from hypothesis import given
+from hypothesis.strategies import data, sampled_from, text
+
+from pyisbn import convert
+from pyisbn.batch import validate_many
+from pyisbn.repair import (
+    SUBSTITUTION,
+    TRANSPOSITION,
+    Suggestion,
+    suggest,
+    suggest_many,
+)
+from tests.data import TEST_ISBNS, TEST_SBNS
+
+
+def _valid(isbn: str) -> bool:
+    return validate_many([isbn])[0]
+
+
+def _isbn13(isbn: str) -> str:
+    return isbn if len(isbn) == 13 else convert(isbn)  # NoQA: PLR2004
+
+
+@given(sampled_from(TEST_ISBNS + TEST_SBNS), data())
+def test_suggest_substitution(isbn: str, draw: data):
+    """Test suggestions include the original of a substituted character."""
+    position = draw.draw(sampled_from(range(len(isbn))))
+    char = draw.draw(sampled_from(digits))
+    invalid = isbn[:position] + char + isbn[position + 1 :]
+    if invalid == isbn:
+        return
+    assert Suggestion(isbn, SUBSTITUTION, position) in suggest(invalid)
+
+
+@given(sampled_from(TEST_ISBNS + TEST_SBNS), data())
+def test_suggest_transposition(isbn: str, draw: data):
+    """Test suggestions include the original of swapped characters."""
+    position = draw.draw(sampled_from(range(len(isbn) - 1)))
+    invalid = (
+        isbn[:position]
+        + isbn[position + 1]
+        + isbn[position]
+        + isbn[position + 2 :]
+    )
+    if _valid(invalid):
+        # Swaps of equal digits, or ISBN-13 swaps the checksum can't detect
+        return
+    assert Suggestion(isbn, TRANSPOSITION, position) in suggest(invalid)
+
+
+@given(text(alphabet="0123456789Xx-", min_size=9, max_size=14))
+def test_suggest_valid(isbn: str):
+    """Test every suggestion is a distinct valid ISBN."""
+    suggestions = [s.isbn for s in suggest(isbn)]
+    assert all(map(_valid, suggestions))
+    assert len(set(map(_isbn13, suggestions))) == len(suggestions)
+
+
+def test_suggest_ranking():
+    """Test transpositions rank before substitutions."""
+    kinds = [s.kind for s in suggest("0198526663")]
+    assert kinds == sorted(kinds, key=[TRANSPOSITION, SUBSTITUTION].index)
+    assert suggest("0198526663")[0] == Suggestion(
+        "0918526663", TRANSPOSITION, 1
+    )
+
+
+@pytest.mark.parametrize(
+    ("isbn", "expected"),
+    [
+        ("978O198526636", ["9780198526636"]),
+        ("0-19-852663-?", ["0198526636"]),
+        ("080442957?", ["080442957X"]),
+        ("14062118?", ["140621180"]),
+        ("8493169X1", ["84931691X", "849316901"]),
+        ("04712740X3", ["0471274003"]),
+        ("97801406211X8", ["9780140621198"]),
+    ],
+)
+def test_suggest_unreadable(isbn: str, expected: list[str]):
+    """Test repairing a single unreadable character."""
+    assert [s.isbn for s in suggest(isbn)] == expected
+
+
+def test_suggest_x():
+    """Test X is only suggested as an ISBN-10 check character."""
+    suggestions = suggest("0804429570")
+    assert Suggestion("080442957X", SUBSTITUTION, 9) in suggestions
+    assert all("X" not in s.isbn[:-1] for s in suggestions)
+
+
+def test_suggest_bookland():
+    """Test ISBN-13 suggestions keep a Bookland prefix."""
+    assert all(
+        s.isbn.startswith(("978", "979")) for s in suggest("9770198526636")
+    )
+    assert Suggestion("9780198526636", SUBSTITUTION, 2) in suggest(
+        "9770198526636"
+    )
+    # Swapping the 8 and 3 leaves the checksum valid
+    assert suggest("9738639234787") == [
+        Suggestion("9783639234787", TRANSPOSITION, 2)
+    ]
+
+
+@pytest.mark.parametrize(
+    "isbn",
+    [
+        "9780198526636",
+        "0198526636",
+        "140621180",
+        "01985266",
+        "978O19852663?",
+        "bogus",
+        "",
+    ],
+)
+def test_suggest_none(isbn: str):
+    """Test valid and unrepairable input."""
+    assert suggest(isbn) == []
+
+
+def test_suggest_many():
+    """Test suggesting corrections in bulk."""
+    isbns = ["0198526663", "bogus", "978O198526636"]
+    assert suggest_many(isbns) == [suggest(s) for s in isbns]
@@ -0,0 +1,125 @@
+"""test_results - Test structured validation results."""
+# Copyright © 2026-2026  James Rowe <jnrowe@gmail.com>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# This file is part of pyisbn.
+#
+# pyisbn is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# pyisbn is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# pyisbn.  If not, see <http://www.gnu.org/licenses/>.
+
+import pytest
+from hypothesis import given
+from hypothesis.strategies import lists, sampled_from, text
+
+from pyisbn import IsbnError, Reason, Result, check, validate
+from pyisbn._utils import isbn_cleanse  # NoQA: PLC2701
+from pyisbn.results import FAILURES, check_many
+from tests.data import TEST_BOOKS, TEST_ISBNS, TEST_SBNS
+
+# NOTE: Depending on your typeface and editor you may notice that some of the
+# following dashes are not HYPHEN-MINUS.  They're not, and this is on purpose
+ISBN_TEXT = text(alphabet="0123456789Xx-–a", max_size=16)  # NoQA: RUF001
+
+#: Reasons for each message of IsbnError raised by isbn_cleanse()
+MESSAGES = {
+    "non-digit parts": Reason.NON_DIGIT,
+    "non-digit or X checksum": Reason.NON_DIGIT,
+    "non-digit checksum": Reason.NON_DIGIT,
+    "invalid Bookland region": Reason.BAD_BOOKLAND,
+    "ISBN must be either 10 or 13 characters long": Reason.BAD_LENGTH,
+}
+
+
+def _expected(isbn: str | bytes) -> Result:
+    """Check ISBN with the exception raising interface.
+
+    Args:
+        isbn: SBN, ISBN-10 or ISBN-13
+
+    Returns:
+        Expected result of ``check()``
+
+    """
+    try:
+        valid = validate(isbn)
+    except IsbnError as e:
+        return FAILURES[MESSAGES[str(e)]]
+    if not valid:
+        return FAILURES[Reason.BAD_CHECKSUM]
+    cleansed = isbn_cleanse(isbn)
+    if isinstance(cleansed, bytes):
+        cleansed = cleansed.decode()
+    return Result(cleansed, None)
+
+
+@given(sampled_from(TEST_ISBNS + TEST_SBNS + list(TEST_BOOKS.values())))
+def test_check(isbn: str):
+    """Test checking valid ISBNs."""
+    result = check(isbn)
+    assert result
+    assert result.reason is None
+    assert result.isbn == isbn_cleanse(isbn)
+    assert check(isbn.encode()) == result
+
+
+@given(ISBN_TEXT)
+def test_check_matches(isbn: str):
+    """Test checking ISBNs matches validate()."""
+    assert check(isbn) == _expected(isbn)
+
+
+@given(ISBN_TEXT)
+def test_check_bytes(isbn: str):
+    """Test checking bytes ISBNs matches validate()."""
+    assert check(isbn.encode()) == _expected(isbn.encode())
+
+
+@pytest.mark.parametrize(
+    ("isbn", "reason"),
+    [
+        ("0-14-062118-X", Reason.BAD_CHECKSUM),
+        ("9770140621181", Reason.BAD_BOOKLAND),
+        ("9780140621182", Reason.BAD_CHECKSUM),
+        ("978014062118X", Reason.NON_DIGIT),
+        ("97801406211X1", Reason.NON_DIGIT),
+        ("0-14-062118-?", Reason.NON_DIGIT),
+        ("12345", Reason.BAD_LENGTH),
+        ("", Reason.NON_DIGIT),
+        (b"\xff140621180", Reason.NON_DIGIT),
+        ("٠١٤٠٦٢١١٨٠", Reason.BAD_CHECKSUM),
+    ],
+)
+def test_check_failures(isbn: str | bytes, reason: Reason):
+    """Test failures are preallocated singletons."""
+    result = check(isbn)
+    assert not result
+    assert result is FAILURES[reason]
+
+
+@pytest.mark.parametrize("isbn", ["٠٤٣٩٤٢٠٨٩X", "٠-٤٣٩-٤٢٠٨٩-x"])  # NoQA: RUF001
+def test_check_non_ascii_x(isbn: str):
+    """Test checking non-ASCII ISBN-10s with an X checksum."""
+    assert check(isbn) == _expected(isbn)
+    assert check_many([isbn]) == [Result(isbn_cleanse(isbn), None)]
+
+
+def test_check_type():
+    """Test checking non-string input."""
+    with pytest.raises(TypeError, match="ISBN must be a string"):
+        check(140621180)  # ty: ignore[invalid-argument-type]
+
+
+@given(lists(ISBN_TEXT))
+def test_check_many(isbns: list[str]):
+    """Test checking ISBNs in bulk."""
+    assert check_many(isbns) == [check(s) for s in isbns]
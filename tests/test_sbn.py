@@ -21,7 +21,7 @@ import pytest
 from hypothesis import example, given
 from hypothesis.strategies import sampled_from
 
-from pyisbn import Sbn
+from pyisbn import IsbnError, Sbn
 from tests.data import TEST_SBNS
 
 
@@ -49,3 +49,15 @@ def test_calculate_checksum(sbn: str, result: str):
 def test_convert(sbn: str):
     """Test converting an SBN."""
     assert Sbn(sbn).convert()[:-1] == "9780" + sbn[:-1]
+
+
+@given(sampled_from(TEST_SBNS))
+def test_from_int(sbn: str):
+    """Test unpacking an SBN."""
+    assert Sbn.from_int(Sbn(sbn).to_int()).isbn == "0" + sbn
+
+
+def test_from_int_no_sbn():
+    """Test unpacking an ISBN without an SBN form."""
+    with pytest.raises(IsbnError, match="no SBN form"):
+        Sbn.from_int(9783540009788)
@@ -0,0 +1,90 @@
+"""test_scan - Test memory-mapped scanning interface."""
+# Copyright © 2026-2026  James Rowe <jnrowe@gmail.com>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# This file is part of pyisbn.
+#
+# pyisbn is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# pyisbn is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# pyisbn.  If not, see <http://www.gnu.org/licenses/>.
+
+import pathlib
+
+import pytest
+from hypothesis import given
+from hypothesis.strategies import lists, sampled_from, text
+
+from pyisbn import scan as scan_mod
+from pyisbn.batch import validate_many
+from pyisbn.scan import scan, scan_file
+from tests.data import TEST_BOOKS, TEST_ISBNS, TEST_SBNS
+
+# NOTE: Depending on your typeface and editor you may notice that some of the
+# following dashes are not HYPHEN-MINUS.  They're not, and this is on purpose
+ISBN_TEXT = text(alphabet="0123456789Xx:-–— ", min_size=1, max_size=16)  # NoQA: RUF001
+
+
+@given(lists(sampled_from(TEST_ISBNS + TEST_SBNS + list(TEST_BOOKS.values()))))
+def test_scan(isbns: list[str]):
+    """Test scanning valid ISBNs."""
+    assert list(scan("\n".join(isbns).encode())) == []
+
+
+@given(lists(ISBN_TEXT))
+def test_scan_matches(isbns: list[str]):
+    """Test scanning matches validate_many()."""
+    records = [s.strip() for s in isbns]
+    expected = [
+        s.encode()
+        for s, valid in zip(records, validate_many(records), strict=True)
+        if s and not valid
+    ]
+    assert [r for _, r in scan("\n".join(isbns).encode())] == expected
+
+
+def test_scan_offsets():
+    """Test offsets of invalid records."""
+    data = b"0-14-062118-0\n\n 3540009780 \n014062118:\nbogus"
+    assert list(scan(data)) == [
+        (16, b"3540009780"),
+        (28, b"014062118:"),
+        (39, b"bogus"),
+    ]
+    for offset, record in scan(data):
+        assert data[offset : offset + len(record)] == record
+
+
+@pytest.mark.parametrize("window_size", [1, 8, 1 << 20])
+def test_scan_windows(monkeypatch: pytest.MonkeyPatch, window_size: int):
+    """Test scanning across window boundaries."""
+    monkeypatch.setattr(scan_mod, "WINDOW_SIZE", window_size)
+    data = "\n".join([*TEST_ISBNS, "bogus", *TEST_SBNS, "0-x"]).encode()
+    assert list(scan(data)) == [
+        (data.index(b"bogus"), b"bogus"),
+        (data.index(b"0-x"), b"0-x"),
+    ]
+
+
+def test_scan_file(tmp_path: pathlib.Path):
+    """Test scanning files."""
+    path = tmp_path / "isbns.txt"
+    path.write_text("\n".join([*TEST_ISBNS, "bogus", ""]), encoding="utf-8")
+    assert list(scan_file(path)) == [
+        (path.read_bytes().index(b"bogus"), b"bogus")
+    ]
+
+
+def test_scan_file_empty(tmp_path: pathlib.Path):
+    """Test scanning empty files."""
+    path = tmp_path / "empty.txt"
+    path.touch()
+    assert list(scan_file(path)) == []
@@ -0,0 +1,145 @@
+"""test_server - Test line protocol server."""
+# Copyright © 2026-2026  James Rowe <jnrowe@gmail.com>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# This file is part of pyisbn.
+#
+# pyisbn is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# pyisbn is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# pyisbn.  If not, see <http://www.gnu.org/licenses/>.
+
+import io
+import pathlib
+import socket
+import threading
+from collections.abc import Iterator
+
+import pytest
+
+from pyisbn import server
+from pyisbn.server import Client, Server, handle, serve, serve_stream
+
+
+@pytest.fixture
+def socket_path(tmp_path: pathlib.Path) -> Iterator[pathlib.Path]:
+    """Running server.
+
+    Yields:
+        Socket the server is listening on
+
+    """
+    path = tmp_path / "pyisbn.sock"
+    with Server(path) as srv:
+        thread = threading.Thread(target=srv.serve_forever, args=(0.01,))
+        thread.start()
+        yield path
+        srv.shutdown()
+        thread.join()
+    assert not path.exists()
+
+
+@pytest.mark.parametrize(
+    ("request_", "response"),
+    [
+        ("checksum 014062118", "ok 0"),
+        ("convert 0140621180", "ok 9780140621181"),
+        ("convert 0140621180 979", "ok 9790140621180"),
+        ("hyphenate 9780199564095", "ok 978-0-19-956409-5"),
+        (
+            "url 0140621180 google",
+            "ok https://books.google.com/books?vid=isbn:0140621180",
+        ),
+        ("urn 0140621180\n", "ok URN:ISBN:0140621180"),
+        ("validate 0140621181", "ok False"),
+        ("check 0140621180", "ok ISBN 0140621180"),
+        ("check 0-14-062118-0", "ok ISBN 0-14-062118-0"),
+        ("check 0140621181", "error Invalid checksum"),
+        ("validate bogus", "error non-digit parts 'bogus'"),
+        ("url 0140621180 nowhere", "error nowhere"),
+        ("urn 0140621180 extra", "error invalid arguments for urn"),
+        ("frobnicate 0140621180", "error unknown command frobnicate"),
+        ("convert", "error invalid request"),
+        ("", "error invalid request"),
+    ],
+)
+def test_handle(request_: str, response: str):
+    """Test answering requests."""
+    assert handle(request_) == response
+
+
+def test_serve_stream():
+    """Test answering requests from streams."""
+    output = io.StringIO()
+    serve_stream(io.StringIO("urn 0140621180\nbogus\n"), output)
+    assert output.getvalue() == (
+        "ok URN:ISBN:0140621180\nerror unknown command bogus\n"
+    )
+
+
+def test_client(socket_path: pathlib.Path):
+    """Test making requests."""
+    with Client(socket_path) as client:
+        assert client.request("convert", "0140621180") == "9780140621181"
+        with pytest.raises(ValueError, match="non-digit parts"):
+            client.request("validate", "bogus")
+
+
+@pytest.mark.parametrize("window", [1, 2, 256])
+def test_pipeline(
+    monkeypatch: pytest.MonkeyPatch, socket_path: pathlib.Path, window: int
+):
+    """Test pipelining requests."""
+    monkeypatch.setattr(server, "WINDOW", window)
+    requests = [("urn", "0140621180"), ("validate", "bogus")] * 3
+    with Client(socket_path) as client:
+        assert (
+            list(client.pipeline(requests))
+            == [
+                (True, "URN:ISBN:0140621180"),
+                (False, "non-digit parts 'bogus'"),
+            ]
+            * 3
+        )
+
+
+def test_pipeline_abandoned(socket_path: pathlib.Path):
+    """Test abandoning pipelined results part way through."""
+    with Client(socket_path) as client:
+        results = client.pipeline([("urn", "0140621180")] * 10)
+        assert next(results) == (True, "URN:ISBN:0140621180")
+        results.close()
+        assert client.request("checksum", "014062118") == "0"
+
+
+def test_connection_closed(tmp_path: pathlib.Path):
+    """Test server closing connections."""
+    path = tmp_path / "pyisbn.sock"
+    with Server(path) as srv, Client(path) as client:
+        request, _ = srv.get_request()
+        request.shutdown(socket.SHUT_WR)
+        with pytest.raises(ConnectionError, match="closed connection"):
+            client.request("urn", "0140621180")
+        request.close()
+
+
+def test_serve(monkeypatch: pytest.MonkeyPatch, tmp_path: pathlib.Path):
+    """Test serving until interrupted."""
+
+    def interrupt(_self: Server) -> None:
+        assert path.exists()
+        raise KeyboardInterrupt
+
+    path = tmp_path / "pyisbn.sock"
+    monkeypatch.setattr(Server, "serve_forever", interrupt)
+    with pytest.raises(KeyboardInterrupt):
+        serve(path)
+    assert not path.exists()
@@ -0,0 +1,171 @@
+"""test_tool - Test command line tool."""
+# Copyright © 2026-2026  James Rowe <jnrowe@gmail.com>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# This file is part of pyisbn.
+#
+# pyisbn is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# pyisbn is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# pyisbn.  If not, see <http://www.gnu.org/licenses/>.
+
+import pathlib
+import subprocess  # NoQA: S404
+import sys
+import threading
+from collections.abc import Iterator
+
+import pytest
+
+from pyisbn.server import Server
+
+TOOL = pathlib.Path(__file__).parent.parent / "extra" / "tool.py"
+
+#: Exit status for command line usage errors
+USAGE_STATUS = 2
+
+
+def _run(*args: str, stdin: str = "") -> subprocess.CompletedProcess[str]:
+    """Run the command line tool.
+
+    Args:
+        args: Arguments for the tool
+        stdin: Input for the tool
+
+    Returns:
+        Completed process, with captured output
+
+    """
+    return subprocess.run(  # NoQA: S603
+        [sys.executable, str(TOOL), *args],
+        capture_output=True,
+        check=False,
+        input=stdin,
+        text=True,
+    )
+
+
+@pytest.fixture
+def socket_path(tmp_path: pathlib.Path) -> Iterator[pathlib.Path]:
+    """Running server.
+
+    Yields:
+        Socket the server is listening on
+
+    """
+    path = tmp_path / "pyisbn.sock"
+    with Server(path) as srv:
+        thread = threading.Thread(target=srv.serve_forever, args=(0.01,))
+        thread.start()
+        yield path
+        srv.shutdown()
+        thread.join()
+
+
+@pytest.mark.parametrize(
+    "stdin",
+    [
+        "0199564094\n",
+        "0199564095\n",
+        "bogus\n",
+        "0199564094\n0199564095\n\nbogus\n978-0-19-956409-5\n",
+    ],
+)
+def test_connect(socket_path: pathlib.Path, stdin: str):
+    """Test server results match local results."""
+    local = _run("-s", stdin=stdin)
+    remote = _run("--connect", str(socket_path), "-s", stdin=stdin)
+    assert (remote.stdout, remote.stderr, remote.returncode) == (
+        local.stdout,
+        local.stderr,
+        local.returncode,
+    )
+
+
+def test_arguments():
+    """Test errors are reported for each ISBN argument."""
+    proc = _run("-y", "9790000000001", "0199564094", "bogus")
+    assert proc.stdout == "0-19-956409-4\n"
+    assert proc.stderr.splitlines() == [
+        "argument:1: undefined registration group",
+        "argument:3: non-digit parts 'bogus'",
+    ]
+    assert proc.returncode == 1
+
+
+def test_connect_arguments(socket_path: pathlib.Path):
+    """Test server results for ISBN arguments match local results."""
+    args = ("0199564094", "0199564095", "bogus")
+    local = _run(*args)
+    remote = _run("--connect", str(socket_path), *args)
+    assert (remote.stdout, remote.stderr, remote.returncode) == (
+        local.stdout,
+        local.stderr,
+        local.returncode,
+    )
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_input_unreadable(tmp_path: pathlib.Path, jobs: str):
+    """Test unreadable input files are reported, and processing continues."""
+    good = tmp_path / "good.txt"
+    good.write_text("0199564094\n")
+    missing = tmp_path / "missing.txt"
+    proc = _run("-j", jobs, "-i", str(missing), "-i", str(good))
+    assert proc.stdout == "ISBN 0199564094\n"
+    assert proc.stderr == f"{missing}: No such file or directory\n"
+    assert proc.returncode == 1
+
+
+def test_input_undecodable(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+):
+    """Test undecodable stdin is handled like undecodable files."""
+    data = b"\xff0199564094\n0199564094\n"
+    path = tmp_path / "isbns.txt"
+    path.write_bytes(data)
+    monkeypatch.setenv("PYTHONIOENCODING", "utf-8")
+    proc = subprocess.run(  # NoQA: S603
+        [sys.executable, str(TOOL), "-s"],
+        capture_output=True,
+        check=False,
+        input=data,
+    )
+    assert proc.stdout.decode() == "ISBN 0199564094\n"
+    assert proc.stderr.decode() == "-:1: non-digit parts '\ufffd0199564094'\n"
+    assert proc.returncode == 1
+    from_file = _run("-s", "-i", str(path))
+    assert from_file.stdout == proc.stdout.decode()
+
+
+def test_jobs(tmp_path: pathlib.Path):
+    """Test parallel results match serial results."""
+    path = tmp_path / "isbns.txt"
+    path.write_bytes(b"bad\x0c1\n0199564094\r\nbad2\n")
+    serial = _run("-i", str(path))
+    parallel = _run("-j", "2", "-i", str(path))
+    assert serial.stderr.splitlines() == [
+        f"{path}:1: non-digit parts 'bad\\x0c1'",
+        f"{path}:3: non-digit parts 'bad2'",
+    ]
+    assert (parallel.stdout, parallel.stderr, parallel.returncode) == (
+        serial.stdout,
+        serial.stderr,
+        serial.returncode,
+    )
+
+
+@pytest.mark.parametrize("jobs", ["-1", "many"])
+def test_jobs_invalid(jobs: str):
+    """Test invalid numbers of jobs are rejected."""
+    proc = _run("-j", jobs, "0199564094")
+    assert "must be a non-negative integer" in proc.stderr
+    assert proc.returncode == USAGE_STATUS
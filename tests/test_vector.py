@@ -0,0 +1,116 @@
+"""test_vector - Test vectorised interface."""
+# Copyright © 2026-2026  James Rowe <jnrowe@gmail.com>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# This file is part of pyisbn.
+#
+# pyisbn is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# pyisbn is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# pyisbn.  If not, see <http://www.gnu.org/licenses/>.
+
+from collections.abc import Callable
+
+import pytest
+from hypothesis import given
+from hypothesis.strategies import lists, sampled_from, text
+
+from pyisbn import IsbnError, calculate_checksum, convert, validate
+from tests.data import TEST_BOOKS, TEST_ISBNS, TEST_SBNS
+
+np = pytest.importorskip("numpy")
+vector = pytest.importorskip("pyisbn.vector")
+
+# NOTE: Depending on your typeface and editor you may notice that some of the
+# following dashes are not HYPHEN-MINUS.  They're not, and this is on purpose
+ISBN_TEXT = text(alphabet="0123456789Xx-–", max_size=16)  # NoQA: RUF001
+
+
+def _call(func: Callable[[str], str | bool], isbn: str) -> str | bool:
+    try:
+        return func(isbn)
+    except IsbnError:
+        return False
+
+
+@given(lists(sampled_from(TEST_ISBNS + list(TEST_BOOKS.values()))))
+def test_validate(isbns: list[str]):
+    """Test validating ISBN columns."""
+    assert vector.validate(np.array(isbns, dtype="S")).all()
+
+
+@given(lists(ISBN_TEXT))
+def test_validate_matches(isbns: list[str]):
+    """Test validating ISBN columns matches validate()."""
+    assert vector.validate(isbns).tolist() == [
+        _call(validate, s) for s in isbns
+    ]
+
+
+@given(lists(sampled_from(TEST_ISBNS + TEST_SBNS)))
+def test_calculate_checksum(isbns: list[str]):
+    """Test calculating checksums for ISBN columns."""
+    result = vector.calculate_checksum(
+        np.array([s[:-1] for s in isbns], dtype="S13")
+    )
+    assert result.tolist() == [s[-1].encode() for s in isbns]
+
+
+@given(lists(ISBN_TEXT))
+def test_calculate_checksum_matches(isbns: list[str]):
+    """Test calculating checksums matches calculate_checksum()."""
+    assert vector.calculate_checksum(isbns).tolist() == [
+        (_call(calculate_checksum, s) or "").encode() for s in isbns
+    ]
+
+
+@given(lists(sampled_from(TEST_ISBNS + TEST_SBNS)))
+def test_convert(isbns: list[str]):
+    """Test converting ISBN columns."""
+    result = vector.convert(vector.convert(np.array(isbns, dtype="S13")))
+    assert result.tolist() == [convert(convert(s)).encode() for s in isbns]
+
+
+@given(lists(ISBN_TEXT))
+def test_convert_matches(isbns: list[str]):
+    """Test converting ISBN columns matches convert()."""
+    assert vector.convert(isbns).tolist() == [
+        (_call(convert, s) or "").encode() for s in isbns
+    ]
+
+
+def test_convert_code():
+    """Test converting ISBN columns with an alternative Bookland code."""
+    assert vector.convert(["3540009787"], "979").tolist() == [
+        convert("3540009787", "979").encode()
+    ]
+
+
+@pytest.mark.parametrize("code", ["123", "97", "97x"])
+def test_convert_invalid_code(code: str):
+    """Test converting ISBN columns with an invalid Bookland code."""
+    with pytest.raises(IsbnError) as expected:
+        convert("3540009787", code)
+    with pytest.raises(IsbnError, match=str(expected.value)):
+        vector.convert(["3540009787"], code)
+
+
+@pytest.mark.parametrize("code", ["", "9-78"])
+def test_convert_unusual_code(code: str):
+    """Test codes that aren't a plain Bookland code are rejected."""
+    with pytest.raises(IsbnError, match="invalid Bookland region"):
+        vector.convert(["3540009787"], code)
+
+
+def test_unicode_dashes():
+    """Test byte columns containing unicode dashes."""
+    isbns = np.array(["978―0199564095".encode()])
+    assert vector.validate(isbns).tolist() == [True]